@@ -3,47 +3,164 @@ Simulador de Armado de Computadoras - TDS115 Equipo A
 Aplicación educativa para aprender sobre componentes de computadoras
 """
 
+import time
+
+STARTED_AT = time.perf_counter()  # Referencia de --startup-report (antes de cualquier importación)
+
+import argparse
+import json
+import os
+import sys
+
 import pygame
-from screens.selection_screen import SelectionScreen
-from screens.start_screen import StartScreen
-from screens.simulation_screen import EstanteScreen
-from screens.worktable_screen import WorktableScreen, WorktableDesktopScreen, LaptopExternalConnectionScreen, DesktopExternalConnectionScreen, LaptopBootScreen, DesktopBootScreen
+from screens.screen_manager import ScreenManager
+from model.component_set import ComponentSet
+from utils.assets import IMAGE_CACHE, preload_images
+from utils.asset_manifest import get_manifest
+from utils.asset_pack import open_asset_pack, pack_contents
+from utils.headless import RunReport, ScriptedInput, enable_dummy_video, load_script
+from utils import input_source
+from utils.input_source import set_input_source
+from utils.log import DEFAULT_LEVEL, LEVEL_NAMES, configure_logging, get_logger, stop_logging
+from utils.profiler import PROFILER
+
+IMPORTS_DONE_AT = time.perf_counter()
+
+# Las pantallas de arrastrar y soltar solo actualizan las regiones que cambian
+DIRTY_RECT_RENDERING = True
+
+# Máximo de pantallas que se mantienen en memoria para reingresar al instante
+MAX_WARM_SCREENS = 8
+# Presupuesto para las superficies que cachean las pantallas tibias (tarjetas, capas de fondo);
+# al cambiar de pantalla se desalojan las menos usadas hasta entrar en él
+MAX_WARM_SCREEN_BYTES = 8 * 1024 * 1024
+
+# Cada módulo de pantalla (y sus fuentes e imágenes) se carga al entrar por primera vez
+SCREENS = {
+    "StartScreen": "screens.start_screen:StartScreen",
+    "SelectionScreen": "screens.selection_screen:SelectionScreen",
+    "EstanteScreen": "screens.simulation_screen:EstanteScreen",
+    "WorktableScreen": "screens.worktable_screen:WorktableScreen",
+    "WorktableDesktopScreen": "screens.worktable_screen:WorktableDesktopScreen",
+    "LaptopExternalConnectionScreen": "screens.worktable_screen:LaptopExternalConnectionScreen",
+    "DesktopExternalConnectionScreen": "screens.worktable_screen:DesktopExternalConnectionScreen",
+    "LaptopBootScreen": "screens.worktable_screen:LaptopBootScreen",
+    "DesktopBootScreen": "screens.worktable_screen:DesktopBootScreen",
+}
+
+# Guion de --startup-report: dibuja el primer frame de la pantalla de inicio y sale
+STARTUP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "scripts", "startup.json")
+
+logger = get_logger("main")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de Armado de Computadoras - TDS115")
+    parser.add_argument("--headless", metavar="GUION",
+                        help="ejecuta sin ventana con un guion de eventos JSON y reporta FPS por pantalla")
+    parser.add_argument("--report", metavar="ARCHIVO",
+                        help="guarda el reporte del modo headless en JSON")
+    parser.add_argument("--profile", metavar="ARCHIVO",
+                        help="mide cada fase de dibujo y guarda los percentiles en JSON al salir (F3 muestra el HUD)")
+    parser.add_argument("--log-level", default=DEFAULT_LEVEL, choices=LEVEL_NAMES, type=str.upper,
+                        help=f"nivel mínimo de los mensajes (por defecto {DEFAULT_LEVEL}: nada durante los frames)")
+    parser.add_argument("--log-file", metavar="ARCHIVO",
+                        help="además de la consola, escribe los mensajes en este archivo")
+    parser.add_argument("--startup-report", metavar="ARCHIVO",
+                        help="mide importaciones y tiempo hasta el primer frame, guarda el resultado en JSON y sale")
+    return parser.parse_args(argv)
+
+def write_startup_report(path, pygame_ready_at, window_ready_at):
+    """Guarda en JSON los tiempos de arranque (ms desde el inicio de main.py)"""
+    def since_start(moment):
+        return round((moment - STARTED_AT) * 1000.0, 3) if moment is not None else None
+
+    first_frame_at = input_source.first_frame_at
+    data = {
+        "imports_ms": since_start(IMPORTS_DONE_AT),
+        "pygame_init_ms": since_start(pygame_ready_at),
+        "window_ms": since_start(window_ready_at),
+        "first_frame_ms": since_start(first_frame_at),
+        # Reloj de pared del primer frame: permite sumar el arranque del intérprete desde afuera
+        "first_frame_wall_time": time.time() - (time.perf_counter() - first_frame_at) if first_frame_at else None,
+        "modules_loaded": len(sys.modules),
+    }
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(data, report_file, indent=2)
 
-def main():
+def main(argv=None):
     """Función principal que maneja el flujo de la aplicación"""
+    args = parse_args(argv)
+    configure_logging(args.log_level, args.log_file)
+    if args.headless:
+        enable_dummy_video()
+    if args.profile:
+        PROFILER.enable()
+
     # Inicializar Pygame
     pygame.init()
+    pygame_ready_at = time.perf_counter()
     
     # Configurar ventana principal
     screen = pygame.display.set_mode((970, 810))
     pygame.display.set_caption("Simulador de Computadoras - TDS115")
+    window_ready_at = time.perf_counter()
+    screen_manager = ScreenManager(screen, max_instances=MAX_WARM_SCREENS, max_cached_bytes=MAX_WARM_SCREEN_BYTES)
+
+    # Resolver todas las imágenes una sola vez y avisar de las faltantes en un solo reporte
+    manifest = get_manifest()
+    missing_report = manifest.missing_report()
+    if missing_report:
+        logger.warning(missing_report)
+
+    # Tamaños preescalados desde el paquete binario (si existe y está al día)
+    IMAGE_CACHE.attach_pack(open_asset_pack())
+
+    # Decodificar las imágenes en segundo plano mientras se muestra la pantalla de inicio;
+    # al adoptarlas solo se arman los tamaños que usan las pantallas (los mismos del paquete)
+    screen_sizes = pack_contents()
+    preload_images([entry.path for entry in manifest if entry.exists],
+                   sizes={entry.path: screen_sizes.get(entry.name) for entry in manifest if entry.exists})
     
     current_screen = "start"  # Restaurar el flujo normal con la pantalla de inicio
     selected_computer_type = None
-    final_selected_components = []
-    external_components = []  # Para guardar componentes externos separadamente
+    # Selecciones como ComponentSet (máscara de bits sobre el catálogo)
+    final_selected_components = ComponentSet()
+    external_components = ComponentSet()  # Para guardar componentes externos separadamente
+
+    # Tiempos por pantalla (se reportan en modo headless)
+    report = RunReport()
+    scripted_input = None
+    if args.headless or args.startup_report:
+        scripted_input = ScriptedInput(load_script(args.headless or STARTUP_SCRIPT))
+        set_input_source(scripted_input)
 
     while current_screen != "quit":
+        report.end()
+        freed = screen_manager.enforce_budget()
+        if freed:
+            logger.debug("Pantallas tibias desalojadas: %d bytes liberados (%s)", freed, screen_manager.stats())
+        report.begin(current_screen)
         if current_screen == "start":
-            start_screen = StartScreen(screen)
+            start_screen = screen_manager.get(SCREENS["StartScreen"])
             if not start_screen.run():
                 current_screen = "quit"
             else:
                 current_screen = "selection"
         
         elif current_screen == "selection":
-            selection_screen = SelectionScreen(screen)
+            selection_screen = screen_manager.get(SCREENS["SelectionScreen"])
             selected_computer_type = selection_screen.run()
             if not selected_computer_type or selected_computer_type == "exit":
                 current_screen = "quit"
             else:
-                print(f"Tipo seleccionado: {selected_computer_type}")
+                logger.info("Tipo seleccionado: %s", selected_computer_type)
                 current_screen = "estante"
-                final_selected_components = []
+                final_selected_components = ComponentSet()
         
         elif current_screen == "estante":
             # Pasar las selecciones previas si existen (cuando se regresa de la mesa de trabajo)
-            estante_screen = EstanteScreen(screen, selected_computer_type, final_selected_components if final_selected_components else None)
+            estante_screen = screen_manager.get(SCREENS["EstanteScreen"], selected_computer_type, final_selected_components if final_selected_components else None,
+                                                computer_type=selected_computer_type)
             estante_result = estante_screen.run_logic()
 
             if estante_result["action"] == "quit":
@@ -51,46 +168,25 @@ def main():
             elif estante_result["action"] == "back_to_selection":
                 current_screen = "selection"
             elif estante_result["action"] == "proceed_to_worktable":
-                all_selected_components = estante_result.get("selected_components", [])
-                print(f"=== DEBUG: Processing components ===")
-                print(f"All selected components: {all_selected_components}")
+                all_selected_components = ComponentSet(estante_result.get("selected_components", ()))
+                logger.debug("Componentes seleccionados: %s", all_selected_components)
                 
                 # Separar componentes internos y externos
-                internal_components = []
-                selected_external_components = []
-                
-                # Lista de componentes externos conocidos
-                external_component_names = [
-                    "Monitor LED 24\"", "Teclado Mecanico", "Mouse Razen", 
-                    "Bocinas Estereo", "Webcam HD 1080p", "Microfono USB", 
-                    "UPS", "HUB USB"
-                ]
-                print(f"Known external components: {external_component_names}")
-                
-                for component in all_selected_components:
-                    print(f"Processing component: '{component}'")
-                    if component in external_component_names:
-                        selected_external_components.append(component)
-                        print(f"  -> Classified as EXTERNAL")
-                    else:
-                        internal_components.append(component)
-                        print(f"  -> Classified as INTERNAL")
-                
-                final_selected_components = internal_components
-                external_components = selected_external_components
-                print(f"Final internal components: {internal_components}")
-                print(f"Final external components: {external_components}")
-                print(f"=== End component processing ===")
+                final_selected_components = all_selected_components.internal()
+                external_components = all_selected_components.external()
+                logger.debug("Internos: %s; externos: %s", final_selected_components, external_components)
                 current_screen = "worktable"
             else:
                 current_screen = "selection"
 
         elif current_screen == "worktable":
             if selected_computer_type == "laptop":
-                worktable = WorktableScreen(screen, selected_computer_type, final_selected_components)
+                worktable = screen_manager.get(SCREENS["WorktableScreen"], selected_computer_type, final_selected_components,
+                                               computer_type=selected_computer_type, dirty_rects=DIRTY_RECT_RENDERING)
                 worktable_action = worktable.run()
             elif selected_computer_type == "desktop":
-                worktable = WorktableDesktopScreen(screen, selected_computer_type, final_selected_components)
+                worktable = screen_manager.get(SCREENS["WorktableDesktopScreen"], selected_computer_type, final_selected_components,
+                                               computer_type=selected_computer_type, dirty_rects=DIRTY_RECT_RENDERING)
                 worktable_action = worktable.run()
             else:
                 # Fallback en caso de tipo no reconocido
@@ -102,33 +198,30 @@ def main():
                 current_screen = "quit"
             elif worktable_action["action"] == "back_to_selection":
                 # Regresar a la pantalla de componentes con las selecciones preservadas
-                final_selected_components = worktable_action.get("selected_components", [])
+                final_selected_components = ComponentSet(worktable_action.get("selected_components", ()))
                 current_screen = "estante"
             elif worktable_action["action"] == "assembly_complete":
-                print("=== DEBUG: Assembly complete ===")
-                print(f"Computer type: {selected_computer_type}")
-                print(f"External components list: {external_components}")
-                print(f"External components count: {len(external_components)}")
-                print(f"Has external components? {bool(external_components)}")
+                logger.debug("Ensamble interno completo (%s); externos pendientes: %s",
+                             selected_computer_type, external_components)
                 
                 if external_components:
                     # Si hay componentes externos, ir a pantalla de conexión externa (laptop o desktop)
-                    print("DEBUG: Going to external_connection screen")
                     current_screen = "external_connection"
                 else:
                     # Sin componentes externos, terminar
-                    print("DEBUG: Going back to selection (no external components)")
                     current_screen = "selection"
             else:
                 current_screen = "selection"
 
         elif current_screen == "external_connection":
             # Pantalla de conexión de componentes externos (laptop o desktop)
-            print("Iniciando pantalla de conexión externa...")
+            logger.info("Iniciando pantalla de conexión externa")
             if selected_computer_type == "laptop":
-                external_screen = LaptopExternalConnectionScreen(screen, selected_computer_type, external_components)
+                external_screen = screen_manager.get(SCREENS["LaptopExternalConnectionScreen"], selected_computer_type, external_components,
+                                                     computer_type=selected_computer_type, dirty_rects=DIRTY_RECT_RENDERING)
             elif selected_computer_type == "desktop":
-                external_screen = DesktopExternalConnectionScreen(screen, selected_computer_type, external_components)
+                external_screen = screen_manager.get(SCREENS["DesktopExternalConnectionScreen"], selected_computer_type, external_components,
+                                                     computer_type=selected_computer_type, dirty_rects=DIRTY_RECT_RENDERING)
             else:
                 # Fallback en caso de tipo no reconocido
                 current_screen = "selection"
@@ -149,19 +242,19 @@ def main():
                     current_screen = "desktop_boot"
                 else:
                     # Fallback
-                    print("¡Ensamble completo!")
+                    logger.info("¡Ensamble completo!")
                     current_screen = "selection"
             elif external_action["action"] == "assembly_complete":
                 # Ensamble completado totalmente
-                print("¡Ensamble completo!")
+                logger.info("¡Ensamble completo!")
                 current_screen = "selection"
             else:
                 current_screen = "selection"
         
         elif current_screen == "laptop_boot":
             # Pantalla de encendido de laptop
-            print("Iniciando pantalla de encendido de laptop...")
-            boot_screen = LaptopBootScreen(screen, final_selected_components)
+            logger.info("Iniciando pantalla de encendido de laptop")
+            boot_screen = screen_manager.get(SCREENS["LaptopBootScreen"], final_selected_components)
             boot_action = boot_screen.run()
             
             if boot_action["action"] == "quit":
@@ -173,8 +266,8 @@ def main():
         
         elif current_screen == "desktop_boot":
             # Pantalla de encendido de desktop
-            print("Iniciando pantalla de encendido de desktop...")
-            boot_screen = DesktopBootScreen(screen, final_selected_components)
+            logger.info("Iniciando pantalla de encendido de desktop")
+            boot_screen = screen_manager.get(SCREENS["DesktopBootScreen"], final_selected_components)
             boot_action = boot_screen.run()
             
             if boot_action["action"] == "quit":
@@ -184,8 +277,33 @@ def main():
             else:
                 current_screen = "selection"
     
+    report.end()
+    
     # Limpiar recursos de Pygame
+    IMAGE_CACHE.shutdown()
     pygame.quit()
+    stop_logging()
+
+    if args.profile:
+        PROFILER.dump(args.profile)
+
+    if args.startup_report:
+        write_startup_report(args.startup_report, pygame_ready_at, window_ready_at)
+        if not args.headless:
+            return 0
+
+    if scripted_input is not None:
+        print(report.format())
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as report_file:
+                json.dump(dict(report.as_dict(), script=args.headless,
+                               script_completed=scripted_input.finished,
+                               aborted_waiting_for=scripted_input.aborted_on),
+                          report_file, indent=2)
+        if scripted_input.aborted_on:
+            print(f"El guion esperaba la pantalla '{scripted_input.aborted_on}' y nunca apareció")
+            return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
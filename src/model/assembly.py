@@ -0,0 +1,156 @@
+"""
+Ocupación de slots de una mesa de trabajo, sin pygame.
+Cada slot acepta un solo componente (por id) y contiene a lo sumo uno.
+Las pantallas de ensamble y de conexión externa solo dibujan este estado:
+DropSlot y MiniCardComponent leen de aquí si están ocupados o colocados.
+Cada cambio (colocar, quitar, reiniciar) actualiza contadores y avisa a los
+suscriptores, así que el progreso y "¿está completo?" cuestan O(1) y la
+interfaz solo se recalcula cuando algo cambió.
+"""
+
+# Tipos de cambio que reciben los suscriptores
+PLACED = "placed"
+REMOVED = "removed"
+RESET = "reset"
+
+
+class PlacementChange:
+    """Aviso de cambio: qué pasó y el progreso resultante"""
+
+    __slots__ = ("kind", "component_id", "slot_id", "placed", "total")
+
+    def __init__(self, kind, component_id, slot_id, placed, total):
+        self.kind = kind
+        self.component_id = component_id
+        self.slot_id = slot_id
+        self.placed = placed
+        self.total = total
+
+    def __repr__(self):
+        return f"PlacementChange({self.kind!r}, {self.component_id!r}, {self.slot_id!r}, {self.placed}/{self.total})"
+
+
+class SlotBoard:
+    """Slots, componentes por colocar y quién ocupa cada slot"""
+
+    def __init__(self, slots=None, component_ids=()):
+        self._accepts = dict(slots or {})  # slot -> id de componente que acepta
+        self._occupant = {}                # slot -> id de componente colocado
+        self._slot_of = {}                 # id de componente -> slot
+        self._components = list(component_ids)
+        self._members = frozenset(self._components)
+        self._pending = set(self._components)  # Componentes a colocar que todavía no están en su slot
+        self._placed_count = 0
+        self.version = 0                   # Aumenta con cada cambio (clave de caché para la interfaz)
+        self._listeners = []
+
+    def add_slot(self, slot_id, accepted_component_id):
+        self._accepts[slot_id] = accepted_component_id
+
+    def set_components(self, component_ids):
+        """Reemplaza los componentes a colocar y vacía todos los slots"""
+        self._components = list(component_ids)
+        self._members = frozenset(self._components)
+        self.clear()
+
+    def clear(self):
+        """Vacía los slots (los componentes vuelven a quedar sin colocar)"""
+        self._occupant.clear()
+        self._slot_of.clear()
+        self._pending = set(self._components)
+        self._placed_count = 0
+        self._notify(RESET, None, None)
+
+    # Suscripciones
+    def subscribe(self, listener):
+        """listener(change) se llama después de cada cambio con un PlacementChange"""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, kind, component_id, slot_id):
+        self.version += 1
+        if self._listeners:
+            change = PlacementChange(kind, component_id, slot_id, self._placed_count, len(self._components))
+            for listener in list(self._listeners):
+                listener(change)
+
+    # Consultas
+    @property
+    def components(self):
+        return list(self._components)
+
+    def accepts(self, slot_id):
+        return self._accepts.get(slot_id)
+
+    def occupant(self, slot_id):
+        return self._occupant.get(slot_id)
+
+    def is_occupied(self, slot_id):
+        return slot_id in self._occupant
+
+    def slot_of(self, component_id):
+        return self._slot_of.get(component_id)
+
+    def is_placed(self, component_id):
+        return component_id in self._slot_of
+
+    def can_place(self, component_id, slot_id):
+        """El slot existe, acepta ese componente y está libre"""
+        return (self._accepts.get(slot_id) == component_id
+                and slot_id not in self._occupant
+                and component_id not in self._slot_of)
+
+    @property
+    def total(self):
+        return len(self._components)
+
+    @property
+    def placed(self):
+        """Cuántos de los componentes a colocar están en su slot"""
+        return self._placed_count
+
+    @property
+    def remaining(self):
+        """Cuántos componentes faltan por colocar"""
+        return len(self._components) - self._placed_count
+
+    def remaining_components(self):
+        """Componentes que todavía no están en su slot, en el orden de la sidebar"""
+        return [component_id for component_id in self._components if component_id in self._pending]
+
+    @property
+    def progress_fraction(self):
+        """Fracción colocada, de 0.0 a 1.0 (1.0 si no hay nada que colocar)"""
+        return self._placed_count / len(self._components) if self._components else 1.0
+
+    @property
+    def is_complete(self):
+        """True si todos los componentes están colocados (o no hay ninguno)"""
+        return self._placed_count == len(self._components)
+
+    # Cambios
+    def place(self, component_id, slot_id):
+        """Coloca el componente; devuelve False si el slot no lo acepta o está ocupado"""
+        if not self.can_place(component_id, slot_id):
+            return False
+        self._occupant[slot_id] = component_id
+        self._slot_of[component_id] = slot_id
+        if component_id in self._pending:
+            self._pending.discard(component_id)
+            self._placed_count += 1
+        self._notify(PLACED, component_id, slot_id)
+        return True
+
+    def remove(self, component_id):
+        """Saca el componente de su slot; devuelve el slot que ocupaba o None"""
+        slot_id = self._slot_of.pop(component_id, None)
+        if slot_id is not None:
+            del self._occupant[slot_id]
+            if component_id in self._members:
+                self._pending.add(component_id)
+                self._placed_count -= 1
+            self._notify(REMOVED, component_id, slot_id)
+        return slot_id
@@ -0,0 +1,183 @@
+"""
+Catálogo de componentes del simulador.
+Toda la información de los componentes (id, nombre, imagen, categoría,
+slot y tipos de computadora) vive en data/components.json; este módulo
+la carga una sola vez y construye índices para consultas en tiempo
+constante. Agregar componentes nuevos es solo un cambio de datos.
+"""
+
+import json
+import os
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "components.json")
+
+# Categorías que se muestran en el estante interno; el resto son periféricos
+INTERNAL_CATEGORIES = ("common", "desktop")
+EXTERNAL_CATEGORY = "external"
+
+
+class Component:
+    """Entrada inmutable del catálogo"""
+
+    __slots__ = ("id", "name", "image", "category", "slot",
+                 "computer_types", "required_for", "mandatory_for")
+
+    def __init__(self, id, name, image, category, slot=None,
+                 computer_types=(), required_for=(), mandatory_for=()):
+        self.id = id
+        self.name = name
+        self.image = image
+        self.category = category
+        self.slot = slot
+        self.computer_types = frozenset(computer_types)
+        self.required_for = frozenset(required_for)
+        self.mandatory_for = frozenset(mandatory_for)
+
+    @property
+    def is_external(self):
+        return self.category == EXTERNAL_CATEGORY
+
+    def __repr__(self):
+        return f"Component({self.id!r}, {self.name!r})"
+
+
+class Catalog:
+    """Componentes indexados por nombre, id, slot, categoría y tipo de computadora"""
+
+    def __init__(self, components):
+        self.components = tuple(components)  # Orden del archivo de datos
+        self._by_name = {}
+        self._by_id = {}
+        self._by_slot = {}
+        self._by_category = {}
+        self._by_computer_type = {}
+        self._required = {}
+        self._mandatory = {}
+        for component in self.components:
+            if component.name in self._by_name:
+                raise ValueError(f"Nombre de componente duplicado: {component.name}")
+            if component.id in self._by_id:
+                raise ValueError(f"Id de componente duplicado: {component.id}")
+            self._by_name[component.name] = component
+            self._by_id[component.id] = component
+            if component.slot is not None:
+                self._by_slot[component.slot] = component
+            self._by_category.setdefault(component.category, []).append(component)
+            for computer_type in component.computer_types:
+                self._by_computer_type.setdefault(computer_type, []).append(component)
+            for computer_type in component.required_for:
+                self._required.setdefault(computer_type, []).append(component)
+            for computer_type in component.mandatory_for:
+                self._mandatory.setdefault(computer_type, []).append(component)
+        self._required_names = {computer_type: frozenset(c.name for c in components)
+                                for computer_type, components in self._required.items()}
+        # Un bit por componente, en el orden del archivo (base de model.component_set)
+        self._bits = {component.name: 1 << index for index, component in enumerate(self.components)}
+        self._external_mask = self.mask(c.name for c in self.components if c.is_external)
+        self._required_masks = {computer_type: self.mask(c.name for c in components)
+                                for computer_type, components in self._required.items()}
+
+    def __len__(self):
+        return len(self.components)
+
+    def __iter__(self):
+        return iter(self.components)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    # Búsquedas puntuales
+    def by_name(self, name):
+        return self._by_name.get(name)
+
+    def by_id(self, component_id):
+        return self._by_id.get(component_id)
+
+    def by_slot(self, slot_id):
+        return self._by_slot.get(slot_id)
+
+    # Listas (en el orden del archivo de datos)
+    def in_category(self, category):
+        return list(self._by_category.get(category, ()))
+
+    def for_computer_type(self, computer_type, internal=None):
+        """Componentes disponibles para un tipo de computadora.
+
+        internal=True/False filtra entre internos y externos.
+        """
+        components = self._by_computer_type.get(computer_type, ())
+        if internal is None:
+            return list(components)
+        return [c for c in components if c.is_external != internal]
+
+    def slotted_for(self, computer_type, internal=True):
+        """Componentes que se colocan en un slot de la mesa de trabajo"""
+        return [c for c in self.for_computer_type(computer_type, internal) if c.slot is not None]
+
+    def required_for(self, computer_type):
+        """Componentes necesarios para que la computadora encienda"""
+        return list(self._required.get(computer_type, ()))
+
+    def mandatory_for(self, computer_type):
+        """Componentes que se seleccionan siempre (p. ej. la tarjeta madre en desktop)"""
+        return list(self._mandatory.get(computer_type, ()))
+
+    # Predicados por nombre
+    def is_external(self, name):
+        component = self._by_name.get(name)
+        return component is not None and component.is_external
+
+    def is_mandatory(self, name, computer_type):
+        component = self._by_name.get(name)
+        return component is not None and computer_type in component.mandatory_for
+
+    def is_available(self, name, computer_type):
+        component = self._by_name.get(name)
+        return component is not None and computer_type in component.computer_types
+
+    # Máscaras de bits
+    def bit(self, name):
+        """Bit del componente (0 si no está en el catálogo)"""
+        return self._bits.get(name, 0)
+
+    def mask(self, names):
+        """OR de los bits de `names`; ValueError si alguno no está en el catálogo"""
+        bits = 0
+        for name in names:
+            bit = self._bits.get(name)
+            if bit is None:
+                raise ValueError(f"Componente desconocido: {name}")
+            bits |= bit
+        return bits
+
+    def name_at(self, index):
+        return self.components[index].name
+
+    @property
+    def external_mask(self):
+        return self._external_mask
+
+    def required_mask(self, computer_type):
+        return self._required_masks.get(computer_type, 0)
+
+    def has_required(self, names, computer_type):
+        """True si `names` incluye todos los componentes requeridos del tipo"""
+        return self._required_names.get(computer_type, frozenset()).issubset(names)
+
+
+def load_catalog(path=DEFAULT_CATALOG_PATH):
+    """Lee el archivo de datos y construye el catálogo"""
+    with open(path, encoding="utf-8") as data_file:
+        data = json.load(data_file)
+    return Catalog(Component(**entry) for entry in data["components"])
+
+
+_catalog = None
+
+
+def get_catalog():
+    """Catálogo compartido, cargado la primera vez que se pide"""
+    global _catalog
+    if _catalog is None:
+        _catalog = load_catalog()
+    return _catalog
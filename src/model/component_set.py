@@ -0,0 +1,97 @@
+"""
+Conjunto inmutable de componentes del catálogo, guardado como un entero.
+Cada componente tiene un bit (su posición en data/components.json), así que
+pertenencia, subconjunto y diferencia son operaciones de bits y el conjunto
+completo se serializa como un número (int(s) / ComponentSet.from_bits).
+Es lo que viaja entre main.py y las pantallas en lugar de listas de nombres;
+se itera como nombres, en el orden del catálogo.
+"""
+
+from model.catalog import get_catalog
+
+
+class ComponentSet:
+    """Componentes elegidos como máscara de bits sobre un catálogo"""
+
+    __slots__ = ("bits", "catalog")
+
+    def __init__(self, names=(), catalog=None):
+        self.catalog = catalog if catalog is not None else get_catalog()
+        if isinstance(names, ComponentSet):
+            self.bits = names.bits
+        else:
+            self.bits = self.catalog.mask(names)  # ValueError si hay nombres fuera del catálogo
+
+    @classmethod
+    def from_bits(cls, bits, catalog=None):
+        component_set = cls((), catalog)
+        component_set.bits = bits
+        return component_set
+
+    @classmethod
+    def required_for(cls, computer_type, catalog=None):
+        """Componentes necesarios para que el tipo de computadora encienda"""
+        catalog = catalog if catalog is not None else get_catalog()
+        return cls.from_bits(catalog.required_mask(computer_type), catalog)
+
+    def _with_bits(self, bits):
+        return ComponentSet.from_bits(bits, self.catalog)
+
+    def _bits_of(self, other):
+        return other.bits if isinstance(other, ComponentSet) else self.catalog.mask(other)
+
+    # Consultas
+    def __contains__(self, name):
+        return bool(self.bits & self.catalog.bit(name))
+
+    def __len__(self):
+        return bin(self.bits).count("1")
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def __iter__(self):
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield self.catalog.name_at(lowest.bit_length() - 1)
+            bits ^= lowest
+
+    def __int__(self):
+        return self.bits
+
+    def __eq__(self, other):
+        if not isinstance(other, ComponentSet):
+            return NotImplemented
+        return self.bits == other.bits and self.catalog is other.catalog
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    def __repr__(self):
+        return f"ComponentSet({self.names()!r})"
+
+    def names(self):
+        """Nombres en el orden del catálogo"""
+        return list(self)
+
+    def issubset(self, other):
+        return self.bits & ~self._bits_of(other) == 0
+
+    __le__ = issubset
+
+    # Operaciones (devuelven conjuntos nuevos)
+    def __or__(self, other):
+        return self._with_bits(self.bits | self._bits_of(other))
+
+    def __and__(self, other):
+        return self._with_bits(self.bits & self._bits_of(other))
+
+    def __sub__(self, other):
+        return self._with_bits(self.bits & ~self._bits_of(other))
+
+    def internal(self):
+        return self._with_bits(self.bits & ~self.catalog.external_mask)
+
+    def external(self):
+        return self._with_bits(self.bits & self.catalog.external_mask)
@@ -0,0 +1,71 @@
+"""
+Selección de componentes del estante, sin pygame.
+Guarda qué componentes eligió el estudiante para un tipo de computadora;
+EstanteScreen solo la dibuja y le reenvía los clics.
+"""
+
+from model.catalog import EXTERNAL_CATEGORY, INTERNAL_CATEGORIES, get_catalog
+
+
+class Selection:
+    """Componentes elegidos para un tipo de computadora"""
+
+    def __init__(self, computer_type, names=(), catalog=None):
+        self.catalog = catalog if catalog is not None else get_catalog()
+        self.computer_type = computer_type
+        # Orden del estante: internos (comunes y luego de desktop) y después externos
+        self._internal_order = [c.name for category in INTERNAL_CATEGORIES
+                                for c in self.catalog.in_category(category)]
+        self._external_order = [c.name for c in self.catalog.in_category(EXTERNAL_CATEGORY)]
+        self._selected = set()
+        self.restore(names)
+        self.select_mandatory()
+
+    def __contains__(self, name):
+        return name in self._selected
+
+    def __len__(self):
+        return len(self._selected)
+
+    def is_selected(self, name):
+        return name in self._selected
+
+    def is_locked(self, name):
+        """True si el estudiante no puede cambiarlo: obligatorio o no disponible para el tipo"""
+        if self.catalog.is_mandatory(name, self.computer_type):
+            return True
+        return not self.catalog.is_external(name) and not self.catalog.is_available(name, self.computer_type)
+
+    def toggle(self, name):
+        """Alterna un componente; devuelve el nuevo estado o None si está bloqueado"""
+        if self.is_locked(name):
+            return None
+        if name in self._selected:
+            self._selected.discard(name)
+            return False
+        self._selected.add(name)
+        return True
+
+    def restore(self, names):
+        """Vuelve a marcar selecciones previas (se ignoran nombres fuera del catálogo)"""
+        for name in names or ():
+            if name in self.catalog:
+                self._selected.add(name)
+
+    def select_mandatory(self):
+        """Marca los componentes obligatorios del tipo (p. ej. la tarjeta madre en desktop)"""
+        for component in self.catalog.mandatory_for(self.computer_type):
+            self._selected.add(component.name)
+
+    def clear(self):
+        self._selected.clear()
+
+    def internal_names(self):
+        return [name for name in self._internal_order if name in self._selected]
+
+    def external_names(self):
+        return [name for name in self._external_order if name in self._selected]
+
+    def names(self):
+        """Nombres seleccionados en el orden del estante (internos y luego externos)"""
+        return self.internal_names() + self.external_names()
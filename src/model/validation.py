@@ -0,0 +1,91 @@
+"""
+Reglas de validación del ensamble, sin pygame.
+- validate_selection: mínimos del estante antes de pasar a la mesa de trabajo
+  (los mismos avisos que muestra EstanteScreen).
+- evaluate_boot: si la computadora enciende con los componentes internos
+  elegidos y, si no, cuáles faltan (pantallas de encendido).
+"""
+
+from model.catalog import get_catalog
+from model.component_set import ComponentSet
+
+# Componentes internos mínimos sin contar los obligatorios (la tarjeta madre en desktop)
+MIN_INTERNAL_SELECTION = {"laptop": 1, "desktop": 2}
+
+EMPTY_SHELF = "empty_shelf"
+NOT_ENOUGH_INTERNAL = "not_enough_internal"
+NO_EXTERNAL = "no_external"
+
+_MESSAGES = {
+    "internos": "Debes seleccionar al menos un\ncomponente del estante de\ncomponentes internos para continuar.",
+    "externos": "Debes seleccionar al menos un\ncomponente del estante de\ncomponentes externos para continuar.",
+    NOT_ENOUGH_INTERNAL: "Debes seleccionar al menos un\ncomponente del estante de\ncomponentes INTERNOS para continuar.",
+    (NOT_ENOUGH_INTERNAL, "desktop"): "Debes seleccionar al menos 2\ncomponentes INTERNOS adicionales\n(además de la tarjeta madre)\npara continuar.",
+    NO_EXTERNAL: "Debes seleccionar al menos un\ncomponente del estante de\ncomponentes EXTERNOS para continuar.",
+}
+
+
+class SelectionCheck:
+    """Resultado de validate_selection; `code` y `message` son None si es válida"""
+
+    __slots__ = ("code", "message")
+
+    def __init__(self, code=None, message=None):
+        self.code = code
+        self.message = message
+
+    @property
+    def ok(self):
+        return self.code is None
+
+    def __repr__(self):
+        return f"SelectionCheck({self.code!r})"
+
+
+class BootOutcome:
+    """Resultado de encender: `missing` es el ComponentSet de requeridos ausentes"""
+
+    __slots__ = ("computer_type", "missing")
+
+    def __init__(self, computer_type, missing):
+        self.computer_type = computer_type
+        self.missing = missing
+
+    @property
+    def powers_on(self):
+        return not self.missing
+
+    def __repr__(self):
+        return f"BootOutcome({self.computer_type!r}, missing={self.missing!r})"
+
+
+def validate_selection(names, computer_type, current_shelf=None, catalog=None):
+    """Aplica los mínimos del estante a `names`.
+
+    current_shelf ("internos"/"externos") agrega la regla de la pantalla: el
+    estante visible debe tener al menos una selección. Sin él (herramientas
+    por lotes) esa regla no aplica.
+    """
+    catalog = catalog if catalog is not None else get_catalog()
+    internals, externals = [], []
+    for name in names:
+        component = catalog.by_name(name)
+        if component is not None:
+            (externals if component.is_external else internals).append(name)
+
+    if current_shelf is not None and not (internals if current_shelf == "internos" else externals):
+        return SelectionCheck(EMPTY_SHELF, _MESSAGES[current_shelf])
+    optional_internals = [name for name in internals if not catalog.is_mandatory(name, computer_type)]
+    if len(optional_internals) < MIN_INTERNAL_SELECTION.get(computer_type, 1):
+        message = _MESSAGES.get((NOT_ENOUGH_INTERNAL, computer_type), _MESSAGES[NOT_ENOUGH_INTERNAL])
+        return SelectionCheck(NOT_ENOUGH_INTERNAL, message)
+    if not externals:
+        return SelectionCheck(NO_EXTERNAL, _MESSAGES[NO_EXTERNAL])
+    return SelectionCheck()
+
+
+def evaluate_boot(internal_names, computer_type, catalog=None):
+    """¿Enciende con estos componentes internos? Devuelve un BootOutcome"""
+    catalog = catalog if catalog is not None else get_catalog()
+    present = ComponentSet(internal_names, catalog)
+    return BootOutcome(computer_type, ComponentSet.required_for(computer_type, catalog) - present)
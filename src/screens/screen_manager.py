@@ -0,0 +1,107 @@
+"""
+Administrador de pantallas reutilizables.
+Mantiene instancias "tibias" por (clase de pantalla, tipo de computadora)
+para que ir y volver entre el estante y la mesa de trabajo no vuelva a
+cargar imágenes ni a recalcular layouts; al reingresar solo se restablece
+el estado mutable con el método reset() de cada pantalla.
+Dos límites: cantidad de instancias (max_instances, al crear) y bytes de
+las superficies propias de cada pantalla (max_cached_bytes, que main.py
+revisa en cada cambio de pantalla con enforce_budget()). Una pantalla
+informa sus bytes con cached_bytes(); las que no lo definen cuentan 0.
+Las pantallas pueden indicarse como "modulo:Clase": el módulo se importa
+recién la primera vez que se entra a esa pantalla.
+"""
+
+import importlib
+from collections import OrderedDict
+
+
+def resolve_screen_class(screen_class):
+    """Devuelve la clase; si es "modulo:Clase" importa el módulo en ese momento"""
+    if not isinstance(screen_class, str):
+        return screen_class
+    module_name, _, class_name = screen_class.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _cached_bytes(instance):
+    cached_bytes = getattr(instance, "cached_bytes", None)
+    return cached_bytes() if cached_bytes is not None else 0
+
+
+class ScreenManager:
+    """Pool de pantallas con desalojo LRU por cantidad y por bytes cacheados"""
+
+    def __init__(self, screen, max_instances=8, max_cached_bytes=None):
+        self.screen = screen
+        self.max_instances = max_instances  # None = sin límite
+        self.max_cached_bytes = max_cached_bytes  # None = sin presupuesto de memoria
+        self._pool = OrderedDict()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def get(self, screen_class, *state, computer_type=None, **options):
+        """Devuelve una pantalla lista para usarse.
+
+        `state` son los argumentos de estado que recibe el constructor después
+        de `screen`; en una instancia reutilizada se pasan a reset(*state).
+        `options` solo se usan al construir la instancia.
+        """
+        screen_class = resolve_screen_class(screen_class)
+        key = (screen_class, computer_type)
+        instance = self._pool.get(key)
+        if instance is None:
+            instance = screen_class(self.screen, *state, **options)
+            self._pool[key] = instance
+            self.created += 1
+            self._evict_over_limit()
+        else:
+            instance.reset(*state)
+            self._pool.move_to_end(key)
+            self.reused += 1
+        return instance
+
+    def _evict_over_limit(self):
+        if self.max_instances is None:
+            return
+        while len(self._pool) > self.max_instances:
+            self._pool.popitem(last=False)  # La menos usada recientemente
+            self.evicted += 1
+
+    def cached_bytes(self):
+        """Bytes de superficies propias de todas las pantallas tibias"""
+        return sum(_cached_bytes(instance) for instance in self._pool.values())
+
+    def enforce_budget(self, keep=1):
+        """Desaloja pantallas, de la menos usada a la más reciente, hasta entrar en max_cached_bytes.
+
+        Las `keep` más recientes nunca se desalojan y las que no cachean nada
+        se conservan (sacarlas no libera memoria). Devuelve los bytes liberados.
+        """
+        if self.max_cached_bytes is None:
+            return 0
+        sizes = [(key, _cached_bytes(instance)) for key, instance in self._pool.items()]
+        total = sum(size for _, size in sizes)
+        freed = 0
+        for key, size in sizes[:max(0, len(sizes) - keep)]:
+            if total <= self.max_cached_bytes:
+                break
+            if size:
+                del self._pool[key]
+                total -= size
+                freed += size
+                self.evicted += 1
+        return freed
+
+    def evict(self, screen_class, computer_type=None):
+        """Descarta una pantalla concreta del pool"""
+        self._pool.pop((resolve_screen_class(screen_class), computer_type), None)
+
+    def clear(self):
+        self._pool.clear()
+
+    def stats(self):
+        """Resumen de uso del pool"""
+        return {"warm": len(self._pool), "created": self.created, "reused": self.reused,
+                "evicted": self.evicted, "cached_bytes": self.cached_bytes()}
@@ -1,4 +1,10 @@
 import pygame
+from utils.assets import load_asset
+from utils.frame_scheduler import FrameScheduler
+from utils.gradients import get_vertical_gradient
+from utils.fonts import get_font
+from utils.text_cache import render_text
+from utils import input_source
 
 class SelectionScreen:
     """Pantalla para seleccionar tipo de computadora (Laptop o Desktop)"""
@@ -19,25 +25,23 @@ class SelectionScreen:
         self.button_hover = (29, 78, 216)    # Azul hover
         
         # Fuentes mejoradas
-        self.title_font = pygame.font.Font(None, 52)
-        self.card_font = pygame.font.Font(None, 32)
-        self.button_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(52)
+        self.card_font = get_font(32)
+        self.button_font = get_font(24)
         
         # Texto del título
-        self.title_text = self.title_font.render("Selecciona el tipo de computadora", True, self.text_color)
+        self.title_text = render_text(self.title_font, "Selecciona el tipo de computadora", True, self.text_color)
         
         # Cargar y redimensionar imágenes
         try:
-            self.laptop_image = pygame.image.load("../src/assets/images/LaptopIcon.png").convert_alpha()
-            self.laptop_image = pygame.transform.scale(self.laptop_image, (140, 120))
+            self.laptop_image = load_asset("laptop_icon", (140, 120))
         except:
             # Crear imagen temporal si no se puede cargar
             self.laptop_image = pygame.Surface((140, 120))
             self.laptop_image.fill((100, 150, 200))  # Azul para laptop
             
         try:
-            self.desktop_image = pygame.image.load("../src/assets/images/DesktopIcon.png").convert_alpha()
-            self.desktop_image = pygame.transform.scale(self.desktop_image, (140, 120))
+            self.desktop_image = load_asset("desktop_icon", (140, 120))
         except:
             # Crear imagen temporal si no se puede cargar
             self.desktop_image = pygame.Surface((140, 120))
@@ -81,15 +85,8 @@ class SelectionScreen:
         self.finish_btn_hovered = False
     
     def draw_gradient_rect(self, rect, color1, color2):
-        """Dibuja un rectángulo con gradiente vertical"""
-        for y in range(rect.height):
-            ratio = y / rect.height
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), 
-                           (rect.x, rect.y + y), 
-                           (rect.x + rect.width, rect.y + y))
+        """Dibuja un rectángulo con gradiente vertical (generado una vez y cacheado)"""
+        self.screen.blit(get_vertical_gradient(rect.size, color1, color2), rect.topleft)
     
     def draw_card_shadow(self, rect, offset=8):
         """Dibuja sombra para las tarjetas"""
@@ -117,7 +114,7 @@ class SelectionScreen:
         self.screen.blit(image, (img_x, img_y))
         
         # Título centrado
-        title_text = self.card_font.render(title, True, self.text_color)
+        title_text = render_text(self.card_font, title, True, self.text_color)
         title_rect = title_text.get_rect(center=(rect.centerx, rect.y + 180))
         self.screen.blit(title_text, title_rect)
         
@@ -126,7 +123,7 @@ class SelectionScreen:
         pygame.draw.rect(self.screen, btn_color, button_rect, border_radius=12)
         
         # Texto del botón
-        btn_text = self.button_font.render("Seleccionar", True, self.text_color)
+        btn_text = render_text(self.button_font, "Seleccionar", True, self.text_color)
         btn_text_rect = btn_text.get_rect(center=button_rect.center)
         self.screen.blit(btn_text, btn_text_rect)
     
@@ -152,30 +149,44 @@ class SelectionScreen:
         pygame.draw.rect(self.screen, btn_color, self.finish_button_rect, border_radius=12)
         
         # Texto del botón finalizar
-        finish_text = self.button_font.render("Finalizar Simulación", True, self.text_color)
+        finish_text = render_text(self.button_font, "Finalizar Simulación", True, self.text_color)
         finish_text_rect = finish_text.get_rect(center=self.finish_button_rect.center)
         self.screen.blit(finish_text, finish_text_rect)
         
         pygame.display.flip()
 
+    def reset(self):
+        """Restablece el estado mutable al reutilizar la pantalla"""
+        self.laptop_hovered = False
+        self.desktop_hovered = False
+        self.laptop_btn_hovered = False
+        self.desktop_btn_hovered = False
+        self.finish_btn_hovered = False
+
+    def update_hover(self, mouse_pos):
+        """Actualiza los estados hover; devuelve True si alguno cambió"""
+        previous = (self.laptop_hovered, self.desktop_hovered, self.laptop_btn_hovered,
+                    self.desktop_btn_hovered, self.finish_btn_hovered)
+        self.laptop_hovered = self.laptop_rect.collidepoint(mouse_pos)
+        self.desktop_hovered = self.desktop_rect.collidepoint(mouse_pos)
+        self.laptop_btn_hovered = self.laptop_button_rect.collidepoint(mouse_pos)
+        self.desktop_btn_hovered = self.desktop_button_rect.collidepoint(mouse_pos)
+        self.finish_btn_hovered = self.finish_button_rect.collidepoint(mouse_pos)
+        current = (self.laptop_hovered, self.desktop_hovered, self.laptop_btn_hovered,
+                   self.desktop_btn_hovered, self.finish_btn_hovered)
+        return current != previous
+
     def run(self):
         """Maneja eventos y lógica principal de selección"""
         running = True
         selected = None
+        scheduler = FrameScheduler(fps=60)
+        self.update_hover(input_source.get_mouse_pos())
         
         while running:
-            # Detectar hover en tarjetas y botones
-            mouse_pos = pygame.mouse.get_pos()
-            self.laptop_hovered = self.laptop_rect.collidepoint(mouse_pos)
-            self.desktop_hovered = self.desktop_rect.collidepoint(mouse_pos)
-            self.laptop_btn_hovered = self.laptop_button_rect.collidepoint(mouse_pos)
-            self.desktop_btn_hovered = self.desktop_button_rect.collidepoint(mouse_pos)
-            self.finish_btn_hovered = self.finish_button_rect.collidepoint(mouse_pos)
-            
-            self.draw()
-            
-            # Procesar eventos
-            for event in pygame.event.get():
+            # Procesar eventos (bloquea si no hay nada que redibujar)
+            events = scheduler.get_events()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -188,5 +199,14 @@ class SelectionScreen:
                     elif self.finish_button_rect.collidepoint(event.pos):
                         selected = "exit"
                         running = False
+            
+            # Detectar hover en tarjetas y botones solo cuando hubo entrada
+            if events and self.update_hover(input_source.get_mouse_pos()):
+                scheduler.request_redraw()
+            
+            if running and scheduler.needs_redraw():
+                self.draw()
+                scheduler.frame_drawn()
+            scheduler.tick()
                         
         return selected
\ No newline at end of file
@@ -1,23 +1,35 @@
 import pygame
+from model.catalog import get_catalog
+from model.selection import Selection
+from model.validation import validate_selection
+from utils.assets import load_asset
+from utils.fonts import get_font
+from utils.text_cache import render_text
+from utils.hit_index import HitIndex
+from utils.surface_pool import get_filled_surface, surface_bytes
+from utils import input_source
+from utils.profiler import PROFILER
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 class ComponentCard:
     """Representa una tarjeta individual de componente"""
     
-    def __init__(self, name, image_path, category, rect):
+    def __init__(self, name, asset_name, category, rect):
         self.name = name
-        self.image_path = image_path
+        self.asset_name = asset_name
         self.category = category
         self.rect = rect
-        self.selected = False
+        self.rendered = {}  # Estado visual -> superficie pre-renderizada (ver EstanteScreen.draw_component_card)
         # Botón ajustado para nuevas dimensiones de tarjeta
         self.button_rect = pygame.Rect(rect.x + 20, rect.y + rect.height - 38, rect.width - 40, 30) # Botón un poco más alto
         
         # Cargar imagen del componente
         try:
-            self.image = pygame.image.load(image_path).convert_alpha()
-            # Imagen cuadrada y un poco más grande
+            # Imagen cuadrada y un poco más grande (compartida vía caché)
             img_size = (100, 100)
-            self.image = pygame.transform.scale(self.image, img_size)
+            self.image = load_asset(asset_name, img_size)
         except:
             # Crear imagen placeholder si no se puede cargar
             self.image = pygame.Surface((100, 100))
@@ -63,14 +75,12 @@ class ConfirmDialog:
         self.ok_color = (59, 130, 246)    # Azul para OK en alertas
         
         # Fuentes
-        self.font = pygame.font.Font(None, 24)
-        self.button_font = pygame.font.Font(None, 20)
+        self.font = get_font(24)
+        self.button_font = get_font(20)
     
     def draw(self):
         """Dibuja el diálogo"""
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(get_filled_surface(self.screen.get_size(), (0, 0, 0, 180)), (0, 0))
         
         pygame.draw.rect(self.screen, self.bg_color, self.rect, border_radius=15)
         pygame.draw.rect(self.screen, (71, 85, 105), self.rect, 3, border_radius=15)
@@ -81,23 +91,23 @@ class ConfirmDialog:
         line_height = 22 # Espacio entre líneas de texto
 
         for i, line in enumerate(lines):
-            text_surface = self.font.render(line, True, self.text_color)
+            text_surface = render_text(self.font, line, True, self.text_color)
             text_rect = text_surface.get_rect(center=(self.rect.centerx, text_start_y + i * line_height))
             self.screen.blit(text_surface, text_rect)
         
         if self.is_alert:
             pygame.draw.rect(self.screen, self.ok_color, self.ok_button, border_radius=8)
-            ok_text = self.button_font.render("OK", True, self.text_color)
+            ok_text = render_text(self.button_font, "OK", True, self.text_color)
             ok_text_rect = ok_text.get_rect(center=self.ok_button.center)
             self.screen.blit(ok_text, ok_text_rect)
         else:
             pygame.draw.rect(self.screen, self.yes_color, self.yes_button, border_radius=8)
-            yes_text = self.button_font.render("Descartar", True, self.text_color)
+            yes_text = render_text(self.button_font, "Descartar", True, self.text_color)
             yes_text_rect = yes_text.get_rect(center=self.yes_button.center)
             self.screen.blit(yes_text, yes_text_rect)
             
             pygame.draw.rect(self.screen, self.no_color, self.no_button, border_radius=8)
-            no_text = self.button_font.render("Continuar", True, self.text_color)
+            no_text = render_text(self.button_font, "Continuar", True, self.text_color)
             no_text_rect = no_text.get_rect(center=self.no_button.center)
             self.screen.blit(no_text, no_text_rect)
     
@@ -140,36 +150,32 @@ class EstanteScreen:
         self.mandatory_selected_color = (168, 85, 247) # Púrpura para componentes obligatorios
         
         # Fuentes
-        self.title_font = pygame.font.Font(None, 32)
-        self.category_font = pygame.font.Font(None, 24)
-        self.component_font = pygame.font.Font(None, 18)
-        self.button_font = pygame.font.Font(None, 16)
-        self.type_indicator_font = pygame.font.Font(None, 18) # Fuente para el indicador
+        self.title_font = get_font(32)
+        self.category_font = get_font(24)
+        self.component_font = get_font(18)
+        self.button_font = get_font(16)
+        self.type_indicator_font = get_font(18) # Fuente para el indicador
         
         # Estado actual
         self.show_internal = True
-        self.selected_components = []
         self.dialog = None
         
-        # Guardar selecciones previas para restaurar después de crear componentes
-        self.previous_selections = previous_selections or []
+        # Catálogo compartido de componentes
+        self.catalog = get_catalog()
         
         # Crear componentes
         self.setup_components()
         
-        # Restaurar selecciones previas si existen
-        self.restore_previous_selections()
-        
-        # Para Desktop: Seleccionar automáticamente ASUS Prime B550M
-        if self.computer_type == "desktop":
-            self.auto_select_motherboard()
+        # Selección (modelo sin pygame): restaura las previas y marca las obligatorias
+        # (para Desktop, ASUS Prime B550M)
+        self.selection = Selection(self.computer_type, previous_selections)
         
         # Botones de navegación
         self.setup_navigation_buttons()
 
         # Preparar texto del indicador de tipo de PC
         type_text = f"Selección: {self.computer_type.capitalize()}"
-        self.type_indicator_surface = self.type_indicator_font.render(type_text, True, self.type_indicator_text)
+        self.type_indicator_surface = render_text(self.type_indicator_font, type_text, True, self.type_indicator_text)
         padding = 10
         self.type_indicator_rect = pygame.Rect(
             self.width - self.type_indicator_surface.get_width() - padding * 2 - 15, # 15px margen derecho
@@ -178,60 +184,46 @@ class EstanteScreen:
             self.type_indicator_surface.get_height() + padding
         )
     
+    def reset(self, computer_type, previous_selections=None):
+        """Restablece las selecciones al reutilizar la pantalla (tarjetas e imágenes se conservan)"""
+        self.computer_type = computer_type
+        self.show_internal = True
+        self.dialog = None
+        if hasattr(self, 'pending_action'): delattr(self, 'pending_action')
+        self.selection = Selection(self.computer_type, previous_selections)
+        self.setup_navigation_buttons()
+    
     def setup_components(self):
         """Configura todos los componentes con sus categorías para ventana de 970x810"""
         self.internal_components = []
-        common_internal = [
-            ("RAM DDR4 8GB", "assets/images/componentesInternos/ram.png"),
-            ("Ryzen 7 5700X", "assets/images/componentesInternos/cpu.png"),
-            ("Kingston SSD 1TB", "assets/images/componentesInternos/ssd.png"),
-            ("M.2 NVMe SSD", "assets/images/componentesInternos/m.2.png"),
-            ("Modulo Wi-Fi/BT", "assets/images/componentesInternos/módulo Wi-Fi:Bluetooth.png"),
-        ]
-        desktop_only = [
-            ("NVIDIA RTX 3060", "assets/images/componentesInternos/gpu.png"),
-            ("ASUS Prime B550M", "assets/images/componentesInternos/motherboard.png"),
-            ("Cooler Master H212", "assets/images/componentesInternos/Cooler Master Hyper 212.png"),
-            ("Ventilador ARGB", "assets/images/componentesInternos/Ventilador 120mm ARGB.png"),
-            ("HDD Seagate 1TB", "assets/images/componentesInternos/HDD Seagate 1TB  .png"),
-            ("PSU 600W", "assets/images/componentesInternos/Fuente de poder 600W.png"),
-            ("DVD SATA", "assets/images/componentesInternos/dvdsata.png"),
-        ]
+        common_internal = self.catalog.in_category("common")
+        desktop_only = self.catalog.in_category("desktop")
 
         card_width_common, card_height_common = 180, 175
         y_offset_common = 130
-        for i, (name, image_path) in enumerate(common_internal):
+        for i, component in enumerate(common_internal):
             x = 30 + (i % 5) * (card_width_common + 10)
             y = y_offset_common
             rect = pygame.Rect(x, y, card_width_common, card_height_common)
-            card = ComponentCard(name, image_path, "common", rect)
+            card = ComponentCard(component.name, component.id, component.category, rect)
             self.internal_components.append(card)
         
         card_width_desktop, card_height_desktop = 180, 175
         y_offset_desktop_title = y_offset_common + card_height_common + 25
         y_offset_desktop_cards = y_offset_desktop_title + 30 + 15
-        for i, (name, image_path) in enumerate(desktop_only):
+        for i, component in enumerate(desktop_only):
             row = i // 4
             col = i % 4
             x = (self.width - (4 * card_width_desktop + 3 * 10)) // 2 + col * (card_width_desktop + 10) if row == 0 else \
                 (self.width - (3 * card_width_desktop + 2 * 10)) // 2 + col * (card_width_desktop + 10)
             y = y_offset_desktop_cards + row * (card_height_desktop + 15)
             rect = pygame.Rect(x, y, card_width_desktop, card_height_desktop)
-            card = ComponentCard(name, image_path, "desktop", rect)
+            card = ComponentCard(component.name, component.id, component.category, rect)
             self.internal_components.append(card)
 
         # Componentes externos - Tarjetas más grandes y mejor espaciadas
         self.external_components = []
-        external_list = [
-            ("Monitor LED 24\"", "assets/images/componentesExternos/monitorNew.png"),
-            ("Teclado Mecanico", "assets/images/componentesExternos/Teclado mecánico RGB.png"),
-            ("Mouse Razen", "assets/images/componentesExternos/mouse.png"),
-            ("Bocinas Estereo", "assets/images/componentesExternos/bocinas.png"),
-            ("Webcam HD 1080p", "assets/images/componentesExternos/camara.png"),
-            ("Microfono USB", "assets/images/componentesExternos/microfono.png"),
-            ("UPS", "assets/images/componentesExternos/ups.png"),
-            ("HUB USB", "assets/images/componentesExternos/HUB.png"),
-        ]
+        external_list = self.catalog.in_category("external")
         # Nuevas dimensiones para tarjetas externas
         card_width_external, card_height_external = 220, 200 # Más altas y anchas
         y_offset_external_title = 90
@@ -242,35 +234,25 @@ class EstanteScreen:
         total_width_external = num_cols_external * card_width_external + (num_cols_external - 1) * 15 # 15px de espacio
         start_x_external = (self.width - total_width_external) // 2
 
-        for i, (name, image_path) in enumerate(external_list):
+        for i, component in enumerate(external_list):
             row = i // num_cols_external
             col = i % num_cols_external
             x = start_x_external + col * (card_width_external + 15)
             y = y_offset_external_cards + row * (card_height_external + 20) # Más espacio vertical
             rect = pygame.Rect(x, y, card_width_external, card_height_external)
-            card = ComponentCard(name, image_path, "external", rect)
+            card = ComponentCard(component.name, component.id, component.category, rect)
             self.external_components.append(card)
-    
-    def restore_previous_selections(self):
-        """Restaura las selecciones previas basándose en los nombres de componentes"""
-        if not self.previous_selections:
-            return
-        
-        # Buscar y marcar como seleccionados los componentes que estaban previamente seleccionados
-        for component_name in self.previous_selections:
-            # Buscar en componentes internos
-            for card in self.internal_components:
-                if card.name == component_name:
-                    card.selected = True
-                    print(f"Restaurando selección: {card.name}")
-                    break
-            
-            # Buscar en componentes externos
-            for card in self.external_components:
-                if card.name == component_name:
-                    card.selected = True
-                    print(f"Restaurando selección: {card.name}")
-                    break
+
+        # Índice nombre -> tarjeta para restaurar selecciones sin recorrer listas
+        self.cards_by_name = {card.name: card for card in self.internal_components + self.external_components}
+
+        # Índices espaciales de los botones de cada estante para resolver clics
+        self.internal_button_index = HitIndex()
+        for card in self.internal_components:
+            self.internal_button_index.add(card.name, card, card.button_rect)
+        self.external_button_index = HitIndex()
+        for card in self.external_components:
+            self.external_button_index.add(card.name, card, card.button_rect)
     
     def setup_navigation_buttons(self):
         """Configura los botones de navegación para la ventana más pequeña (970x810)"""
@@ -296,97 +278,129 @@ class EstanteScreen:
         """Dibuja el encabezado de una categoría, centrado y con ancho adaptable"""
         # Si el texto es muy largo, la fuente del título de categoría podría reducirse o el ancho del header ajustarse
         # Por ahora, mantenemos la fuente y ajustamos el ancho del header
-        actual_text_width = self.category_font.render(text, True, self.category_text).get_width()
+        actual_text_width = render_text(self.category_font, text, True, self.category_text).get_width()
         if actual_text_width + 20 > width: # 20px padding
             width = actual_text_width + 30 # Ajustar el ancho del rectángulo del header
 
         rect = pygame.Rect((self.width - width) // 2, y_pos, width, 30)
         pygame.draw.rect(self.screen, self.category_bg, rect, border_radius=5)
         
-        category_text_render = self.category_font.render(text, True, self.category_text)
+        category_text_render = render_text(self.category_font, text, True, self.category_text)
         text_rect = category_text_render.get_rect(center=rect.center)
         self.screen.blit(category_text_render, text_rect)
     
+    def card_visual_state(self, card):
+        """Estado visual de una tarjeta: 'disabled', 'mandatory', 'selected' o 'normal'"""
+        if self.show_internal and not self.catalog.is_available(card.name, self.computer_type):
+            return "disabled"
+        if self.catalog.is_mandatory(card.name, self.computer_type):
+            return "mandatory"
+        return "selected" if self.selection.is_selected(card.name) else "normal"
+
+    def cached_bytes(self):
+        """Bytes de las tarjetas pre-renderizadas (para el presupuesto del ScreenManager)"""
+        return sum(surface_bytes(*card.rendered.values()) for card in self.cards_by_name.values())
+
     def draw_component_card(self, card):
-        """Dibuja una tarjeta de componente con espaciado mejorado y estado de bloqueo"""
-        is_disabled = (self.computer_type == "laptop" and card.category == "desktop" and self.show_internal)
-        is_mandatory_motherboard = (self.computer_type == "desktop" and card.name == "ASUS Prime B550M")
+        """Dibuja una tarjeta de componente con espaciado mejorado y estado de bloqueo.
+
+        Cada estado visual se renderiza una sola vez; después es un solo blit.
+        """
+        state = self.card_visual_state(card)
+        surface = card.rendered.get(state)
+        if surface is None:
+            surface = self._render_component_card(card, state)
+            card.rendered[state] = surface
+        self.screen.blit(surface, card.rect.topleft)
+
+    def _render_component_card(self, card, state):
+        """Renderiza la tarjeta (con sombra y botón) en una superficie propia"""
+        is_disabled = state == "disabled"
+        is_mandatory_motherboard = state == "mandatory"
+        # La superficie incluye la sombra (+3 px) sobre el color de fondo del estante
+        surface = pygame.Surface((card.rect.width + 3, card.rect.height + 3))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(self.bg_color)
+        card_rect = pygame.Rect(0, 0, card.rect.width, card.rect.height)
+        button_rect = card.button_rect.move(-card.rect.x, -card.rect.y)
         
         # Color de fondo según selección o estado deshabilitado
         if is_disabled:
             bg_color = self.disabled_color
         elif is_mandatory_motherboard:
             bg_color = self.mandatory_selected_color  # Color especial para motherboard obligatorio
-        elif card.selected:
+        elif state == "selected":
             bg_color = self.selected_color
         else:
             bg_color = self.card_color
         
         # Sombra
-        shadow_rect = card.rect.copy()
+        shadow_rect = card_rect.copy()
         shadow_rect.x += 3
         shadow_rect.y += 3
-        pygame.draw.rect(self.screen, (200, 200, 200), shadow_rect, border_radius=8)
+        pygame.draw.rect(surface, (200, 200, 200), shadow_rect, border_radius=8)
         
         # Tarjeta principal
-        pygame.draw.rect(self.screen, bg_color, card.rect, border_radius=8)
+        pygame.draw.rect(surface, bg_color, card_rect, border_radius=8)
         border_color = (150,150,150) if is_disabled else (200,200,200)
-        pygame.draw.rect(self.screen, border_color, card.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, border_color, card_rect, 2, border_radius=8)
 
         # Imagen del componente (atenuada si está deshabilitada)
         img_to_draw = card.image.copy()
         if is_disabled:
             img_to_draw.set_alpha(100) # Atenuar imagen
-        img_x = card.rect.x + (card.rect.width - img_to_draw.get_width()) // 2
-        img_y = card.rect.y + 10
-        self.screen.blit(img_to_draw, (img_x, img_y))
+        img_x = card_rect.x + (card_rect.width - img_to_draw.get_width()) // 2
+        img_y = card_rect.y + 10
+        surface.blit(img_to_draw, (img_x, img_y))
 
         # Texto del componente
         if is_disabled:
             text_color = self.disabled_text_color
-        elif card.selected or is_mandatory_motherboard:
+        elif state == "selected" or is_mandatory_motherboard:
             text_color = (255,255,255)
         else:
             text_color = self.text_color
             
         font_to_use = self.component_font
-        name_text_render = font_to_use.render(card.name, True, text_color)
-        if name_text_render.get_width() > card.rect.width - 10:
-            smaller_font = pygame.font.Font(None, 14)
-            name_text_render = smaller_font.render(card.name, True, text_color)
-        
-        text_y_center = card.rect.y + card.image.get_height() + 10 + 15
-        name_rect = name_text_render.get_rect(center=(card.rect.centerx, text_y_center))
-        self.screen.blit(name_text_render, name_rect)
+        name_text_render = render_text(font_to_use, card.name, True, text_color)
+        if name_text_render.get_width() > card_rect.width - 10:
+            smaller_font = get_font(14)
+            name_text_render = render_text(smaller_font, card.name, True, text_color)
+        
+        text_y_center = card_rect.y + card.image.get_height() + 10 + 15
+        name_rect = name_text_render.get_rect(center=(card_rect.centerx, text_y_center))
+        surface.blit(name_text_render, name_rect)
 
         # Botón (deshabilitado si es necesario)
         if is_disabled:
             button_color = self.disabled_color
             button_text_str = "No disponible"
-            pygame.draw.rect(self.screen, button_color, card.button_rect, border_radius=5)
-            pygame.draw.rect(self.screen, self.disabled_text_color, card.button_rect, 1, border_radius=5) # Borde tenue
+            pygame.draw.rect(surface, button_color, button_rect, border_radius=5)
+            pygame.draw.rect(surface, self.disabled_text_color, button_rect, 1, border_radius=5) # Borde tenue
         elif is_mandatory_motherboard:
             button_color = (120, 53, 190)  # Púrpura más oscuro para el botón
             button_text_str = "Requerido"
-            pygame.draw.rect(self.screen, button_color, card.button_rect, border_radius=5)
-        elif card.selected:
+            pygame.draw.rect(surface, button_color, button_rect, border_radius=5)
+        elif state == "selected":
             button_color = (220, 38, 38)
             button_text_str = "Quitar"
-            pygame.draw.rect(self.screen, button_color, card.button_rect, border_radius=5)
+            pygame.draw.rect(surface, button_color, button_rect, border_radius=5)
         else:
             button_color = self.button_color
             button_text_str = "Seleccionar"
-            pygame.draw.rect(self.screen, button_color, card.button_rect, border_radius=5)
+            pygame.draw.rect(surface, button_color, button_rect, border_radius=5)
         
         btn_text_color = self.disabled_text_color if is_disabled else (255,255,255)
-        btn_text_render = self.button_font.render(button_text_str, True, btn_text_color)
-        btn_text_rect = btn_text_render.get_rect(center=card.button_rect.center)
-        self.screen.blit(btn_text_render, btn_text_rect)
+        btn_text_render = render_text(self.button_font, button_text_str, True, btn_text_color)
+        btn_text_rect = btn_text_render.get_rect(center=button_rect.center)
+        surface.blit(btn_text_render, btn_text_rect)
+        return surface
     
     def draw_navigation_buttons(self):
         """Dibuja los botones de navegación con texto más grande y corto"""
         pygame.draw.rect(self.screen, (107, 114, 128), self.back_button, border_radius=5)
-        back_text_render = self.button_font.render("< Atras", True, (255, 255, 255))
+        back_text_render = render_text(self.button_font, "< Atras", True, (255, 255, 255))
         back_rect = back_text_render.get_rect(center=self.back_button.center)
         self.screen.blit(back_text_render, back_rect)
         
@@ -398,12 +412,12 @@ class EstanteScreen:
         switch_text_str = "Est. Externos" if self.show_internal else "Est. Internos"
 
         pygame.draw.rect(self.screen, self.button_color, self.finish_button, border_radius=5)
-        finish_text_render = nav_btn_font.render(finish_text_str, True, (255, 255, 255))
+        finish_text_render = render_text(nav_btn_font, finish_text_str, True, (255, 255, 255))
         finish_rect = finish_text_render.get_rect(center=self.finish_button.center)
         self.screen.blit(finish_text_render, finish_rect)
         
         pygame.draw.rect(self.screen, self.button_color, self.switch_button, border_radius=5)
-        switch_text_render = nav_btn_font.render(switch_text_str, True, (255, 255, 255))
+        switch_text_render = render_text(nav_btn_font, switch_text_str, True, (255, 255, 255))
         switch_rect = switch_text_render.get_rect(center=self.switch_button.center)
         self.screen.blit(switch_text_render, switch_rect)
 
@@ -422,7 +436,7 @@ class EstanteScreen:
         if self.show_internal:
             title_rect = pygame.Rect((self.width - title_main_width) // 2, 20, title_main_width, title_main_height)
             pygame.draw.rect(self.screen, self.button_color, title_rect, border_radius=5)
-            title_text_render = self.title_font.render("Componentes Internos", True, (255, 255, 255))
+            title_text_render = render_text(self.title_font, "Componentes Internos", True, (255, 255, 255))
             title_text_rect = title_text_render.get_rect(center=title_rect.center)
             self.screen.blit(title_text_render, title_text_rect)
             
@@ -433,54 +447,41 @@ class EstanteScreen:
         else:
             title_rect = pygame.Rect((self.width - title_main_width) // 2, 20, title_main_width, title_main_height)
             pygame.draw.rect(self.screen, self.button_color, title_rect, border_radius=5)
-            title_text_render = self.title_font.render("Componentes Externos", True, (255, 255, 255))
+            title_text_render = render_text(self.title_font, "Componentes Externos", True, (255, 255, 255))
             title_text_rect = title_text_render.get_rect(center=title_rect.center)
             self.screen.blit(title_text_render, title_text_rect)
             
             self.draw_category_header("Perifericos Laptop/Desktop", 90, width=360)
             # y_offset_external_cards es 130
 
+        PROFILER.lap("background")
+
         # Dibujar componentes después de los títulos de categoría
         components_to_draw = self.internal_components if self.show_internal else self.external_components
         for card in components_to_draw:
             self.draw_component_card(card)
+        PROFILER.lap("cards")
         
         self.draw_navigation_buttons()
+        PROFILER.lap("buttons")
         if self.dialog:
             self.dialog.draw()
-        pygame.display.flip()
+        PROFILER.lap("alert")
 
     def has_selections(self):
         """Verifica si hay componentes seleccionados"""
-        for card in self.internal_components + self.external_components:
-            if card.selected:
-                return True
-        return False
+        return len(self.selection) > 0
     
     def clear_selections(self):
         """Limpia todas las selecciones"""
-        for card in self.internal_components + self.external_components:
-            card.selected = False
+        self.selection.clear()
     
     def handle_card_click(self, card):
         """Maneja el clic en una tarjeta de componente"""
-        is_disabled = (self.computer_type == "laptop" and card.category == "desktop" and self.show_internal)
-        is_mandatory_motherboard = (self.computer_type == "desktop" and card.name == "ASUS Prime B550M")
-        
-        # No permitir interacción con componentes deshabilitados o motherboard obligatorio
-        if is_disabled or is_mandatory_motherboard:
-            return
-        
-        if card.selected:
-            card.selected = False
-            if card.name in self.selected_components:
-                self.selected_components.remove(card.name)
-        else:
-            card.selected = True
-            if card.name not in self.selected_components:
-                self.selected_components.append(card.name)
-        
-        print(f"Componente {'seleccionado' if card.selected else 'deseleccionado'}: {card.name}")
+        # Los deshabilitados y la motherboard obligatoria no cambian (toggle devuelve None)
+        selected = self.selection.toggle(card.name)
+        if selected is not None:
+            logger.debug("Componente %s: %s", "seleccionado" if selected else "deseleccionado", card.name)
     
     def show_confirmation_dialog(self, message):
         """Muestra diálogo de confirmación"""
@@ -494,9 +495,13 @@ class EstanteScreen:
         """Maneja eventos y lógica principal, devuelve una acción y componentes."""
         running = True
         action_result = {"action": "quit", "selected_components": []}
+        clock = pygame.time.Clock()
+        PROFILER.set_screen(type(self).__name__)
         
         while running:
-            for event in pygame.event.get():
+            PROFILER.mark()
+            for event in input_source.get_events():
+                PROFILER.handle_event(event)
                 if event.type == pygame.QUIT:
                     running = False
                     action_result = {"action": "quit"}
@@ -527,44 +532,30 @@ class EstanteScreen:
                         elif self.switch_button.collidepoint(event.pos):
                             self.show_internal = not self.show_internal
                         elif self.finish_button.collidepoint(event.pos):
-                            selected_internals = [card for card in self.internal_components if card.selected]
-                            selected_externals = [card for card in self.external_components if card.selected]
-                            current_shelf_components = self.internal_components if self.show_internal else self.external_components
-                            has_current_shelf_selection = any(card.selected for card in current_shelf_components)
-
-                            # Para Desktop: No contar ASUS Prime B550M en la validación
-                            if self.computer_type == "desktop":
-                                selected_internals_without_motherboard = [card for card in selected_internals if card.name != "ASUS Prime B550M"]
-                                min_internal_required = 2
-                            else:
-                                selected_internals_without_motherboard = selected_internals
-                                min_internal_required = 1
-
-                            if not has_current_shelf_selection:
-                                shelf_name = "internos" if self.show_internal else "externos"
-                                self.show_alert(f"Debes seleccionar al menos un\ncomponente del estante de\ncomponentes {shelf_name} para continuar.")
-                            elif len(selected_internals_without_motherboard) < min_internal_required:
-                                if self.computer_type == "desktop":
-                                    self.show_alert("Debes seleccionar al menos 2\ncomponentes INTERNOS adicionales\n(además de la tarjeta madre)\npara continuar.")
-                                else:
-                                    self.show_alert("Debes seleccionar al menos un\ncomponente del estante de\ncomponentes INTERNOS para continuar.")
-                            elif not selected_externals:
-                                self.show_alert("Debes seleccionar al menos un\ncomponente del estante de\ncomponentes EXTERNOS para continuar.")
+                            check = validate_selection(self.selection.names(), self.computer_type,
+                                                       "internos" if self.show_internal else "externos")
+                            if not check.ok:
+                                self.show_alert(check.message)
                             else:
-                                final_selected_names = [card.name for card in selected_internals + selected_externals]
-                                print(f"Boton 'Continuar Ensamble' presionado. Todos los componentes requeridos seleccionados: {final_selected_names}")
+                                final_selected_names = self.selection.names()
+                                logger.info("Continuar ensamble con: %s", final_selected_names)
                                 running = False
                                 action_result = {"action": "proceed_to_worktable", "selected_components": final_selected_names}
                         else:
                             # Manejar clics en tarjetas de componentes
-                            components = self.internal_components if self.show_internal else self.external_components
-                            for card in components:
-                                if card.button_rect.collidepoint(event.pos):
-                                    self.handle_card_click(card)
-                                    break
+                            button_index = self.internal_button_index if self.show_internal else self.external_button_index
+                            card = button_index.item_at(event.pos)
+                            if card is not None:
+                                self.handle_card_click(card)
+            
+            PROFILER.lap("events")
             
             self.draw()
+            PROFILER.draw_hud(self.screen)
             pygame.display.flip() # Asegurarse que se actualiza el display en este bucle
+            PROFILER.lap("flip")
+            input_source.tick(clock, 60)
+            PROFILER.end_frame()
         
         return action_result
 
@@ -583,13 +574,3 @@ class EstanteScreen:
         # a lo que el main.py ANTES esperaba (un booleano)
         result = self.run_logic()
         return result["action"] == "back_to_selection"
-
-    def auto_select_motherboard(self):
-        """Selecciona automáticamente ASUS Prime B550M"""
-        for card in self.internal_components:
-            if card.name == "ASUS Prime B550M":
-                card.selected = True
-                if card.name not in self.selected_components:
-                    self.selected_components.append(card.name)
-                print(f"Componente seleccionado automáticamente: {card.name}")
-                break 
\ No newline at end of file
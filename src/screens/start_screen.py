@@ -1,4 +1,10 @@
 import pygame
+from utils.assets import IMAGE_CACHE, IMAGE_DECODED_EVENT, load_asset
+from utils.frame_scheduler import FrameScheduler
+from utils.gradients import get_vertical_gradient
+from utils.fonts import get_font
+from utils.text_cache import render_text
+from utils import input_source
 
 class StartScreen:
     """Pantalla de bienvenida del simulador de computadoras"""
@@ -18,51 +24,41 @@ class StartScreen:
         self.button_hover = (29, 78, 216)    # Azul hover
         
         # Fuentes con tamaños específicos
-        self.title_font = pygame.font.Font(None, 64)
-        self.subtitle_font = pygame.font.Font(None, 32)
-        self.button_font = pygame.font.Font(None, 28)
+        self.title_font = get_font(64)
+        self.subtitle_font = get_font(32)
+        self.button_font = get_font(28)
         
         # Cargar y escalar logo
         try:
-            self.logo = pygame.image.load("../src/assets/images/logo.png").convert_alpha()
             # Escalar logo si es necesario
             logo_width, logo_height = 200, 150  # Tamaño deseado
-            self.logo = pygame.transform.scale(self.logo, (logo_width, logo_height))
+            self.logo = load_asset("logo", (logo_width, logo_height))
         except:
             # Crear logo placeholder si no se puede cargar
             self.logo = pygame.Surface((200, 150))
             self.logo.fill((100, 150, 200))
             # Agregar texto "LOGO" al placeholder
-            font = pygame.font.Font(None, 48)
-            text = font.render("LOGO", True, (255, 255, 255))
+            font = get_font(48)
+            text = render_text(font, "LOGO", True, (255, 255, 255))
             text_rect = text.get_rect(center=(100, 75))
             self.logo.blit(text, text_rect)
         
         # Textos principales
-        self.title_text = self.title_font.render("Simulador de Computadoras", True, self.text_color)
-        self.subtitle_text = self.subtitle_font.render("Aprende armando paso a paso", True, self.secondary_color)
+        self.title_text = render_text(self.title_font, "Simulador de Computadoras", True, self.text_color)
+        self.subtitle_text = render_text(self.subtitle_font, "Aprende armando paso a paso", True, self.secondary_color)
         
         # Configuración del botón principal
         self.button_rect = pygame.Rect(0, 0, 320, 65)
         self.button_rect.centerx = self.width // 2
         self.button_rect.y = 480
-        self.button_text = self.button_font.render("Iniciar Simulacion", True, self.text_color)
+        self.button_text = render_text(self.button_font, "Iniciar Simulacion", True, self.text_color)
         
         # Estado del botón para hover
         self.button_hovered = False
     
     def draw_gradient_rect(self, rect, color1, color2):
-        """Dibuja un rectángulo con gradiente vertical"""
-        for y in range(rect.height):
-            # Interpolar entre los dos colores
-            ratio = y / rect.height
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            
-            pygame.draw.line(self.screen, (r, g, b), 
-                           (rect.x, rect.y + y), 
-                           (rect.x + rect.width, rect.y + y))
+        """Dibuja un rectángulo con gradiente vertical (generado una vez y cacheado)"""
+        self.screen.blit(get_vertical_gradient(rect.size, color1, color2), rect.topleft)
     
     def draw_shadow(self, rect, offset=5):
         """Dibuja una sombra suave para el botón"""
@@ -105,25 +101,45 @@ class StartScreen:
         
         pygame.display.flip()
 
+    def reset(self):
+        """Restablece el estado mutable al reutilizar la pantalla"""
+        self.button_hovered = False
+
+    def update_hover(self, mouse_pos):
+        """Actualiza el estado hover; devuelve True si cambió"""
+        hovered = self.button_rect.collidepoint(mouse_pos)
+        changed = hovered != self.button_hovered
+        self.button_hovered = hovered
+        return changed
+
     def run(self):
         """Maneja los eventos y la lógica principal de la pantalla"""
         running = True
         start_simulation = False
+        scheduler = FrameScheduler(fps=60)
+        self.update_hover(input_source.get_mouse_pos())
         
         while running:
-            # Detectar hover del botón
-            mouse_pos = pygame.mouse.get_pos()
-            self.button_hovered = self.button_rect.collidepoint(mouse_pos)
-            
-            self.draw()
-            
-            # Procesar eventos
-            for event in pygame.event.get():
+            # Procesar eventos (bloquea si no hay nada que redibujar)
+            events = scheduler.get_events()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if self.button_rect.collidepoint(event.pos):
                         start_simulation = True
                         running = False
+                elif event.type == IMAGE_DECODED_EVENT:
+                    # Mientras se muestra el inicio, convertir lo que la precarga ya decodificó
+                    IMAGE_CACHE.adopt_preloaded()
+            
+            # Detectar hover del botón solo cuando hubo entrada
+            if events and self.update_hover(input_source.get_mouse_pos()):
+                scheduler.request_redraw()
+            
+            if running and scheduler.needs_redraw():
+                self.draw()
+                scheduler.frame_drawn()
+            scheduler.tick()
                         
         return start_simulation
\ No newline at end of file
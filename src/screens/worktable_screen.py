@@ -1,4 +1,20 @@
 import pygame
+from model.assembly import SlotBoard
+from model.catalog import get_catalog
+from model.component_set import ComponentSet
+from model.validation import evaluate_boot
+from utils.assets import load_asset
+from utils.fonts import get_font
+from utils.text_cache import render_text
+from utils.dirty_rects import DirtyRectTracker
+from utils.hit_index import HitIndex
+from utils.surface_pool import get_filled_surface, get_rounded_rect_surface, surface_bytes
+from utils import input_source
+from utils.profiler import PROFILER
+from utils.timer_wheel import call_later
+from utils.log import get_logger
+
+logger = get_logger(__name__)
 
 # --- Colores y Fuentes (pueden moverse a un archivo de configuración después) ---
 BG_COLOR = (229, 231, 235)  # Gris claro de fondo
@@ -21,25 +37,32 @@ BUTTON_TEXT_COLOR = (255, 255, 255)
 ALERT_BG_COLOR = (0, 0, 0, 180) # Fondo oscuro semi-transparente para alerta
 ALERT_TEXT_COLOR = (255, 255, 255)
 ALERT_BOX_COLOR = (75, 75, 75) # Color del recuadro de la alerta
-
-pygame.font.init() # Asegurar que las fuentes estén inicializadas
-TITLE_FONT = pygame.font.Font(None, 30)
-SIDEBAR_FONT = pygame.font.Font(None, 26)
-MINI_CARD_FONT = pygame.font.Font(None, 18) # Un poco más grande para el nombre en la tarjeta
-SLOT_NAME_FONT = pygame.font.Font(None, 20) # Para el nombre del slot (RAM, CPU)
-BUTTON_FONT = pygame.font.Font(None, 22)
-ALERT_FONT = pygame.font.Font(None, 28)
-ALERT_MESSAGE_FONT = pygame.font.Font(None, 24)
+BUTTON_PENDING_COLOR = (107, 114, 128) # Continuar mientras faltan componentes (sigue mostrando la alerta)
+PROGRESS_TRACK_COLOR = (209, 213, 219)
+PROGRESS_FILL_COLOR = (34, 197, 94)
+PROGRESS_TEXT_COLOR = (55, 65, 81)
+
+# Tamaños de fuente; get_font() crea cada fuente la primera vez que se dibuja
+TITLE_FONT_SIZE = 30
+SIDEBAR_FONT_SIZE = 26
+MINI_CARD_FONT_SIZE = 18 # Un poco más grande para el nombre en la tarjeta
+SLOT_NAME_FONT_SIZE = 20 # Para el nombre del slot (RAM, CPU)
+BUTTON_FONT_SIZE = 22
+PROGRESS_FONT_SIZE = 18
+
+MESSAGE_DELAY_MS = 3000 # Pantallas de encendido: espera entre encender y mostrar el resultado
+ALERT_FONT_SIZE = 28
+ALERT_MESSAGE_FONT_SIZE = 24
 
 class MiniCardComponent:
     """Representa un componente arrastrable que se mueve de la sidebar a un slot."""
-    def __init__(self, id_name, display_name, image_path, initial_pos_in_sidebar, target_slot_id, card_size=(170, 95), image_render_size=(80,60)):
+    def __init__(self, id_name, display_name, asset_name, initial_pos_in_sidebar, target_slot_id, board, card_size=(170, 95), image_render_size=(80,60)):
         self.id_name = id_name
         self.display_name = display_name
         # Cargar imagen
+        self.image_original = None  # Solo existe si la imagen es un placeholder propio
         try:
-            self.image_original = pygame.image.load(image_path).convert_alpha()
-            self.image = pygame.transform.scale(self.image_original, image_render_size)
+            self.image = load_asset(asset_name, image_render_size)
         except:
             # Crear imagen placeholder si no se puede cargar
             self.image_original = pygame.Surface((100, 100))
@@ -51,13 +74,26 @@ class MiniCardComponent:
         
         self.initial_pos_in_sidebar = initial_pos_in_sidebar
         self.target_slot_id = target_slot_id
+        self.board = board # Estado de ocupación (model.assembly.SlotBoard)
         
         self.is_dragging = False
-        self.is_placed = False # True si está en un slot, False si está en la sidebar (o siendo arrastrada desde ella)
-        self.current_slot_id = None # Guarda el ID del slot si está colocada
         self.offset_x = 0
         self.offset_y = 0
 
+    def cached_bytes(self):
+        """Bytes del placeholder propio (la imagen del catálogo es compartida y no cuenta)"""
+        return surface_bytes(self.image_original, self.image) if self.image_original is not None else 0
+
+    @property
+    def is_placed(self):
+        """True si está en un slot, False si está en la sidebar (o siendo arrastrada desde ella)"""
+        return self.board.is_placed(self.id_name)
+
+    @property
+    def current_slot_id(self):
+        """ID del slot donde está colocada (None si no lo está)"""
+        return self.board.slot_of(self.id_name)
+
     def draw(self, screen):
         # La tarjeta se dibuja en su self.rect actual (sea en sidebar, arrastrada, o en slot)
         pygame.draw.rect(screen, MINI_CARD_BG, self.rect, border_radius=6)
@@ -66,11 +102,11 @@ class MiniCardComponent:
         img_rect = self.image.get_rect(centerx=self.rect.centerx, top=self.rect.top + 8)
         screen.blit(self.image, img_rect)
         
-        text_surf = MINI_CARD_FONT.render(self.display_name, True, MINI_CARD_TEXT_COLOR)
+        text_surf = render_text(get_font(MINI_CARD_FONT_SIZE), self.display_name, True, MINI_CARD_TEXT_COLOR)
         text_rect = text_surf.get_rect(centerx=self.rect.centerx, bottom=self.rect.bottom - 8)
         screen.blit(text_surf, text_rect)
 
-    def handle_event(self, event, worktable_slots):
+    def handle_event(self, event, slot_index):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.rect.collidepoint(event.pos):
                 # Si se hace clic en una tarjeta (esté en sidebar o en un slot)
@@ -79,35 +115,23 @@ class MiniCardComponent:
                 self.offset_y = self.rect.y - event.pos[1]
                 
                 # Si estaba colocada, quitarla del slot actual
-                if self.is_placed and self.current_slot_id:
-                    for slot in worktable_slots:
-                        if slot.id_name == self.current_slot_id:
-                            slot.remove_component()
-                            break
-                    self.is_placed = False
-                    self.current_slot_id = None
+                self.board.remove(self.id_name)
                 return True 
 
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1 and self.is_dragging:
                 self.is_dragging = False
                 placed_in_slot = False
-                for slot in worktable_slots:
-                    if slot.id_name == self.target_slot_id and slot.rect.colliderect(self.rect) and not slot.is_occupied():
-                        self.rect.center = slot.rect.center
-                        self.is_placed = True
-                        self.current_slot_id = slot.id_name
-                        slot.place_component(self.id_name)
-                        print(f"Componente {self.display_name} colocado en slot {slot.display_name_on_slot}")
-                        placed_in_slot = True
-                        break
+                slot = slot_index.get(self.target_slot_id)  # Solo el slot correcto puede recibirla
+                if slot is not None and slot.rect.colliderect(self.rect) and self.board.place(self.id_name, slot.id_name):
+                    self.rect.center = slot.rect.center
+                    logger.debug("Componente %s colocado en slot %s", self.display_name, slot.display_name_on_slot)
+                    placed_in_slot = True
                 
                 if not placed_in_slot:
                     # Si no se colocó en un slot válido, o el slot estaba ocupado, o no era el correcto,
                     # regresa a su posición inicial en la sidebar.
                     self.rect.topleft = self.initial_pos_in_sidebar
-                    self.is_placed = False # Asegurar que se marca como no colocada si regresa a sidebar
-                    self.current_slot_id = None
                 return True
 
         elif event.type == pygame.MOUSEMOTION:
@@ -119,48 +143,140 @@ class MiniCardComponent:
 
 class DropSlot:
     """Representa una ranura en el esquema de la laptop."""
-    def __init__(self, id_name, display_name_on_slot, rect_on_laptop_scheme, accepted_component_id):
+    def __init__(self, id_name, display_name_on_slot, rect_on_laptop_scheme, accepted_component_id, board):
         self.id_name = id_name
         self.display_name_on_slot = display_name_on_slot # Texto que se muestra en la ranura (RAM, CPU)
         self.rect = rect_on_laptop_scheme
         self.accepted_component_id = accepted_component_id # El id_name de la MiniCardComponent que acepta
-        self.occupied_by_component_id = None
+        self.board = board
+        board.add_slot(id_name, accepted_component_id)
+
+    @property
+    def occupied_by_component_id(self):
+        return self.board.occupant(self.id_name)
 
     def is_occupied(self):
-        return self.occupied_by_component_id is not None
+        return self.board.is_occupied(self.id_name)
 
     def place_component(self, component_id):
-        self.occupied_by_component_id = component_id
+        return self.board.place(component_id, self.id_name)
 
     def remove_component(self):
-        self.occupied_by_component_id = None
+        component_id = self.board.occupant(self.id_name)
+        if component_id is not None:
+            self.board.remove(component_id)
 
     def draw(self, screen, is_hovering_with_correct_item=False):
         current_fill = SLOT_FILL_COLOR_EMPTY
         if is_hovering_with_correct_item and not self.is_occupied():
             current_fill = SLOT_FILL_COLOR_HOVER
         
-        slot_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-        slot_surface.fill(current_fill)
-        screen.blit(slot_surface, self.rect.topleft)
+        screen.blit(get_filled_surface(self.rect.size, current_fill), self.rect.topleft)
 
         if not self.is_occupied(): # Solo mostrar nombre del slot si está vacío
-            text_surf = SLOT_NAME_FONT.render(self.display_name_on_slot, True, SLOT_TEXT_COLOR)
+            text_surf = render_text(get_font(SLOT_NAME_FONT_SIZE), self.display_name_on_slot, True, SLOT_TEXT_COLOR)
             text_rect = text_surf.get_rect(center=self.rect.center)
             screen.blit(text_surf, text_rect)
             
         pygame.draw.rect(screen, SLOT_OUTLINE_COLOR, self.rect, 1, border_radius=4)
 
+def _build_slot_index(slots):
+    """Índice de slots por id y por posición"""
+    index = HitIndex()
+    for slot in slots:
+        index.add(slot.id_name, slot, slot.rect)
+    return index
+
+def _build_card_index(cards):
+    """Índice de mini-tarjetas por id y por posición (se actualiza al moverlas)"""
+    index = HitIndex()
+    for card in cards:
+        index.add(card.id_name, card, card.rect)
+    return index
+
+def _hover_slot(dragged_card, slot_index, mouse_pos):
+    """Único slot que puede resaltarse: el destino de la tarjeta arrastrada, si está bajo el mouse"""
+    if dragged_card is None:
+        return None
+    slot = slot_index.get(dragged_card.target_slot_id)
+    return slot if slot is not None and slot.rect.collidepoint(mouse_pos) else None
+
+def _wrap_names(font, names, max_width):
+    """Lista "a, b, c." partida en líneas de hasta max_width sin cortar ningún nombre"""
+    lines = []
+    current = ""
+    for i, name in enumerate(names):
+        item = name + ("." if i == len(names) - 1 else ",")
+        candidate = f"{current} {item}" if current else item
+        if current and font.size(candidate)[0] > max_width:
+            lines.append(current)
+            current = item
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+class PlacementProgress:
+    """Barra "Colocados n/m" junto a Continuar.
+    Escucha al tablero: la superficie y el estado de Continuar solo cambian cuando se coloca o quita algo."""
+    HEIGHT = 35
+
+    def __init__(self, board, continue_button_rect, label="Colocados"):
+        self.rect = pygame.Rect(0, 0, 190, self.HEIGHT)
+        self.rect.midright = (continue_button_rect.left - 15, continue_button_rect.centery)
+        self.label = label
+        self.placed = board.placed
+        self.total = board.total
+        self._surface = None
+        board.subscribe(self._on_change)
+
+    def _on_change(self, change):
+        self.placed = change.placed
+        self.total = change.total
+        self._surface = None
+
+    def cached_bytes(self):
+        return surface_bytes(self._surface)
+
+    @property
+    def ready(self):
+        """Continuar habilitado: todo colocado"""
+        return self.placed == self.total
+
+    @property
+    def state(self):
+        return (self.placed, self.total)
+
+    def draw(self, screen):
+        if self._surface is None:
+            self._surface = self._render()
+        screen.blit(self._surface, self.rect.topleft)
+
+    def _render(self):
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        track = pygame.Rect(0, self.rect.height - 10, self.rect.width, 10)
+        pygame.draw.rect(surface, PROGRESS_TRACK_COLOR, track, border_radius=5)
+        if self.placed:
+            fill = track.copy()
+            fill.width = max(10, round(track.width * self.placed / self.total))
+            pygame.draw.rect(surface, PROGRESS_FILL_COLOR, fill, border_radius=5)
+        text_surf = render_text(get_font(PROGRESS_FONT_SIZE), f"{self.label} {self.placed}/{self.total}", True, PROGRESS_TEXT_COLOR)
+        surface.blit(text_surf, text_surf.get_rect(midtop=(self.rect.width // 2, 2)))
+        return surface
+
 class WorktableScreen:
     """Pantalla de la mesa de trabajo con un esquema de Laptop dibujado."""
-    def __init__(self, screen, computer_type, selected_component_names):
+    def __init__(self, screen, computer_type, selected_component_names, dirty_rects=False):
         self.screen = screen
+        # Modo opcional de rectángulos sucios (None = frame completo con flip)
+        self.dirty_tracker = DirtyRectTracker(screen) if dirty_rects else None
         self.width = screen.get_width()
         self.height = screen.get_height()
         self.computer_type = computer_type
-        # Guardamos una copia para poder devolverla intacta si se presiona "Atrás"
-        self.initial_selected_components = list(selected_component_names) 
-        self.selected_component_names = selected_component_names # Esta lista podría modificarse si permitimos quitar componentes
+        # ComponentSet es inmutable: se devuelve intacto si se presiona "Atrás"
+        self.selected_component_names = ComponentSet(selected_component_names)
+        self.initial_selected_components = self.selected_component_names
 
         self.laptop_scheme_width = self.width * 0.65
         self.laptop_scheme_height = self.height * 0.85 # Un poco más alto el chasis
@@ -174,10 +290,16 @@ class WorktableScreen:
         self.sidebar_width = self.width * 0.3 - 50
         self.sidebar_x_start = self.width - self.sidebar_width - 10
 
+        self.board = SlotBoard() # Ocupación de slots (modelo sin pygame)
+
         self.slots = []
         self.mini_cards = [] # Todas las mini-tarjetas, estén en sidebar o en slot
         self.currently_dragged_card = None
 
+        # Capa estática (chasis, tornillos, sidebar) compuesta una sola vez
+        self._background_layer = None
+        self._background_layer_key = None
+
         self._setup_laptop_scheme_and_components()
 
         # Botones y Alerta
@@ -194,6 +316,23 @@ class WorktableScreen:
         )
         
         self.alert_box_rect = pygame.Rect(0, 0, 400, 100) # Se centrará en draw
+        self.progress = PlacementProgress(self.board, self.continue_button_rect)
+
+    def cached_bytes(self):
+        """Bytes de la capa de fondo, la barra de progreso y las mini-tarjetas (presupuesto del ScreenManager)"""
+        return (surface_bytes(self._background_layer) + self.progress.cached_bytes()
+                + sum(card.cached_bytes() for card in self.mini_cards))
+
+    def reset(self, computer_type, selected_component_names):
+        """Restablece el estado mutable al reutilizar la pantalla (layout, slots y capas se conservan)"""
+        self.computer_type = computer_type
+        self.selected_component_names = ComponentSet(selected_component_names)
+        self.initial_selected_components = self.selected_component_names
+        self.currently_dragged_card = None
+        self._create_mini_cards() # También vacía los slots del tablero
+        self.show_alert = False
+        if self.dirty_tracker:
+            self.dirty_tracker.invalidate_all()
 
     def _setup_laptop_scheme_and_components(self):
         # El tamaño de los slots DEBE ser igual al de las MiniCardComponent
@@ -241,42 +380,88 @@ class WorktableScreen:
                 rel_coords[2], # Usar mini_card_w directamente
                 rel_coords[3]  # Usar mini_card_h directamente
             )
-            self.slots.append(DropSlot(id_name, display_name, abs_rect, accepted_id))
-
-        # Componentes de laptop (solo los 5 correctos)
-        laptop_component_defs = [
-            {"id": "RAM_1", "name": "RAM DDR4 8GB", "img": "assets/images/componentesInternos/ram.png", "slot": "SLOT_RAM"},
-            {"id": "CPU_1", "name": "Ryzen 7 5700X", "img": "assets/images/componentesInternos/cpu.png", "slot": "SLOT_CPU"},
-            {"id": "M2_1", "name": "M.2 NVMe SSD", "img": "assets/images/componentesInternos/m.2.png", "slot": "SLOT_M2"},
-            {"id": "SSD_1", "name": "Kingston SSD 1TB", "img": "assets/images/componentesInternos/ssd.png", "slot": "SLOT_SSD"},
-            {"id": "WIFI_1", "name": "Modulo Wi-Fi/BT", "img": "assets/images/componentesInternos/módulo Wi-Fi:Bluetooth.png", "slot": "SLOT_WIFI"}
-        ]
+            self.slots.append(DropSlot(id_name, display_name, abs_rect, accepted_id, self.board))
+
+        self.slot_index = _build_slot_index(self.slots)
+
+        # Componentes de laptop (solo los 5 correctos), tomados del catálogo
+        self.component_defs = get_catalog().slotted_for("laptop")
+        self.mini_card_size = (mini_card_w, mini_card_h)
+        self.mini_card_image_size = (img_in_card_w, img_in_card_h)
+        self._create_mini_cards()
+
+    def _create_mini_cards(self):
+        """Crea las mini-tarjetas de los componentes seleccionados, acomodadas en la sidebar"""
+        mini_card_w, mini_card_h = self.mini_card_size
+        img_in_card_w, img_in_card_h = self.mini_card_image_size
 
         sidebar_item_y = 100
         sidebar_item_spacing = 10
         self.mini_cards = [] # Limpiar antes de recrear
-        for comp_def in laptop_component_defs:
-            if comp_def["name"] in self.selected_component_names:
+        for comp_def in self.component_defs:
+            if comp_def.name in self.selected_component_names:
                 pos_x = self.sidebar_x_start + (self.sidebar_width - mini_card_w) // 2
                 pos_y = sidebar_item_y
                 mini_card = MiniCardComponent(
-                    comp_def["id"], comp_def["name"], comp_def["img"],
-                    (pos_x, pos_y), comp_def["slot"], 
+                    comp_def.id, comp_def.name, comp_def.id,
+                    (pos_x, pos_y), comp_def.slot, self.board,
                     card_size=(mini_card_w, mini_card_h), 
                     image_render_size=(img_in_card_w, img_in_card_h)
                 )
                 self.mini_cards.append(mini_card)
                 sidebar_item_y += mini_card.card_height + sidebar_item_spacing
 
+        self.board.set_components([card.id_name for card in self.mini_cards])
+        self.card_index = _build_card_index(self.mini_cards)
+
+    def _track_dirty_regions(self, mouse_pos):
+        """Registra los elementos dinámicos para el modo de rectángulos sucios"""
+        tracker = self.dirty_tracker
+        tracker.track("alert", self.screen.get_rect(), self.show_alert)
+        if PROFILER.hud_visible:
+            tracker.track("profiler_hud", PROFILER.hud_rect, PROFILER.refresh_hud(self.screen))
+        for card in self.mini_cards:
+            tracker.track(("card", card.id_name), card.rect)
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
+        for slot in self.slots:
+            tracker.track(("slot", slot.id_name), slot.rect, (slot is hover_slot, slot.is_occupied()))
+        tracker.track("progress", self.progress.rect, self.progress.state)
+        for name, rect in (("back", self.back_button_rect), ("continue", self.continue_button_rect)):
+            tracker.track(("button", name), rect, (rect.collidepoint(mouse_pos) and not self.show_alert, self.progress.ready))
+
+    def _present_frame(self, mouse_pos):
+        """Dibuja el frame completo, o solo las regiones sucias si el modo está activo"""
+        if self.dirty_tracker is None:
+            self.draw(mouse_pos)
+            PROFILER.draw_hud(self.screen)
+            pygame.display.flip()
+        else:
+            self._track_dirty_regions(mouse_pos)
+            PROFILER.lap("dirty_tracking")
+            self.dirty_tracker.present(lambda: self._draw_with_hud(mouse_pos))
+        PROFILER.lap("flip")
+
+    def _draw_with_hud(self, mouse_pos):
+        self.draw(mouse_pos)
+        PROFILER.draw_hud(self.screen)
+
     def run(self):
         running = True
         clock = pygame.time.Clock()
         action_to_return = {"action": "back_to_selection", "selected_components": self.initial_selected_components} # Valor por defecto
 
+        PROFILER.set_screen(type(self).__name__)
+
         while running:
-            mouse_pos = pygame.mouse.get_pos()
+            PROFILER.mark()
+            mouse_pos = input_source.get_mouse_pos()
             
-            for event in pygame.event.get():
+            for event in input_source.get_events():
+                if self.dirty_tracker:
+                    self.dirty_tracker.process_event(event)
+                if PROFILER.handle_event(event) and self.dirty_tracker:
+                    self.dirty_tracker.invalidate_all()
+
                 if event.type == pygame.QUIT:
                     running = False
                     action_to_return = {"action": "quit"}
@@ -295,62 +480,63 @@ class WorktableScreen:
                         break 
                     
                     elif self.continue_button_rect.collidepoint(mouse_pos):
-                        all_placed = True
-                        if not self.mini_cards: # Si no hay tarjetas para colocar
-                            all_placed = True
-                        else:
-                            for card in self.mini_cards:
-                                if not card.is_placed:
-                                    all_placed = False
-                                    break
-                        
-                        if all_placed:
-                            print("Todos los componentes colocados. Procediendo...")
+                        if self.board.is_complete:
+                            logger.info("Todos los componentes colocados")
                             running = False
                             action_to_return = {"action": "assembly_complete"} # O el siguiente paso
                             break
                         else:
                             self.show_alert = True
-                            print("Alerta: Faltan componentes por colocar.")
+                            logger.debug("Alerta: faltan componentes por colocar")
                         # No 'break' aquí para que el resto de la lógica de arrastre no se salte si se muestra la alerta
 
                 # Lógica de arrastrar y soltar tarjetas
                 if not self.show_alert : # Solo procesar arrastre si la alerta no está visible
                     if self.currently_dragged_card:
-                        if self.currently_dragged_card.handle_event(event, self.slots):
+                        if self.currently_dragged_card.handle_event(event, self.slot_index):
+                            self.card_index.update(self.currently_dragged_card.id_name, self.currently_dragged_card.rect)
                             if not self.currently_dragged_card.is_dragging:
                                 self.currently_dragged_card = None
                             # No 'continue' aquí necesariamente, podría haber otros eventos.
                             # El 'handle_event' de la tarjeta devuelve True si manejó el evento.
 
                     elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1: # No es 'else', es independiente
-                        for card in self.mini_cards:
-                            if card.rect.collidepoint(mouse_pos):
-                                can_drag_this = True
-                                if not card.is_placed:
-                                    for slot_check in self.slots:
-                                        if slot_check.id_name == card.target_slot_id and slot_check.is_occupied():
-                                            can_drag_this = False
-                                            break
-                                if can_drag_this:
-                                    if card.handle_event(event, self.slots):
-                                        self.currently_dragged_card = card
-                                        break 
+                        for card in self.card_index.items_at(mouse_pos):
+                            can_drag_this = True
+                            if not card.is_placed:
+                                target_slot = self.slot_index.get(card.target_slot_id)
+                                if target_slot is not None and target_slot.is_occupied():
+                                    can_drag_this = False
+                            if can_drag_this:
+                                if card.handle_event(event, self.slot_index):
+                                    self.currently_dragged_card = card
+                                    break
             if not running: # Si un botón causó la salida, salir del bucle principal
                 break
 
-            self.draw(mouse_pos)
-            pygame.display.flip()
-            clock.tick(60)
+            PROFILER.lap("events")
+            self._present_frame(mouse_pos)
+            input_source.tick(clock, 60)
+            PROFILER.end_frame()
         
         return action_to_return
 
-    def draw(self, mouse_pos):
-        self.screen.fill(BG_COLOR)
+    def _get_background_layer(self):
+        """Devuelve la capa estática; solo se reconstruye si cambia el layout"""
+        layout_key = (self.width, self.height, tuple(self.laptop_scheme_rect), self.sidebar_x_start, self.sidebar_width)
+        if self._background_layer is None or self._background_layer_key != layout_key:
+            self._background_layer = self._build_background_layer()
+            self._background_layer_key = layout_key
+        return self._background_layer
+
+    def _build_background_layer(self):
+        """Compone una vez el fondo, el chasis, los tornillos, el área de pantalla y la sidebar"""
+        layer = pygame.Surface((self.width, self.height)).convert()
+        layer.fill(BG_COLOR)
         
         # Dibujar el chasis principal de la laptop
-        pygame.draw.rect(self.screen, LAPTOP_CHASSIS_COLOR, self.laptop_scheme_rect, border_radius=15)
-        pygame.draw.rect(self.screen, (100,100,100), self.laptop_scheme_rect, 3, border_radius=15)
+        pygame.draw.rect(layer, LAPTOP_CHASSIS_COLOR, self.laptop_scheme_rect, border_radius=15)
+        pygame.draw.rect(layer, (100,100,100), self.laptop_scheme_rect, 3, border_radius=15)
         
         # Agregar tornillos en las esquinas (círculos pequeños)
         screw_radius = 4
@@ -358,43 +544,46 @@ class WorktableScreen:
         screw_offset = 15  # Distancia desde la esquina
         
         # Tornillo esquina superior izquierda
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.laptop_scheme_rect.left + screw_offset, 
                            self.laptop_scheme_rect.top + screw_offset), screw_radius)
         
         # Tornillo esquina superior derecha
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.laptop_scheme_rect.right - screw_offset, 
                            self.laptop_scheme_rect.top + screw_offset), screw_radius)
         
         # Tornillo esquina inferior izquierda
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.laptop_scheme_rect.left + screw_offset, 
                            self.laptop_scheme_rect.bottom - screw_offset), screw_radius)
         
         # Tornillo esquina inferior derecha
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.laptop_scheme_rect.right - screw_offset, 
                            self.laptop_scheme_rect.bottom - screw_offset), screw_radius)
         
         # Área de pantalla
         screen_area_rect = pygame.Rect(self.laptop_scheme_rect.x + 20, self.laptop_scheme_rect.y + 20, self.laptop_scheme_rect.width - 40, self.laptop_scheme_rect.height * 0.1)
-        pygame.draw.rect(self.screen, LAPTOP_SCREEN_AREA_COLOR, screen_area_rect, border_radius=5)
-
-        for slot in self.slots:
-            is_hovering_correct = False
-            if self.currently_dragged_card and \
-               self.currently_dragged_card.target_slot_id == slot.id_name and \
-               slot.rect.collidepoint(mouse_pos):
-                is_hovering_correct = True
-            slot.draw(self.screen, is_hovering_correct)
+        pygame.draw.rect(layer, LAPTOP_SCREEN_AREA_COLOR, screen_area_rect, border_radius=5)
 
         sidebar_display_rect = pygame.Rect(self.sidebar_x_start, 0, self.sidebar_width, self.height)
-        pygame.draw.rect(self.screen, SIDEBAR_BG_COLOR, sidebar_display_rect)
-        pygame.draw.line(self.screen, MINI_CARD_BORDER, (self.sidebar_x_start, 0), (self.sidebar_x_start, self.height), 2)
-        sidebar_title_surface = SIDEBAR_FONT.render("Componentes", True, SIDEBAR_TITLE_COLOR)
+        pygame.draw.rect(layer, SIDEBAR_BG_COLOR, sidebar_display_rect)
+        pygame.draw.line(layer, MINI_CARD_BORDER, (self.sidebar_x_start, 0), (self.sidebar_x_start, self.height), 2)
+        sidebar_title_surface = render_text(get_font(SIDEBAR_FONT_SIZE), "Componentes", True, SIDEBAR_TITLE_COLOR)
         sidebar_title_rect = sidebar_title_surface.get_rect(centerx=sidebar_display_rect.centerx, top=sidebar_display_rect.top + 40)
-        self.screen.blit(sidebar_title_surface, sidebar_title_rect)
+        layer.blit(sidebar_title_surface, sidebar_title_rect)
+        return layer
+
+    def draw(self, mouse_pos):
+        # Elementos estáticos pre-renderizados en una sola capa
+        self.screen.blit(self._get_background_layer(), (0, 0))
+        PROFILER.lap("background")
+
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
+        for slot in self.slots:
+            slot.draw(self.screen, slot is hover_slot)
+        PROFILER.lap("slots")
 
         # Dibujar todas las Mini-Tarjetas (su posición es manejada por is_placed y dragging)
         for card in self.mini_cards:
@@ -407,10 +596,12 @@ class WorktableScreen:
             elif card.is_placed and self.currently_dragged_card != card: # Dibujarla en su slot si está colocada y no se está arrastrando
                  card.draw(self.screen)
         
+        PROFILER.lap("cards")
+
         # El componente arrastrado activamente ya se dibuja por su propio método draw 
         # si está en la lista self.mini_cards y su self.rect se actualiza.
 
-        title_surface = TITLE_FONT.render(f"Mesa de trabajo - {self.computer_type.capitalize()}", True, TITLE_TEXT_COLOR)
+        title_surface = render_text(get_font(TITLE_FONT_SIZE), f"Mesa de trabajo - {self.computer_type.capitalize()}", True, TITLE_TEXT_COLOR)
         title_bg_width = title_surface.get_width() + 40
         title_bg_rect = pygame.Rect((self.width - title_bg_width) // 2, 20, title_bg_width, 40)
         # Ajustar para que no choque con el botón "Atrás" si el título es muy ancho
@@ -429,52 +620,57 @@ class WorktableScreen:
         # Botón Atrás
         back_btn_color = BUTTON_HOVER_COLOR if self.back_button_rect.collidepoint(mouse_pos) and not self.show_alert else BUTTON_COLOR
         pygame.draw.rect(self.screen, back_btn_color, self.back_button_rect, border_radius=6)
-        back_text_surf = BUTTON_FONT.render("Atrás", True, BUTTON_TEXT_COLOR)
+        back_text_surf = render_text(get_font(BUTTON_FONT_SIZE), "Atrás", True, BUTTON_TEXT_COLOR)
         back_text_rect = back_text_surf.get_rect(center=self.back_button_rect.center)
         self.screen.blit(back_text_surf, back_text_rect)
 
         # Botón Continuar
-        cont_btn_color = BUTTON_HOVER_COLOR if self.continue_button_rect.collidepoint(mouse_pos) and not self.show_alert else BUTTON_COLOR
+        cont_btn_color = BUTTON_COLOR if self.progress.ready else BUTTON_PENDING_COLOR
+        if self.continue_button_rect.collidepoint(mouse_pos) and not self.show_alert:
+            cont_btn_color = BUTTON_HOVER_COLOR
         pygame.draw.rect(self.screen, cont_btn_color, self.continue_button_rect, border_radius=6)
-        cont_text_surf = BUTTON_FONT.render("Continuar", True, BUTTON_TEXT_COLOR)
+        cont_text_surf = render_text(get_font(BUTTON_FONT_SIZE), "Continuar", True, BUTTON_TEXT_COLOR)
         cont_text_rect = cont_text_surf.get_rect(center=self.continue_button_rect.center)
         self.screen.blit(cont_text_surf, cont_text_rect)
+        self.progress.draw(self.screen)
+        PROFILER.lap("buttons")
         
         # Dibujar Alerta si está activa
         if self.show_alert:
             # Fondo semi-transparente sobre toda la pantalla
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill(ALERT_BG_COLOR)
-            self.screen.blit(overlay, (0,0))
+            self.screen.blit(get_filled_surface((self.width, self.height), ALERT_BG_COLOR), (0,0))
             
             # Caja de la alerta
             self.alert_box_rect.center = (self.width // 2, self.height // 2)
             pygame.draw.rect(self.screen, ALERT_BOX_COLOR, self.alert_box_rect, border_radius=10)
             pygame.draw.rect(self.screen, MINI_CARD_BORDER, self.alert_box_rect, 2, border_radius=10) # Borde
 
-            alert_title_surf = ALERT_FONT.render("Alerta", True, ALERT_TEXT_COLOR)
+            alert_title_surf = render_text(get_font(ALERT_FONT_SIZE), "Alerta", True, ALERT_TEXT_COLOR)
             alert_title_rect = alert_title_surf.get_rect(centerx=self.alert_box_rect.centerx, top=self.alert_box_rect.top + 15)
             self.screen.blit(alert_title_surf, alert_title_rect)
             
-            msg_surf = ALERT_MESSAGE_FONT.render(self.alert_message, True, ALERT_TEXT_COLOR)
+            msg_surf = render_text(get_font(ALERT_MESSAGE_FONT_SIZE), self.alert_message, True, ALERT_TEXT_COLOR)
             msg_rect = msg_surf.get_rect(centerx=self.alert_box_rect.centerx, top=alert_title_rect.bottom + 10)
             self.screen.blit(msg_surf, msg_rect)
             
-            dismiss_surf = MINI_CARD_FONT.render("(Haz clic para cerrar)", True, (200,200,200))
+            dismiss_surf = render_text(get_font(MINI_CARD_FONT_SIZE), "(Haz clic para cerrar)", True, (200,200,200))
             dismiss_rect = dismiss_surf.get_rect(centerx=self.alert_box_rect.centerx, bottom=self.alert_box_rect.bottom - 10)
             self.screen.blit(dismiss_surf, dismiss_rect) 
+        PROFILER.lap("alert")
 
 
 class WorktableDesktopScreen:
     """Pantalla de la mesa de trabajo con un esquema de Desktop/Torre dibujado."""
-    def __init__(self, screen, computer_type, selected_component_names):
+    def __init__(self, screen, computer_type, selected_component_names, dirty_rects=False):
         self.screen = screen
+        # Modo opcional de rectángulos sucios (None = frame completo con flip)
+        self.dirty_tracker = DirtyRectTracker(screen) if dirty_rects else None
         self.width = screen.get_width()
         self.height = screen.get_height()
         self.computer_type = computer_type
         # Guardamos una copia para poder devolverla intacta si se presiona "Atrás"
-        self.initial_selected_components = list(selected_component_names) 
-        self.selected_component_names = selected_component_names
+        self.selected_component_names = ComponentSet(selected_component_names)
+        self.initial_selected_components = self.selected_component_names
 
         # Hacer la torre un poco más pequeña para dar más espacio al sidebar
         self.desktop_scheme_width = self.width * 0.58  # Reducido de 0.65 a 0.58
@@ -490,10 +686,16 @@ class WorktableDesktopScreen:
         self.sidebar_width = self.width * 0.38 - 30  # Aumentado para acomodar más componentes
         self.sidebar_x_start = self.width - self.sidebar_width - 10
 
+        self.board = SlotBoard() # Ocupación de slots (modelo sin pygame)
+
         self.slots = []
         self.mini_cards = []
         self.currently_dragged_card = None
 
+        # Capa estática (chasis, motherboard, sidebar) compuesta una sola vez
+        self._background_layer = None
+        self._background_layer_key = None
+
         self._setup_desktop_scheme_and_components()
 
         # Botones y Alerta
@@ -510,6 +712,23 @@ class WorktableDesktopScreen:
         )
         
         self.alert_box_rect = pygame.Rect(0, 0, 400, 100)
+        self.progress = PlacementProgress(self.board, self.continue_button_rect)
+
+    def cached_bytes(self):
+        """Bytes de la capa de fondo, la barra de progreso y las mini-tarjetas (presupuesto del ScreenManager)"""
+        return (surface_bytes(self._background_layer) + self.progress.cached_bytes()
+                + sum(card.cached_bytes() for card in self.mini_cards))
+
+    def reset(self, computer_type, selected_component_names):
+        """Restablece el estado mutable al reutilizar la pantalla (layout, slots y capas se conservan)"""
+        self.computer_type = computer_type
+        self.selected_component_names = ComponentSet(selected_component_names)
+        self.initial_selected_components = self.selected_component_names
+        self.currently_dragged_card = None
+        self._create_mini_cards() # También vacía los slots del tablero
+        self.show_alert = False
+        if self.dirty_tracker:
+            self.dirty_tracker.invalidate_all()
 
     def _setup_desktop_scheme_and_components(self):
         # Tarjetas más pequeñas para acomodar 11 componentes
@@ -591,22 +810,20 @@ class WorktableDesktopScreen:
                 rel_coords[2],
                 rel_coords[3]
             )
-            self.slots.append(DropSlot(id_name, display_name, abs_rect, accepted_id))
+            self.slots.append(DropSlot(id_name, display_name, abs_rect, accepted_id, self.board))
+
+        self.slot_index = _build_slot_index(self.slots)
 
         # Componentes de Desktop corregidos con DVD SATA
-        desktop_component_defs = [
-            {"id": "GPU_1", "name": "NVIDIA RTX 3060", "img": "assets/images/componentesInternos/gpu.png", "slot": "SLOT_GPU"},
-            {"id": "RAM_1", "name": "RAM DDR4 8GB", "img": "assets/images/componentesInternos/ram.png", "slot": "SLOT_RAM"},
-            {"id": "CPU_1", "name": "Ryzen 7 5700X", "img": "assets/images/componentesInternos/cpu.png", "slot": "SLOT_CPU"},
-            {"id": "PSU_1", "name": "PSU 600W", "img": "assets/images/componentesInternos/Fuente de poder 600W.png", "slot": "SLOT_PSU"},
-            {"id": "HDD_1", "name": "HDD Seagate 1TB", "img": "assets/images/componentesInternos/HDD Seagate 1TB  .png", "slot": "SLOT_HDD"},
-            {"id": "WIFI_1", "name": "Modulo Wi-Fi/BT", "img": "assets/images/componentesInternos/módulo Wi-Fi:Bluetooth.png", "slot": "SLOT_WIFI"},
-            {"id": "FAN_1", "name": "Ventilador ARGB", "img": "assets/images/componentesInternos/Ventilador 120mm ARGB.png", "slot": "SLOT_FAN"},
-            {"id": "M2_1", "name": "M.2 NVMe SSD", "img": "assets/images/componentesInternos/m.2.png", "slot": "SLOT_M2"},
-            {"id": "COOLER_1", "name": "Cooler Master H212", "img": "assets/images/componentesInternos/Cooler Master Hyper 212.png", "slot": "SLOT_COOLER"},
-            {"id": "SSD_1", "name": "Kingston SSD 1TB", "img": "assets/images/componentesInternos/ssd.png", "slot": "SLOT_SSD"},
-            {"id": "DVD_1", "name": "DVD SATA", "img": "assets/images/componentesInternos/dvdsata.png", "slot": "SLOT_DVD"},
-        ]
+        self.component_defs = get_catalog().slotted_for("desktop")
+        self.mini_card_size = (mini_card_w, mini_card_h)
+        self.mini_card_image_size = (img_in_card_w, img_in_card_h)
+        self._create_mini_cards()
+
+    def _create_mini_cards(self):
+        """Crea las mini-tarjetas de los componentes seleccionados, acomodadas en la sidebar"""
+        mini_card_w, mini_card_h = self.mini_card_size
+        img_in_card_w, img_in_card_h = self.mini_card_image_size
 
         # Crear mini cards para componentes seleccionados distribuidas en dos columnas
         sidebar_item_y = 80
@@ -623,8 +840,8 @@ class WorktableDesktopScreen:
         self.mini_cards = []
         card_index = 0
         
-        for comp_def in desktop_component_defs:
-            if comp_def["name"] in self.selected_component_names:
+        for comp_def in self.component_defs:
+            if comp_def.name in self.selected_component_names:
                 # Determinar en qué columna va este componente
                 if card_index < cards_per_column:
                     # Primera columna
@@ -636,23 +853,65 @@ class WorktableDesktopScreen:
                     pos_y = sidebar_item_y + ((card_index - cards_per_column) * (mini_card_h + sidebar_item_spacing))
                 
                 mini_card = MiniCardComponent(
-                    comp_def["id"], comp_def["name"], comp_def["img"],
-                    (pos_x, pos_y), comp_def["slot"], 
+                    comp_def.id, comp_def.name, comp_def.id,
+                    (pos_x, pos_y), comp_def.slot, self.board,
                     card_size=(mini_card_w, mini_card_h), 
                     image_render_size=(img_in_card_w, img_in_card_h)
                 )
                 self.mini_cards.append(mini_card)
                 card_index += 1
 
+        self.board.set_components([card.id_name for card in self.mini_cards])
+        self.card_index = _build_card_index(self.mini_cards)
+
+    def _track_dirty_regions(self, mouse_pos):
+        """Registra los elementos dinámicos para el modo de rectángulos sucios"""
+        tracker = self.dirty_tracker
+        tracker.track("alert", self.screen.get_rect(), self.show_alert)
+        if PROFILER.hud_visible:
+            tracker.track("profiler_hud", PROFILER.hud_rect, PROFILER.refresh_hud(self.screen))
+        for card in self.mini_cards:
+            tracker.track(("card", card.id_name), card.rect)
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
+        for slot in self.slots:
+            tracker.track(("slot", slot.id_name), slot.rect, (slot is hover_slot, slot.is_occupied()))
+        tracker.track("progress", self.progress.rect, self.progress.state)
+        for name, rect in (("back", self.back_button_rect), ("continue", self.continue_button_rect)):
+            tracker.track(("button", name), rect, (rect.collidepoint(mouse_pos) and not self.show_alert, self.progress.ready))
+
+    def _present_frame(self, mouse_pos):
+        """Dibuja el frame completo, o solo las regiones sucias si el modo está activo"""
+        if self.dirty_tracker is None:
+            self.draw(mouse_pos)
+            PROFILER.draw_hud(self.screen)
+            pygame.display.flip()
+        else:
+            self._track_dirty_regions(mouse_pos)
+            PROFILER.lap("dirty_tracking")
+            self.dirty_tracker.present(lambda: self._draw_with_hud(mouse_pos))
+        PROFILER.lap("flip")
+
+    def _draw_with_hud(self, mouse_pos):
+        self.draw(mouse_pos)
+        PROFILER.draw_hud(self.screen)
+
     def run(self):
         running = True
         clock = pygame.time.Clock()
         action_to_return = {"action": "back_to_selection", "selected_components": self.initial_selected_components}
 
+        PROFILER.set_screen(type(self).__name__)
+
         while running:
-            mouse_pos = pygame.mouse.get_pos()
+            PROFILER.mark()
+            mouse_pos = input_source.get_mouse_pos()
             
-            for event in pygame.event.get():
+            for event in input_source.get_events():
+                if self.dirty_tracker:
+                    self.dirty_tracker.process_event(event)
+                if PROFILER.handle_event(event) and self.dirty_tracker:
+                    self.dirty_tracker.invalidate_all()
+
                 if event.type == pygame.QUIT:
                     running = False
                     action_to_return = {"action": "quit"}
@@ -671,7 +930,7 @@ class WorktableDesktopScreen:
                         break
                     elif self.continue_button_rect.collidepoint(mouse_pos):
                         # Verificar que todos los componentes estén conectados
-                        if self._all_components_connected():
+                        if self.board.is_complete:
                             action_to_return = {"action": "assembly_complete"}
                             running = False
                         else:
@@ -681,32 +940,43 @@ class WorktableDesktopScreen:
                 # Lógica de drag & drop usando el sistema existente
                 if not self.show_alert:
                     if self.currently_dragged_card:
-                        if self.currently_dragged_card.handle_event(event, self.slots):
+                        if self.currently_dragged_card.handle_event(event, self.slot_index):
+                            self.card_index.update(self.currently_dragged_card.id_name, self.currently_dragged_card.rect)
                             if not self.currently_dragged_card.is_dragging:
                                 self.currently_dragged_card = None
 
                     elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        for card in self.mini_cards:
-                            if card.rect.collidepoint(mouse_pos):
-                                if card.handle_event(event, self.slots):
-                                    self.currently_dragged_card = card
-                                    break
+                        for card in self.card_index.items_at(mouse_pos):
+                            if card.handle_event(event, self.slot_index):
+                                self.currently_dragged_card = card
+                                break
 
             if not running:
                 break
 
-            self.draw(mouse_pos)
-            pygame.display.flip()
-            clock.tick(60)
+            PROFILER.lap("events")
+            self._present_frame(mouse_pos)
+            input_source.tick(clock, 60)
+            PROFILER.end_frame()
 
         return action_to_return
 
-    def draw(self, mouse_pos):
-        self.screen.fill(BG_COLOR)
+    def _get_background_layer(self):
+        """Devuelve la capa estática; solo se reconstruye si cambia el layout"""
+        layout_key = (self.width, self.height, tuple(self.desktop_scheme_rect), self.sidebar_x_start, self.sidebar_width)
+        if self._background_layer is None or self._background_layer_key != layout_key:
+            self._background_layer = self._build_background_layer()
+            self._background_layer_key = layout_key
+        return self._background_layer
+
+    def _build_background_layer(self):
+        """Compone una vez el fondo, el chasis, los tornillos, el motherboard y la sidebar"""
+        layer = pygame.Surface((self.width, self.height)).convert()
+        layer.fill(BG_COLOR)
         
         # Dibujar el chasis principal del Desktop/Torre
-        pygame.draw.rect(self.screen, LAPTOP_CHASSIS_COLOR, self.desktop_scheme_rect, border_radius=15)
-        pygame.draw.rect(self.screen, (100,100,100), self.desktop_scheme_rect, 3, border_radius=15)
+        pygame.draw.rect(layer, LAPTOP_CHASSIS_COLOR, self.desktop_scheme_rect, border_radius=15)
+        pygame.draw.rect(layer, (100,100,100), self.desktop_scheme_rect, 3, border_radius=15)
         
         # Agregar tornillos en las esquinas
         screw_radius = 4
@@ -714,19 +984,19 @@ class WorktableDesktopScreen:
         screw_offset = 15
         
         # Tornillos en las 4 esquinas
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.desktop_scheme_rect.left + screw_offset, 
                            self.desktop_scheme_rect.top + screw_offset), screw_radius)
         
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.desktop_scheme_rect.right - screw_offset, 
                            self.desktop_scheme_rect.top + screw_offset), screw_radius)
         
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.desktop_scheme_rect.left + screw_offset, 
                            self.desktop_scheme_rect.bottom - screw_offset), screw_radius)
         
-        pygame.draw.circle(self.screen, screw_color, 
+        pygame.draw.circle(layer, screw_color, 
                           (self.desktop_scheme_rect.right - screw_offset, 
                            self.desktop_scheme_rect.bottom - screw_offset), screw_radius)
 
@@ -737,31 +1007,34 @@ class WorktableDesktopScreen:
             self.desktop_scheme_rect.width * 0.55,  # Ajustado proporcionalmente
             self.desktop_scheme_rect.height * 0.65  # Ajustado
         )
-        pygame.draw.rect(self.screen, (50, 70, 90), motherboard_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (30, 50, 70), motherboard_rect, 2, border_radius=8)
+        pygame.draw.rect(layer, (50, 70, 90), motherboard_rect, border_radius=8)
+        pygame.draw.rect(layer, (30, 50, 70), motherboard_rect, 2, border_radius=8)
         
         # Texto "MOTHERBOARD" en el centro con fuente más pequeña
-        motherboard_font = pygame.font.Font(None, 32)  # Reducido de 36 a 32
-        motherboard_text = motherboard_font.render("MOTHERBOARD", True, (200, 200, 200))
+        motherboard_font = get_font(32)  # Reducido de 36 a 32
+        motherboard_text = render_text(motherboard_font, "MOTHERBOARD", True, (200, 200, 200))
         motherboard_text_rect = motherboard_text.get_rect(center=motherboard_rect.center)
-        self.screen.blit(motherboard_text, motherboard_text_rect)
-
-        # Dibujar slots
-        for slot in self.slots:
-            is_hovering_correct = False
-            if self.currently_dragged_card and \
-               self.currently_dragged_card.target_slot_id == slot.id_name and \
-               slot.rect.collidepoint(mouse_pos):
-                is_hovering_correct = True
-            slot.draw(self.screen, is_hovering_correct)
+        layer.blit(motherboard_text, motherboard_text_rect)
 
         # Sidebar
         sidebar_display_rect = pygame.Rect(self.sidebar_x_start, 60, self.sidebar_width, self.height - 120)
-        pygame.draw.rect(self.screen, SIDEBAR_BG_COLOR, sidebar_display_rect)
-        pygame.draw.line(self.screen, MINI_CARD_BORDER, (self.sidebar_x_start, 0), (self.sidebar_x_start, self.height), 2)
-        sidebar_title_surface = SIDEBAR_FONT.render("Componentes", True, SIDEBAR_TITLE_COLOR)
+        pygame.draw.rect(layer, SIDEBAR_BG_COLOR, sidebar_display_rect)
+        pygame.draw.line(layer, MINI_CARD_BORDER, (self.sidebar_x_start, 0), (self.sidebar_x_start, self.height), 2)
+        sidebar_title_surface = render_text(get_font(SIDEBAR_FONT_SIZE), "Componentes", True, SIDEBAR_TITLE_COLOR)
         sidebar_title_rect = sidebar_title_surface.get_rect(centerx=sidebar_display_rect.centerx, top=sidebar_display_rect.top + 40)
-        self.screen.blit(sidebar_title_surface, sidebar_title_rect)
+        layer.blit(sidebar_title_surface, sidebar_title_rect)
+        return layer
+
+    def draw(self, mouse_pos):
+        # Elementos estáticos pre-renderizados en una sola capa
+        self.screen.blit(self._get_background_layer(), (0, 0))
+        PROFILER.lap("background")
+
+        # Dibujar slots
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
+        for slot in self.slots:
+            slot.draw(self.screen, slot is hover_slot)
+        PROFILER.lap("slots")
 
         # Dibujar todas las Mini-Tarjetas
         for card in self.mini_cards:
@@ -772,8 +1045,10 @@ class WorktableDesktopScreen:
             elif card.is_placed and self.currently_dragged_card != card:
                 card.draw(self.screen)
 
+        PROFILER.lap("cards")
+
         # Título
-        title_surface = TITLE_FONT.render(f"Mesa de trabajo - {self.computer_type.capitalize()}", True, TITLE_TEXT_COLOR)
+        title_surface = render_text(get_font(TITLE_FONT_SIZE), f"Mesa de trabajo - {self.computer_type.capitalize()}", True, TITLE_TEXT_COLOR)
         title_bg_width = title_surface.get_width() + 40
         title_bg_rect = pygame.Rect((self.width - title_bg_width) // 2, 20, title_bg_width, 40)
         
@@ -791,52 +1066,54 @@ class WorktableDesktopScreen:
         # Botón Atrás
         back_btn_color = BUTTON_HOVER_COLOR if self.back_button_rect.collidepoint(mouse_pos) and not self.show_alert else BUTTON_COLOR
         pygame.draw.rect(self.screen, back_btn_color, self.back_button_rect, border_radius=6)
-        back_text_surf = BUTTON_FONT.render("Atrás", True, BUTTON_TEXT_COLOR)
+        back_text_surf = render_text(get_font(BUTTON_FONT_SIZE), "Atrás", True, BUTTON_TEXT_COLOR)
         back_text_rect = back_text_surf.get_rect(center=self.back_button_rect.center)
         self.screen.blit(back_text_surf, back_text_rect)
 
         # Botón Continuar
-        cont_btn_color = BUTTON_HOVER_COLOR if self.continue_button_rect.collidepoint(mouse_pos) and not self.show_alert else BUTTON_COLOR
+        cont_btn_color = BUTTON_COLOR if self.progress.ready else BUTTON_PENDING_COLOR
+        if self.continue_button_rect.collidepoint(mouse_pos) and not self.show_alert:
+            cont_btn_color = BUTTON_HOVER_COLOR
         pygame.draw.rect(self.screen, cont_btn_color, self.continue_button_rect, border_radius=6)
-        cont_text_surf = BUTTON_FONT.render("Continuar", True, BUTTON_TEXT_COLOR)
+        cont_text_surf = render_text(get_font(BUTTON_FONT_SIZE), "Continuar", True, BUTTON_TEXT_COLOR)
         cont_text_rect = cont_text_surf.get_rect(center=self.continue_button_rect.center)
         self.screen.blit(cont_text_surf, cont_text_rect)
+        self.progress.draw(self.screen)
+        PROFILER.lap("buttons")
         
         # Dibujar Alerta si está activa
         if self.show_alert:
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill(ALERT_BG_COLOR)
-            self.screen.blit(overlay, (0,0))
+            self.screen.blit(get_filled_surface((self.width, self.height), ALERT_BG_COLOR), (0,0))
             
             self.alert_box_rect.center = (self.width // 2, self.height // 2)
             pygame.draw.rect(self.screen, ALERT_BOX_COLOR, self.alert_box_rect, border_radius=10)
             pygame.draw.rect(self.screen, MINI_CARD_BORDER, self.alert_box_rect, 2, border_radius=10)
 
-            alert_title_surf = ALERT_FONT.render("Alerta", True, ALERT_TEXT_COLOR)
+            alert_title_surf = render_text(get_font(ALERT_FONT_SIZE), "Alerta", True, ALERT_TEXT_COLOR)
             alert_title_rect = alert_title_surf.get_rect(centerx=self.alert_box_rect.centerx, top=self.alert_box_rect.top + 15)
             self.screen.blit(alert_title_surf, alert_title_rect)
             
-            msg_surf = ALERT_MESSAGE_FONT.render(self.alert_message, True, ALERT_TEXT_COLOR)
+            msg_surf = render_text(get_font(ALERT_MESSAGE_FONT_SIZE), self.alert_message, True, ALERT_TEXT_COLOR)
             msg_rect = msg_surf.get_rect(centerx=self.alert_box_rect.centerx, top=alert_title_rect.bottom + 10)
             self.screen.blit(msg_surf, msg_rect)
             
-            dismiss_surf = MINI_CARD_FONT.render("(Haz clic para cerrar)", True, (200,200,200))
+            dismiss_surf = render_text(get_font(MINI_CARD_FONT_SIZE), "(Haz clic para cerrar)", True, (200,200,200))
             dismiss_rect = dismiss_surf.get_rect(centerx=self.alert_box_rect.centerx, bottom=self.alert_box_rect.bottom - 10)
             self.screen.blit(dismiss_surf, dismiss_rect) 
+        PROFILER.lap("alert")
 
-    def _all_components_connected(self):
-        """Verifica si todos los componentes han sido conectados"""
-        return all(card.is_placed for card in self.mini_cards) if self.mini_cards else True
 
 
 class LaptopExternalConnectionScreen:
     """Pantalla para conectar componentes externos a la laptop."""
-    def __init__(self, screen, computer_type, selected_external_components):
+    def __init__(self, screen, computer_type, selected_external_components, dirty_rects=False):
         self.screen = screen
+        # Modo opcional de rectángulos sucios (None = frame completo con flip)
+        self.dirty_tracker = DirtyRectTracker(screen) if dirty_rects else None
         self.width = screen.get_width()
         self.height = screen.get_height()
         self.computer_type = computer_type
-        self.selected_external_components = selected_external_components
+        self.selected_external_components = ComponentSet(selected_external_components)
 
         # Área para la ilustración de laptop (centro, pero un poco a la izquierda)
         self.laptop_illustration_width = self.width * 0.50
@@ -852,6 +1129,8 @@ class LaptopExternalConnectionScreen:
         self.sidebar_width = self.width * 0.35
         self.sidebar_x_start = self.width - self.sidebar_width - 10
 
+        self.board = SlotBoard() # Ocupación de slots (modelo sin pygame)
+
         self.slots = []
         self.mini_cards = []
         self.currently_dragged_card = None
@@ -872,6 +1151,21 @@ class LaptopExternalConnectionScreen:
         )
         
         self.alert_box_rect = pygame.Rect(0, 0, 400, 100)
+        self.progress = PlacementProgress(self.board, self.continue_button_rect, "Conectados")
+
+    def cached_bytes(self):
+        """Bytes de la barra de progreso y las mini-tarjetas (presupuesto del ScreenManager)"""
+        return self.progress.cached_bytes() + sum(card.cached_bytes() for card in self.mini_cards)
+
+    def reset(self, computer_type, selected_external_components):
+        """Restablece el estado mutable al reutilizar la pantalla (layout y slots se conservan)"""
+        self.computer_type = computer_type
+        self.selected_external_components = ComponentSet(selected_external_components)
+        self.currently_dragged_card = None
+        self._create_mini_cards() # También vacía los slots del tablero
+        self.show_alert = False
+        if self.dirty_tracker:
+            self.dirty_tracker.invalidate_all()
 
     def _setup_laptop_external_connections(self):
         # Tarjetas para componentes externos
@@ -930,22 +1224,23 @@ class LaptopExternalConnectionScreen:
         self.slots = []
         for id_name, display_name, coords, accepted_id in slot_data:
             slot_rect = pygame.Rect(coords[0], coords[1], coords[2], coords[3])
-            self.slots.append(DropSlot(id_name, display_name, slot_rect, accepted_id))
+            self.slots.append(DropSlot(id_name, display_name, slot_rect, accepted_id, self.board))
+
+        self.slot_index = _build_slot_index(self.slots)
 
         # Coordenadas del hub para dibujar cables
         self.hub_rect = pygame.Rect(hub_center_x - 30, hub_center_y - 15, 60, 30)
 
         # Componentes externos disponibles
-        external_component_defs = [
-            {"id": "MOUSE_EXT", "name": "Mouse Razen", "img": "../src/assets/images/componentesExternos/mouse.png", "slot": "SLOT_MOUSE"},
-            {"id": "KEYBOARD_EXT", "name": "Teclado Mecanico", "img": "../src/assets/images/componentesExternos/Teclado mecánico RGB.png", "slot": "SLOT_KEYBOARD"},
-            {"id": "HEADPHONES_EXT", "name": "Bocinas Estereo", "img": "../src/assets/images/componentesExternos/bocinas.png", "slot": "SLOT_HEADPHONES"},
-            {"id": "WEBCAM_EXT", "name": "Webcam HD 1080p", "img": "../src/assets/images/componentesExternos/camara.png", "slot": "SLOT_WEBCAM"},
-            {"id": "MONITOR_EXT", "name": "Monitor LED 24\"", "img": "../src/assets/images/componentesExternos/monitorNew.png", "slot": "SLOT_MONITOR"},
-            {"id": "PRINTER_EXT", "name": "Microfono USB", "img": "../src/assets/images/componentesExternos/microfono.png", "slot": "SLOT_PRINTER"},
-            {"id": "UPS_EXT", "name": "UPS", "img": "../src/assets/images/componentesExternos/ups.png", "slot": "SLOT_UPS"},
-            {"id": "HUB_EXT", "name": "HUB USB", "img": "../src/assets/images/componentesExternos/HUB.png", "slot": "SLOT_HUB"},
-        ]
+        self.component_defs = get_catalog().in_category("external")
+        self.mini_card_size = (mini_card_w, mini_card_h)
+        self.mini_card_image_size = (img_in_card_w, img_in_card_h)
+        self._create_mini_cards()
+
+    def _create_mini_cards(self):
+        """Crea las mini-tarjetas de los componentes seleccionados, acomodadas en la sidebar"""
+        mini_card_w, mini_card_h = self.mini_card_size
+        img_in_card_w, img_in_card_h = self.mini_card_image_size
 
         # Crear mini cards para componentes seleccionados distribuidas en dos columnas
         sidebar_item_y = 80
@@ -962,8 +1257,8 @@ class LaptopExternalConnectionScreen:
         self.mini_cards = []
         card_index = 0
         
-        for comp_def in external_component_defs:
-            if comp_def["name"] in self.selected_external_components:
+        for comp_def in self.component_defs:
+            if comp_def.name in self.selected_external_components:
                 # Determinar en qué columna va este componente
                 if card_index < cards_per_column:
                     # Primera columna
@@ -975,25 +1270,28 @@ class LaptopExternalConnectionScreen:
                     pos_y = sidebar_item_y + ((card_index - cards_per_column) * (mini_card_h + sidebar_item_spacing))
                 
                 mini_card = MiniCardComponent(
-                    comp_def["id"], comp_def["name"], comp_def["img"],
-                    (pos_x, pos_y), comp_def["slot"], 
+                    comp_def.id, comp_def.name, comp_def.id,
+                    (pos_x, pos_y), comp_def.slot, self.board,
                     card_size=(mini_card_w, mini_card_h), 
                     image_render_size=(img_in_card_w, img_in_card_h)
                 )
                 self.mini_cards.append(mini_card)
                 card_index += 1
 
+        self.board.set_components([card.id_name for card in self.mini_cards])
+        self.card_index = _build_card_index(self.mini_cards)
+
     def draw(self):
         """Dibuja la pantalla de conexión de componentes externos"""
         # Obtener posición del mouse
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = input_source.get_mouse_pos()
         
         # Fondo
         self.screen.fill((240, 245, 250))
 
         # Título
-        title_font = pygame.font.Font(None, 36)
-        title_text = title_font.render("Conexión de Componentes Externos", True, (30, 41, 59))
+        title_font = get_font(36)
+        title_text = render_text(title_font, "Conexión de Componentes Externos", True, (30, 41, 59))
         title_rect = title_text.get_rect(center=(self.width // 2, 30))
         self.screen.blit(title_text, title_rect)
 
@@ -1002,18 +1300,17 @@ class LaptopExternalConnectionScreen:
         
         # Dibujar hub y cables
         self._draw_hub_and_cables()
+        PROFILER.lap("background")
 
         # Dibujar slots para componentes externos con detección de hover
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
         for slot in self.slots:
-            is_hovering_correct = False
-            if self.currently_dragged_card and \
-               self.currently_dragged_card.target_slot_id == slot.id_name and \
-               slot.rect.collidepoint(mouse_pos):
-                is_hovering_correct = True
-            self._draw_external_slot(slot, is_hovering_correct)
+            self._draw_external_slot(slot, slot is hover_slot)
+        PROFILER.lap("slots")
 
         # Dibujar sidebar con componentes
         self._draw_sidebar()
+        PROFILER.lap("sidebar")
 
         # Dibujar mini cards
         for mini_card in self.mini_cards:
@@ -1022,13 +1319,16 @@ class LaptopExternalConnectionScreen:
         # Dibujar componente siendo arrastrado
         if self.currently_dragged_card:
             self.currently_dragged_card.draw(self.screen)
+        PROFILER.lap("cards")
 
         # Dibujar botones
         self._draw_navigation_buttons()
+        PROFILER.lap("buttons")
 
         # Dibujar alerta si es necesario
         if self.show_alert:
             self._draw_alert()
+        PROFILER.lap("alert")
 
     def _draw_laptop_illustration(self):
         """Dibuja la ilustración de la laptop vista desde el frente"""
@@ -1083,8 +1383,8 @@ class LaptopExternalConnectionScreen:
                 pygame.draw.rect(self.screen, (80, 90, 100), key_rect, border_radius=1)
 
         # Texto "LAPTOP"
-        laptop_font = pygame.font.Font(None, 24)
-        laptop_text = laptop_font.render("LAPTOP", True, (200, 200, 200))
+        laptop_font = get_font(24)
+        laptop_text = render_text(laptop_font, "LAPTOP", True, (200, 200, 200))
         laptop_text_rect = laptop_text.get_rect(center=inner_screen.center)
         self.screen.blit(laptop_text, laptop_text_rect)
 
@@ -1095,8 +1395,8 @@ class LaptopExternalConnectionScreen:
         pygame.draw.rect(self.screen, (50, 60, 70), self.hub_rect, 2, border_radius=4)
         
         # Texto del hub
-        hub_font = pygame.font.Font(None, 16)
-        hub_text = hub_font.render("USB HUB", True, (200, 200, 200))
+        hub_font = get_font(16)
+        hub_text = render_text(hub_font, "USB HUB", True, (200, 200, 200))
         hub_text_rect = hub_text.get_rect(center=self.hub_rect.center)
         self.screen.blit(hub_text, hub_text_rect)
 
@@ -1142,9 +1442,9 @@ class LaptopExternalConnectionScreen:
         
         # Texto del slot (si está vacío)
         if not slot.is_occupied():
-            slot_font = pygame.font.Font(None, 16)
+            slot_font = get_font(16)
             text_color = (40, 120, 40) if is_hovering_correct else (80, 90, 100)
-            slot_text = slot_font.render(slot.display_name_on_slot, True, text_color)
+            slot_text = render_text(slot_font, slot.display_name_on_slot, True, text_color)
             slot_text_rect = slot_text.get_rect(center=slot.rect.center)
             self.screen.blit(slot_text, slot_text_rect)
 
@@ -1155,26 +1455,28 @@ class LaptopExternalConnectionScreen:
         pygame.draw.rect(self.screen, (200, 210, 220), sidebar_rect, 2, border_radius=8)
         
         # Título del sidebar
-        sidebar_font = pygame.font.Font(None, 20)
-        sidebar_title = sidebar_font.render("Componentes Externos", True, (50, 60, 70))
+        sidebar_font = get_font(20)
+        sidebar_title = render_text(sidebar_font, "Componentes Externos", True, (50, 60, 70))
         title_rect = sidebar_title.get_rect(centerx=sidebar_rect.centerx, y=sidebar_rect.top + 10)
         self.screen.blit(sidebar_title, title_rect)
 
     def _draw_navigation_buttons(self):
         """Dibuja los botones de navegación"""
-        button_font = pygame.font.Font(None, 24)
+        button_font = get_font(24)
         
         # Botón Atrás
         pygame.draw.rect(self.screen, (220, 53, 69), self.back_button_rect, border_radius=5)
-        back_text = button_font.render("Atrás", True, (255, 255, 255))
+        back_text = render_text(button_font, "Atrás", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=self.back_button_rect.center)
         self.screen.blit(back_text, back_text_rect)
         
-        # Botón Siguiente (era Finalizar)
-        pygame.draw.rect(self.screen, (34, 197, 94), self.continue_button_rect, border_radius=5)
-        continue_text = button_font.render("Siguiente", True, (255, 255, 255))
+        # Botón Siguiente (era Finalizar); gris mientras falten conexiones
+        continue_color = (34, 197, 94) if self.progress.ready else BUTTON_PENDING_COLOR
+        pygame.draw.rect(self.screen, continue_color, self.continue_button_rect, border_radius=5)
+        continue_text = render_text(button_font, "Siguiente", True, (255, 255, 255))
         continue_text_rect = continue_text.get_rect(center=self.continue_button_rect.center)
         self.screen.blit(continue_text, continue_text_rect)
+        self.progress.draw(self.screen)
 
     def _draw_alert(self):
         """Dibuja la alerta de validación"""
@@ -1186,26 +1488,64 @@ class LaptopExternalConnectionScreen:
         pygame.draw.rect(self.screen, (239, 68, 68), self.alert_box_rect, 3, border_radius=8)
         
         # Texto de alerta
-        alert_font = pygame.font.Font(None, 20)
+        alert_font = get_font(20)
         lines = self.alert_message.split('\n')
         y_offset = self.alert_box_rect.centery - (len(lines) * 12)
         
         for line in lines:
-            text_surface = alert_font.render(line, True, (153, 27, 27))
+            text_surface = render_text(alert_font, line, True, (153, 27, 27))
             text_rect = text_surface.get_rect(centerx=self.alert_box_rect.centerx, y=y_offset)
             self.screen.blit(text_surface, text_rect)
             y_offset += 24
 
+    def _track_dirty_regions(self, mouse_pos):
+        """Registra los elementos dinámicos para el modo de rectángulos sucios"""
+        tracker = self.dirty_tracker
+        tracker.track("alert", self.screen.get_rect(), self.show_alert)
+        if PROFILER.hud_visible:
+            tracker.track("profiler_hud", PROFILER.hud_rect, PROFILER.refresh_hud(self.screen))
+        for card in self.mini_cards:
+            tracker.track(("card", card.id_name), card.rect)
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
+        for slot in self.slots:
+            tracker.track(("slot", slot.id_name), slot.rect, (slot is hover_slot, slot.is_occupied()))
+        tracker.track("progress", self.progress.rect, self.progress.state)
+        tracker.track(("button", "continue"), self.continue_button_rect, self.progress.ready)
+
+    def _present_frame(self, mouse_pos):
+        """Dibuja el frame completo, o solo las regiones sucias si el modo está activo"""
+        if self.dirty_tracker is None:
+            self.draw()
+            PROFILER.draw_hud(self.screen)
+            pygame.display.flip()
+        else:
+            self._track_dirty_regions(mouse_pos)
+            PROFILER.lap("dirty_tracking")
+            self.dirty_tracker.present(lambda: self._draw_with_hud(mouse_pos))
+        PROFILER.lap("flip")
+
+    def _draw_with_hud(self, mouse_pos):
+        self.draw()
+        PROFILER.draw_hud(self.screen)
+
     def run(self):
         """Ejecuta la lógica principal de la pantalla"""
         clock = pygame.time.Clock()
         running = True
         action_result = {"action": "quit"}
 
+        PROFILER.set_screen(type(self).__name__)
+
         while running:
-            mouse_pos = pygame.mouse.get_pos()
+            PROFILER.mark()
+            mouse_pos = input_source.get_mouse_pos()
             
-            for event in pygame.event.get():
+            for event in input_source.get_events():
+                if self.dirty_tracker:
+                    self.dirty_tracker.process_event(event)
+                if PROFILER.handle_event(event) and self.dirty_tracker:
+                    self.dirty_tracker.invalidate_all()
+
                 if event.type == pygame.QUIT:
                     action_result = {"action": "quit"}
                     running = False
@@ -1223,7 +1563,7 @@ class LaptopExternalConnectionScreen:
                         break
                     elif self.continue_button_rect.collidepoint(mouse_pos):
                         # Verificar que todos los componentes estén conectados
-                        if self._all_components_connected():
+                        if self.board.is_complete:
                             action_result = {"action": "next_to_boot"}
                             running = False
                         else:
@@ -1233,39 +1573,39 @@ class LaptopExternalConnectionScreen:
                 # Lógica de drag & drop usando el sistema existente
                 if not self.show_alert:
                     if self.currently_dragged_card:
-                        if self.currently_dragged_card.handle_event(event, self.slots):
+                        if self.currently_dragged_card.handle_event(event, self.slot_index):
+                            self.card_index.update(self.currently_dragged_card.id_name, self.currently_dragged_card.rect)
                             if not self.currently_dragged_card.is_dragging:
                                 self.currently_dragged_card = None
 
                     elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        for card in self.mini_cards:
-                            if card.rect.collidepoint(mouse_pos):
-                                if card.handle_event(event, self.slots):
-                                    self.currently_dragged_card = card
-                                    break
+                        for card in self.card_index.items_at(mouse_pos):
+                            if card.handle_event(event, self.slot_index):
+                                self.currently_dragged_card = card
+                                break
 
             if not running:
                 break
 
-            self.draw()
-            pygame.display.flip()
-            clock.tick(60)
+            PROFILER.lap("events")
+            self._present_frame(mouse_pos)
+            input_source.tick(clock, 60)
+            PROFILER.end_frame()
 
         return action_result
 
-    def _all_components_connected(self):
-        """Verifica si todos los componentes han sido conectados"""
-        return all(card.is_placed for card in self.mini_cards) if self.mini_cards else True
 
 
 class DesktopExternalConnectionScreen:
     """Pantalla para conectar componentes externos a la computadora de escritorio."""
-    def __init__(self, screen, computer_type, selected_external_components):
+    def __init__(self, screen, computer_type, selected_external_components, dirty_rects=False):
         self.screen = screen
+        # Modo opcional de rectángulos sucios (None = frame completo con flip)
+        self.dirty_tracker = DirtyRectTracker(screen) if dirty_rects else None
         self.width = screen.get_width()
         self.height = screen.get_height()
         self.computer_type = computer_type
-        self.selected_external_components = selected_external_components
+        self.selected_external_components = ComponentSet(selected_external_components)
 
         # Área para la ilustración de desktop (centro, pero un poco a la izquierda)
         self.desktop_illustration_width = self.width * 0.50
@@ -1281,6 +1621,8 @@ class DesktopExternalConnectionScreen:
         self.sidebar_width = self.width * 0.35
         self.sidebar_x_start = self.width - self.sidebar_width - 10
 
+        self.board = SlotBoard() # Ocupación de slots (modelo sin pygame)
+
         self.slots = []
         self.mini_cards = []
         self.currently_dragged_card = None
@@ -1301,6 +1643,21 @@ class DesktopExternalConnectionScreen:
         )
         
         self.alert_box_rect = pygame.Rect(0, 0, 400, 100)
+        self.progress = PlacementProgress(self.board, self.continue_button_rect, "Conectados")
+
+    def cached_bytes(self):
+        """Bytes de la barra de progreso y las mini-tarjetas (presupuesto del ScreenManager)"""
+        return self.progress.cached_bytes() + sum(card.cached_bytes() for card in self.mini_cards)
+
+    def reset(self, computer_type, selected_external_components):
+        """Restablece el estado mutable al reutilizar la pantalla (layout y slots se conservan)"""
+        self.computer_type = computer_type
+        self.selected_external_components = ComponentSet(selected_external_components)
+        self.currently_dragged_card = None
+        self._create_mini_cards() # También vacía los slots del tablero
+        self.show_alert = False
+        if self.dirty_tracker:
+            self.dirty_tracker.invalidate_all()
 
     def _setup_desktop_external_connections(self):
         # Tarjetas para componentes externos
@@ -1359,22 +1716,23 @@ class DesktopExternalConnectionScreen:
         self.slots = []
         for id_name, display_name, coords, accepted_id in slot_data:
             slot_rect = pygame.Rect(coords[0], coords[1], coords[2], coords[3])
-            self.slots.append(DropSlot(id_name, display_name, slot_rect, accepted_id))
+            self.slots.append(DropSlot(id_name, display_name, slot_rect, accepted_id, self.board))
+
+        self.slot_index = _build_slot_index(self.slots)
 
         # Coordenadas del hub para dibujar cables
         self.hub_rect = pygame.Rect(hub_center_x - 30, hub_center_y - 15, 60, 30)
 
         # Componentes externos disponibles (mismos que laptop)
-        external_component_defs = [
-            {"id": "MOUSE_EXT", "name": "Mouse Razen", "img": "../src/assets/images/componentesExternos/mouse.png", "slot": "SLOT_MOUSE"},
-            {"id": "KEYBOARD_EXT", "name": "Teclado Mecanico", "img": "../src/assets/images/componentesExternos/Teclado mecánico RGB.png", "slot": "SLOT_KEYBOARD"},
-            {"id": "HEADPHONES_EXT", "name": "Bocinas Estereo", "img": "../src/assets/images/componentesExternos/bocinas.png", "slot": "SLOT_HEADPHONES"},
-            {"id": "WEBCAM_EXT", "name": "Webcam HD 1080p", "img": "../src/assets/images/componentesExternos/camara.png", "slot": "SLOT_WEBCAM"},
-            {"id": "MONITOR_EXT", "name": "Monitor LED 24\"", "img": "../src/assets/images/componentesExternos/monitorNew.png", "slot": "SLOT_MONITOR"},
-            {"id": "PRINTER_EXT", "name": "Microfono USB", "img": "../src/assets/images/componentesExternos/microfono.png", "slot": "SLOT_PRINTER"},
-            {"id": "UPS_EXT", "name": "UPS", "img": "../src/assets/images/componentesExternos/ups.png", "slot": "SLOT_UPS"},
-            {"id": "HUB_EXT", "name": "HUB USB", "img": "../src/assets/images/componentesExternos/HUB.png", "slot": "SLOT_HUB"},
-        ]
+        self.component_defs = get_catalog().in_category("external")
+        self.mini_card_size = (mini_card_w, mini_card_h)
+        self.mini_card_image_size = (img_in_card_w, img_in_card_h)
+        self._create_mini_cards()
+
+    def _create_mini_cards(self):
+        """Crea las mini-tarjetas de los componentes seleccionados, acomodadas en la sidebar"""
+        mini_card_w, mini_card_h = self.mini_card_size
+        img_in_card_w, img_in_card_h = self.mini_card_image_size
 
         # Crear mini cards para componentes seleccionados distribuidas en dos columnas
         sidebar_item_y = 80
@@ -1391,8 +1749,8 @@ class DesktopExternalConnectionScreen:
         self.mini_cards = []
         card_index = 0
         
-        for comp_def in external_component_defs:
-            if comp_def["name"] in self.selected_external_components:
+        for comp_def in self.component_defs:
+            if comp_def.name in self.selected_external_components:
                 # Determinar en qué columna va este componente
                 if card_index < cards_per_column:
                     # Primera columna
@@ -1404,25 +1762,28 @@ class DesktopExternalConnectionScreen:
                     pos_y = sidebar_item_y + ((card_index - cards_per_column) * (mini_card_h + sidebar_item_spacing))
                 
                 mini_card = MiniCardComponent(
-                    comp_def["id"], comp_def["name"], comp_def["img"],
-                    (pos_x, pos_y), comp_def["slot"], 
+                    comp_def.id, comp_def.name, comp_def.id,
+                    (pos_x, pos_y), comp_def.slot, self.board,
                     card_size=(mini_card_w, mini_card_h), 
                     image_render_size=(img_in_card_w, img_in_card_h)
                 )
                 self.mini_cards.append(mini_card)
                 card_index += 1
 
+        self.board.set_components([card.id_name for card in self.mini_cards])
+        self.card_index = _build_card_index(self.mini_cards)
+
     def draw(self):
         """Dibuja la pantalla de conexión de componentes externos para desktop"""
         # Obtener posición del mouse
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = input_source.get_mouse_pos()
         
         # Fondo
         self.screen.fill((240, 245, 250))
 
         # Título
-        title_font = pygame.font.Font(None, 36)
-        title_text = title_font.render("Conexión de Componentes Externos - Desktop", True, (30, 41, 59))
+        title_font = get_font(36)
+        title_text = render_text(title_font, "Conexión de Componentes Externos - Desktop", True, (30, 41, 59))
         title_rect = title_text.get_rect(center=(self.width // 2, 30))
         self.screen.blit(title_text, title_rect)
 
@@ -1431,18 +1792,17 @@ class DesktopExternalConnectionScreen:
         
         # Dibujar hub y cables
         self._draw_hub_and_cables()
+        PROFILER.lap("background")
 
         # Dibujar slots para componentes externos con detección de hover
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
         for slot in self.slots:
-            is_hovering_correct = False
-            if self.currently_dragged_card and \
-               self.currently_dragged_card.target_slot_id == slot.id_name and \
-               slot.rect.collidepoint(mouse_pos):
-                is_hovering_correct = True
-            self._draw_external_slot(slot, is_hovering_correct)
+            self._draw_external_slot(slot, slot is hover_slot)
+        PROFILER.lap("slots")
 
         # Dibujar sidebar con componentes
         self._draw_sidebar()
+        PROFILER.lap("sidebar")
 
         # Dibujar mini cards
         for mini_card in self.mini_cards:
@@ -1451,13 +1811,16 @@ class DesktopExternalConnectionScreen:
         # Dibujar componente siendo arrastrado
         if self.currently_dragged_card:
             self.currently_dragged_card.draw(self.screen)
+        PROFILER.lap("cards")
 
         # Dibujar botones
         self._draw_navigation_buttons()
+        PROFILER.lap("buttons")
 
         # Dibujar alerta si es necesario
         if self.show_alert:
             self._draw_alert()
+        PROFILER.lap("alert")
 
     def _draw_desktop_illustration(self):
         """Dibuja la ilustración de la computadora de torre (desktop)"""
@@ -1524,8 +1887,8 @@ class DesktopExternalConnectionScreen:
         pygame.draw.rect(self.screen, (60, 70, 80), base_rect, 2, border_radius=5)
 
         # Texto "DESKTOP PC"
-        desktop_font = pygame.font.Font(None, 20)
-        desktop_text = desktop_font.render("DESKTOP PC", True, (200, 200, 200))
+        desktop_font = get_font(20)
+        desktop_text = render_text(desktop_font, "DESKTOP PC", True, (200, 200, 200))
         desktop_text_rect = desktop_text.get_rect(center=(tower_rect.centerx, tower_rect.bottom + 40))
         self.screen.blit(desktop_text, desktop_text_rect)
 
@@ -1555,8 +1918,8 @@ class DesktopExternalConnectionScreen:
         pygame.draw.rect(self.screen, (50, 60, 70), self.hub_rect, 2, border_radius=4)
         
         # Texto del hub
-        hub_font = pygame.font.Font(None, 16)
-        hub_text = hub_font.render("USB HUB", True, (200, 200, 200))
+        hub_font = get_font(16)
+        hub_text = render_text(hub_font, "USB HUB", True, (200, 200, 200))
         hub_text_rect = hub_text.get_rect(center=self.hub_rect.center)
         self.screen.blit(hub_text, hub_text_rect)
 
@@ -1602,9 +1965,9 @@ class DesktopExternalConnectionScreen:
         
         # Texto del slot (si está vacío)
         if not slot.is_occupied():
-            slot_font = pygame.font.Font(None, 16)
+            slot_font = get_font(16)
             text_color = (40, 120, 40) if is_hovering_correct else (80, 90, 100)
-            slot_text = slot_font.render(slot.display_name_on_slot, True, text_color)
+            slot_text = render_text(slot_font, slot.display_name_on_slot, True, text_color)
             slot_text_rect = slot_text.get_rect(center=slot.rect.center)
             self.screen.blit(slot_text, slot_text_rect)
 
@@ -1615,26 +1978,28 @@ class DesktopExternalConnectionScreen:
         pygame.draw.rect(self.screen, (200, 210, 220), sidebar_rect, 2, border_radius=8)
         
         # Título del sidebar
-        sidebar_font = pygame.font.Font(None, 20)
-        sidebar_title = sidebar_font.render("Componentes Externos", True, (50, 60, 70))
+        sidebar_font = get_font(20)
+        sidebar_title = render_text(sidebar_font, "Componentes Externos", True, (50, 60, 70))
         title_rect = sidebar_title.get_rect(centerx=sidebar_rect.centerx, y=sidebar_rect.top + 10)
         self.screen.blit(sidebar_title, title_rect)
 
     def _draw_navigation_buttons(self):
         """Dibuja los botones de navegación"""
-        button_font = pygame.font.Font(None, 24)
+        button_font = get_font(24)
         
         # Botón Atrás
         pygame.draw.rect(self.screen, (220, 53, 69), self.back_button_rect, border_radius=5)
-        back_text = button_font.render("Atrás", True, (255, 255, 255))
+        back_text = render_text(button_font, "Atrás", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=self.back_button_rect.center)
         self.screen.blit(back_text, back_text_rect)
         
-        # Botón Siguiente (era Finalizar)
-        pygame.draw.rect(self.screen, (34, 197, 94), self.continue_button_rect, border_radius=5)
-        continue_text = button_font.render("Siguiente", True, (255, 255, 255))
+        # Botón Siguiente (era Finalizar); gris mientras falten conexiones
+        continue_color = (34, 197, 94) if self.progress.ready else BUTTON_PENDING_COLOR
+        pygame.draw.rect(self.screen, continue_color, self.continue_button_rect, border_radius=5)
+        continue_text = render_text(button_font, "Siguiente", True, (255, 255, 255))
         continue_text_rect = continue_text.get_rect(center=self.continue_button_rect.center)
         self.screen.blit(continue_text, continue_text_rect)
+        self.progress.draw(self.screen)
 
     def _draw_alert(self):
         """Dibuja la alerta de validación"""
@@ -1646,26 +2011,64 @@ class DesktopExternalConnectionScreen:
         pygame.draw.rect(self.screen, (239, 68, 68), self.alert_box_rect, 3, border_radius=8)
         
         # Texto de alerta
-        alert_font = pygame.font.Font(None, 20)
+        alert_font = get_font(20)
         lines = self.alert_message.split('\n')
         y_offset = self.alert_box_rect.centery - (len(lines) * 12)
         
         for line in lines:
-            text_surface = alert_font.render(line, True, (153, 27, 27))
+            text_surface = render_text(alert_font, line, True, (153, 27, 27))
             text_rect = text_surface.get_rect(centerx=self.alert_box_rect.centerx, y=y_offset)
             self.screen.blit(text_surface, text_rect)
             y_offset += 24
 
+    def _track_dirty_regions(self, mouse_pos):
+        """Registra los elementos dinámicos para el modo de rectángulos sucios"""
+        tracker = self.dirty_tracker
+        tracker.track("alert", self.screen.get_rect(), self.show_alert)
+        if PROFILER.hud_visible:
+            tracker.track("profiler_hud", PROFILER.hud_rect, PROFILER.refresh_hud(self.screen))
+        for card in self.mini_cards:
+            tracker.track(("card", card.id_name), card.rect)
+        hover_slot = _hover_slot(self.currently_dragged_card, self.slot_index, mouse_pos)
+        for slot in self.slots:
+            tracker.track(("slot", slot.id_name), slot.rect, (slot is hover_slot, slot.is_occupied()))
+        tracker.track("progress", self.progress.rect, self.progress.state)
+        tracker.track(("button", "continue"), self.continue_button_rect, self.progress.ready)
+
+    def _present_frame(self, mouse_pos):
+        """Dibuja el frame completo, o solo las regiones sucias si el modo está activo"""
+        if self.dirty_tracker is None:
+            self.draw()
+            PROFILER.draw_hud(self.screen)
+            pygame.display.flip()
+        else:
+            self._track_dirty_regions(mouse_pos)
+            PROFILER.lap("dirty_tracking")
+            self.dirty_tracker.present(lambda: self._draw_with_hud(mouse_pos))
+        PROFILER.lap("flip")
+
+    def _draw_with_hud(self, mouse_pos):
+        self.draw()
+        PROFILER.draw_hud(self.screen)
+
     def run(self):
         """Ejecuta la lógica principal de la pantalla"""
         clock = pygame.time.Clock()
         running = True
         action_result = {"action": "quit"}
 
+        PROFILER.set_screen(type(self).__name__)
+
         while running:
-            mouse_pos = pygame.mouse.get_pos()
+            PROFILER.mark()
+            mouse_pos = input_source.get_mouse_pos()
             
-            for event in pygame.event.get():
+            for event in input_source.get_events():
+                if self.dirty_tracker:
+                    self.dirty_tracker.process_event(event)
+                if PROFILER.handle_event(event) and self.dirty_tracker:
+                    self.dirty_tracker.invalidate_all()
+
                 if event.type == pygame.QUIT:
                     action_result = {"action": "quit"}
                     running = False
@@ -1683,7 +2086,7 @@ class DesktopExternalConnectionScreen:
                         break
                     elif self.continue_button_rect.collidepoint(mouse_pos):
                         # Verificar que todos los componentes estén conectados
-                        if self._all_components_connected():
+                        if self.board.is_complete:
                             action_result = {"action": "next_to_boot"}
                             running = False
                         else:
@@ -1693,29 +2096,27 @@ class DesktopExternalConnectionScreen:
                 # Lógica de drag & drop usando el sistema existente
                 if not self.show_alert:
                     if self.currently_dragged_card:
-                        if self.currently_dragged_card.handle_event(event, self.slots):
+                        if self.currently_dragged_card.handle_event(event, self.slot_index):
+                            self.card_index.update(self.currently_dragged_card.id_name, self.currently_dragged_card.rect)
                             if not self.currently_dragged_card.is_dragging:
                                 self.currently_dragged_card = None
 
                     elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        for card in self.mini_cards:
-                            if card.rect.collidepoint(mouse_pos):
-                                if card.handle_event(event, self.slots):
-                                    self.currently_dragged_card = card
-                                    break
+                        for card in self.card_index.items_at(mouse_pos):
+                            if card.handle_event(event, self.slot_index):
+                                self.currently_dragged_card = card
+                                break
 
             if not running:
                 break
 
-            self.draw()
-            pygame.display.flip()
-            clock.tick(60)
+            PROFILER.lap("events")
+            self._present_frame(mouse_pos)
+            input_source.tick(clock, 60)
+            PROFILER.end_frame()
 
         return action_result
 
-    def _all_components_connected(self):
-        """Verifica si todos los componentes han sido conectados"""
-        return all(card.is_placed for card in self.mini_cards) if self.mini_cards else True 
 
 
 class LaptopBootScreen:
@@ -1724,7 +2125,7 @@ class LaptopBootScreen:
         self.screen = screen
         self.width = screen.get_width()
         self.height = screen.get_height()
-        self.selected_internal_components = selected_internal_components
+        self.selected_internal_components = ComponentSet(selected_internal_components)
         
         # Estados de la pantalla
         self.laptop_powered_on = False
@@ -1732,13 +2133,11 @@ class LaptopBootScreen:
         self.animation_timer = 0
         self.show_message = False
         self.message_timer = 0
+        self._message_timer_handle = None # Temporizador del mensaje (utils.timer_wheel)
         
         # Verificar si todos los componentes internos están presentes
-        required_laptop_components = [
-            "RAM DDR4 8GB", "Ryzen 7 5700X", "Kingston SSD 1TB", 
-            "M.2 NVMe SSD", "Modulo Wi-Fi/BT"
-        ]
-        self.all_components_present = all(comp in selected_internal_components for comp in required_laptop_components)
+        self.outcome = evaluate_boot(self.selected_internal_components, "laptop")
+        self.all_components_present = self.outcome.powers_on
         
         # Área de la laptop (MUCHO MÁS ALARGADA)
         self.laptop_width = 500  # Mantener ancho
@@ -1775,29 +2174,45 @@ class LaptopBootScreen:
             button_height
         )
 
+    def reset(self, selected_internal_components):
+        """Restablece el estado mutable al reutilizar la pantalla"""
+        self.selected_internal_components = ComponentSet(selected_internal_components)
+        self.outcome = evaluate_boot(self.selected_internal_components, "laptop")
+        self.all_components_present = self.outcome.powers_on
+        self.laptop_powered_on = False
+        self.animation_phase = 0
+        self.animation_timer = 0
+        self.show_message = False
+        self.message_timer = 0
+        self._cancel_message_timer()  # Por si quedó pendiente de la visita anterior
+
     def draw(self):
         """Dibuja la pantalla de encendido de laptop"""
         # Fondo
         self.screen.fill((245, 248, 252))
         
         # Título
-        title_font = pygame.font.Font(None, 36)
-        title_text = title_font.render("Test de Encendido - Laptop", True, (30, 41, 59))
+        title_font = get_font(36)
+        title_text = render_text(title_font, "Test de Encendido - Laptop", True, (30, 41, 59))
         title_rect = title_text.get_rect(center=(self.width // 2, 40))
         self.screen.blit(title_text, title_rect)
+        PROFILER.lap("background")
         
         # Dibujar laptop
         self._draw_laptop()
+        PROFILER.lap("computer")
         
         # Dibujar botón de encendido
         self._draw_power_button()
         
         # Dibujar botón finalizar
         self._draw_finish_button()
+        PROFILER.lap("buttons")
         
         # Dibujar mensaje si está activo
         if self.show_message:
             self._draw_message()
+        PROFILER.lap("message")
 
     def _draw_laptop(self):
         """Dibuja la ilustración de la laptop idéntica a la imagen de referencia"""
@@ -1811,9 +2226,7 @@ class LaptopBootScreen:
         for i in range(4):
             alpha = 20 - (i * 5)
             shadow_color = (0, 0, 0, alpha)
-            shadow_surface = pygame.Surface((shadow_rect.width + i*2, shadow_rect.height + i*2), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surface, shadow_color, 
-                           (0, 0, shadow_rect.width + i*2, shadow_rect.height + i*2), border_radius=12)
+            shadow_surface = get_rounded_rect_surface((shadow_rect.width + i*2, shadow_rect.height + i*2), shadow_color, 12)
             self.screen.blit(shadow_surface, (shadow_rect.x - i, shadow_rect.y - i))
         
         # === CARCASA PRINCIPAL (COLOR GRIS PLATEADO) ===
@@ -1966,13 +2379,13 @@ class LaptopBootScreen:
                         (logo_rect.x + quad_size + 4, logo_rect.y + quad_size + 4, quad_size, quad_size))
         
         # Texto de carga
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         if self.animation_phase < 60:
             text = "Iniciando..."
         else:
             text = "Windows 11"
         
-        text_surface = font.render(text, True, (255, 255, 255))
+        text_surface = render_text(font, text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(self.screen_rect.centerx, logo_rect.bottom + 30))
         self.screen.blit(text_surface, text_rect)
         
@@ -1999,13 +2412,13 @@ class LaptopBootScreen:
         pygame.draw.rect(self.screen, (0, 120, 215), self.screen_rect, border_radius=5)
         
         # Emoji triste
-        font_large = pygame.font.Font(None, 72)
-        sad_face = font_large.render(":(", True, (255, 255, 255))
+        font_large = get_font(72)
+        sad_face = render_text(font_large, ":(", True, (255, 255, 255))
         sad_rect = sad_face.get_rect(center=(self.screen_rect.centerx, self.screen_rect.y + 60))
         self.screen.blit(sad_face, sad_rect)
         
         # Texto de error
-        font_medium = pygame.font.Font(None, 28)
+        font_medium = get_font(28)
         error_lines = [
             "Tu PC encontró un problema y necesita",
             "reiniciarse. Estamos recopilando información",
@@ -2014,14 +2427,14 @@ class LaptopBootScreen:
         
         y_start = sad_rect.bottom + 20
         for i, line in enumerate(error_lines):
-            text_surface = font_medium.render(line, True, (255, 255, 255))
+            text_surface = render_text(font_medium, line, True, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(self.screen_rect.centerx, y_start + i * 25))
             self.screen.blit(text_surface, text_rect)
         
         # Código de error
-        font_small = pygame.font.Font(None, 20)
+        font_small = get_font(20)
         error_code = "CRITICAL_PROCESS_DIED"
-        code_surface = font_small.render(error_code, True, (200, 200, 200))
+        code_surface = render_text(font_small, error_code, True, (200, 200, 200))
         code_rect = code_surface.get_rect(center=(self.screen_rect.centerx, self.screen_rect.bottom - 30))
         self.screen.blit(code_surface, code_rect)
 
@@ -2037,42 +2450,21 @@ class LaptopBootScreen:
         pygame.draw.rect(self.screen, (50, 50, 50), self.power_button_rect, 2, border_radius=8)
         
         # Icono de power
-        font = pygame.font.Font(None, 24)
-        power_text = font.render("Encender", True, (255, 255, 255))
+        font = get_font(24)
+        power_text = render_text(font, "Encender", True, (255, 255, 255))
         power_rect = power_text.get_rect(center=self.power_button_rect.center)
         self.screen.blit(power_text, power_rect)
 
     def _draw_finish_button(self):
         """Dibuja el botón finalizar"""
         pygame.draw.rect(self.screen, (220, 53, 69), self.finish_button_rect, border_radius=8)
-        font = pygame.font.Font(None, 24)
-        finish_text = font.render("Finalizar", True, (255, 255, 255))
+        font = get_font(24)
+        finish_text = render_text(font, "Finalizar", True, (255, 255, 255))
         finish_rect = finish_text.get_rect(center=self.finish_button_rect.center)
         self.screen.blit(finish_text, finish_rect)
 
-    def _draw_message(self):
-        """Dibuja mensaje de resultado en el lado derecho"""
-        # Fondo del mensaje (MOVIDO AL LADO DERECHO)
-        message_width = 320  # Era 500, más angosto
-        message_height = 140  # Era 120, un poco más alto
-        message_rect = pygame.Rect(
-            self.laptop_rect.right + 30,  # Al lado derecho de la laptop
-            self.laptop_rect.centery - message_height // 2,  # Centrado verticalmente con la laptop
-            message_width, message_height
-        )
-        
-        if self.all_components_present:
-            bg_color = (200, 255, 200)  # Verde claro para éxito
-            border_color = (34, 197, 94)
-        else:
-            bg_color = (255, 200, 200)  # Rojo claro para error
-            border_color = (220, 53, 69)
-            
-        pygame.draw.rect(self.screen, bg_color, message_rect, border_radius=10)
-        pygame.draw.rect(self.screen, border_color, message_rect, 3, border_radius=10)
-        
-        # Texto del mensaje (ajustado para el ancho más pequeño)
-        font = pygame.font.Font(None, 22)  # Un poco más pequeño
+    def _message_lines(self, font, max_width):
+        """Líneas del mensaje de resultado; en el fallo lista los componentes que faltan"""
         if self.all_components_present:
             lines = [
                 "¡Excelente trabajo!",
@@ -2089,20 +2481,58 @@ class LaptopBootScreen:
                 "¡Ups! La laptop no",
                 "puede encender.",
                 "",
-                "Faltan componentes",
-                "internos por ensamblar.",
+                "Faltan:",
+            ]
+            # Los requeridos ausentes, en el orden del catálogo
+            lines += _wrap_names(font, self.outcome.missing.names(), max_width)
+            lines += [
                 "",
                 "Haz clic en Finalizar",
                 "e intenta nuevamente."
             ]
+        return lines
+
+    def _draw_message(self):
+        """Dibuja mensaje de resultado en el lado derecho"""
+        message_width = 320  # Era 500, más angosto
+        font = get_font(22)  # Un poco más pequeño
+        lines = self._message_lines(font, message_width - 20)
+        # Fondo del mensaje (MOVIDO AL LADO DERECHO); crece 16 px por línea si la lista de faltantes ocupa más de una
+        message_height = 140 + max(0, len(lines) - 8) * 16
+        message_rect = pygame.Rect(
+            self.laptop_rect.right + 30,  # Al lado derecho de la laptop
+            self.laptop_rect.centery - message_height // 2,  # Centrado verticalmente con la laptop
+            message_width, message_height
+        )
+        
+        if self.all_components_present:
+            bg_color = (200, 255, 200)  # Verde claro para éxito
+            border_color = (34, 197, 94)
+        else:
+            bg_color = (255, 200, 200)  # Rojo claro para error
+            border_color = (220, 53, 69)
+            
+        pygame.draw.rect(self.screen, bg_color, message_rect, border_radius=10)
+        pygame.draw.rect(self.screen, border_color, message_rect, 3, border_radius=10)
         
         y_start = message_rect.y + 15
         for i, line in enumerate(lines):
             if line:  # Solo dibujar líneas no vacías
-                text_surface = font.render(line, True, (50, 50, 50))
+                text_surface = render_text(font, line, True, (50, 50, 50))
                 text_rect = text_surface.get_rect(center=(message_rect.centerx, y_start + i * 16))
                 self.screen.blit(text_surface, text_rect)
 
+    def _show_result_message(self):
+        """Vence el temporizador: mostrar el mensaje después de la animación"""
+        self._message_timer_handle = None
+        self.show_message = True
+        self.message_timer = 0
+
+    def _cancel_message_timer(self):
+        if self._message_timer_handle is not None:
+            self._message_timer_handle.cancel()
+            self._message_timer_handle = None
+
     def update(self, dt):
         """Actualiza animaciones"""
         if self.laptop_powered_on:
@@ -2118,14 +2548,20 @@ class LaptopBootScreen:
         running = True
         action_result = {"action": "quit"}
 
+        PROFILER.set_screen(type(self).__name__)
+
         while running:
-            dt = clock.tick(60) / 1000.0  # Delta time en segundos
-            mouse_pos = pygame.mouse.get_pos()
+            dt = input_source.tick(clock, 60) / 1000.0  # Delta time en segundos
+            PROFILER.end_frame()
+            PROFILER.mark()
+            mouse_pos = input_source.get_mouse_pos()
             
             # Actualizar animaciones
             self.update(dt)
+            PROFILER.lap("update")
             
-            for event in pygame.event.get():
+            for event in input_source.get_events():
+                PROFILER.handle_event(event)
                 if event.type == pygame.QUIT:
                     action_result = {"action": "quit"}
                     running = False
@@ -2137,21 +2573,21 @@ class LaptopBootScreen:
                         self.animation_timer = 0
                         self.animation_phase = 0
                         # Mostrar mensaje después de 3 segundos
-                        pygame.time.set_timer(pygame.USEREVENT + 1, 3000)
+                        self._cancel_message_timer()
+                        self._message_timer_handle = call_later(MESSAGE_DELAY_MS, self._show_result_message)
                         
                     elif self.finish_button_rect.collidepoint(mouse_pos):
                         action_result = {"action": "back_to_selection"}
                         running = False
 
-                if event.type == pygame.USEREVENT + 1:
-                    # Mostrar mensaje después de la animación
-                    self.show_message = True
-                    self.message_timer = 0
-                    pygame.time.set_timer(pygame.USEREVENT + 1, 0)  # Cancelar timer
+            PROFILER.lap("events")
 
             self.draw()
+            PROFILER.draw_hud(self.screen)
             pygame.display.flip()
+            PROFILER.lap("flip")
 
+        self._cancel_message_timer()  # No dejar el mensaje pendiente al salir de la pantalla
         return action_result
 
 
@@ -2161,7 +2597,7 @@ class DesktopBootScreen:
         self.screen = screen
         self.width = screen.get_width()
         self.height = screen.get_height()
-        self.selected_internal_components = selected_internal_components
+        self.selected_internal_components = ComponentSet(selected_internal_components)
         
         # Estados de la pantalla
         self.desktop_powered_on = False
@@ -2169,15 +2605,11 @@ class DesktopBootScreen:
         self.animation_timer = 0
         self.show_message = False
         self.message_timer = 0
+        self._message_timer_handle = None # Temporizador del mensaje (utils.timer_wheel)
         
         # Verificar si todos los componentes internos están presentes
-        required_desktop_components = [
-            "NVIDIA RTX 3060", "RAM DDR4 8GB", "Ryzen 7 5700X", 
-            "PSU 600W", "HDD Seagate 1TB", "Modulo Wi-Fi/BT",
-            "Ventilador ARGB", "M.2 NVMe SSD", "Cooler Master H212",
-            "Kingston SSD 1TB", "DVD SATA"
-        ]
-        self.all_components_present = all(comp in selected_internal_components for comp in required_desktop_components)
+        self.outcome = evaluate_boot(self.selected_internal_components, "desktop")
+        self.all_components_present = self.outcome.powers_on
         
         # Área del monitor (pantalla principal)
         self.monitor_width = 350
@@ -2244,29 +2676,45 @@ class DesktopBootScreen:
             button_height
         )
 
+    def reset(self, selected_internal_components):
+        """Restablece el estado mutable al reutilizar la pantalla"""
+        self.selected_internal_components = ComponentSet(selected_internal_components)
+        self.outcome = evaluate_boot(self.selected_internal_components, "desktop")
+        self.all_components_present = self.outcome.powers_on
+        self.desktop_powered_on = False
+        self.animation_phase = 0
+        self.animation_timer = 0
+        self.show_message = False
+        self.message_timer = 0
+        self._cancel_message_timer()  # Por si quedó pendiente de la visita anterior
+
     def draw(self):
         """Dibuja la pantalla de encendido de desktop"""
         # Fondo
         self.screen.fill((245, 248, 252))
         
         # Título
-        title_font = pygame.font.Font(None, 36)
-        title_text = title_font.render("Test de Encendido - Desktop", True, (30, 41, 59))
+        title_font = get_font(36)
+        title_text = render_text(title_font, "Test de Encendido - Desktop", True, (30, 41, 59))
         title_rect = title_text.get_rect(center=(self.width // 2, 40))
         self.screen.blit(title_text, title_rect)
+        PROFILER.lap("background")
         
         # Dibujar setup de desktop
         self._draw_desktop_setup()
+        PROFILER.lap("computer")
         
         # Dibujar botón de encendido
         self._draw_power_button()
         
         # Dibujar botón finalizar
         self._draw_finish_button()
+        PROFILER.lap("buttons")
         
         # Dibujar mensaje si está activo
         if self.show_message:
             self._draw_message()
+        PROFILER.lap("message")
 
     def _draw_desktop_setup(self):
         """Dibuja la ilustración completa del setup de desktop"""
@@ -2453,13 +2901,13 @@ class DesktopBootScreen:
                         (logo_rect.x + quad_size + 4, logo_rect.y + quad_size + 4, quad_size, quad_size))
         
         # Texto de carga
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         if self.animation_phase < 60:
             text = "Iniciando..."
         else:
             text = "Windows 11"
         
-        text_surface = font.render(text, True, (255, 255, 255))
+        text_surface = render_text(font, text, True, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(self.screen_rect.centerx, logo_rect.bottom + 25))
         self.screen.blit(text_surface, text_rect)
         
@@ -2486,13 +2934,13 @@ class DesktopBootScreen:
         pygame.draw.rect(self.screen, (0, 120, 215), self.screen_rect, border_radius=4)
         
         # Emoji triste
-        font_large = pygame.font.Font(None, 48)
-        sad_face = font_large.render(":(", True, (255, 255, 255))
+        font_large = get_font(48)
+        sad_face = render_text(font_large, ":(", True, (255, 255, 255))
         sad_rect = sad_face.get_rect(center=(self.screen_rect.centerx, self.screen_rect.y + 40))
         self.screen.blit(sad_face, sad_rect)
         
         # Texto de error
-        font_medium = pygame.font.Font(None, 16)
+        font_medium = get_font(16)
         error_lines = [
             "Tu PC encontró un problema",
             "y necesita reiniciarse.",
@@ -2501,14 +2949,14 @@ class DesktopBootScreen:
         
         y_start = sad_rect.bottom + 15
         for i, line in enumerate(error_lines):
-            text_surface = font_medium.render(line, True, (255, 255, 255))
+            text_surface = render_text(font_medium, line, True, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(self.screen_rect.centerx, y_start + i * 18))
             self.screen.blit(text_surface, text_rect)
         
         # Código de error
-        font_small = pygame.font.Font(None, 14)
+        font_small = get_font(14)
         error_code = "CRITICAL_PROCESS_DIED"
-        code_surface = font_small.render(error_code, True, (200, 200, 200))
+        code_surface = render_text(font_small, error_code, True, (200, 200, 200))
         code_rect = code_surface.get_rect(center=(self.screen_rect.centerx, self.screen_rect.bottom - 20))
         self.screen.blit(code_surface, code_rect)
 
@@ -2524,42 +2972,21 @@ class DesktopBootScreen:
         pygame.draw.rect(self.screen, (50, 50, 50), self.power_button_rect, 2, border_radius=8)
         
         # Icono de power
-        font = pygame.font.Font(None, 24)
-        power_text = font.render("Encender", True, (255, 255, 255))
+        font = get_font(24)
+        power_text = render_text(font, "Encender", True, (255, 255, 255))
         power_rect = power_text.get_rect(center=self.power_button_rect.center)
         self.screen.blit(power_text, power_rect)
 
     def _draw_finish_button(self):
         """Dibuja el botón finalizar"""
         pygame.draw.rect(self.screen, (220, 53, 69), self.finish_button_rect, border_radius=8)
-        font = pygame.font.Font(None, 24)
-        finish_text = font.render("Finalizar", True, (255, 255, 255))
+        font = get_font(24)
+        finish_text = render_text(font, "Finalizar", True, (255, 255, 255))
         finish_rect = finish_text.get_rect(center=self.finish_button_rect.center)
         self.screen.blit(finish_text, finish_rect)
 
-    def _draw_message(self):
-        """Dibuja mensaje de resultado al lado izquierdo"""
-        # Fondo del mensaje (AL LADO IZQUIERDO)
-        message_width = 280
-        message_height = 140
-        message_rect = pygame.Rect(
-            50,  # Al lado izquierdo
-            self.monitor_rect.centery - message_height // 2,  # Centrado verticalmente con el monitor
-            message_width, message_height
-        )
-        
-        if self.all_components_present:
-            bg_color = (200, 255, 200)  # Verde claro para éxito
-            border_color = (34, 197, 94)
-        else:
-            bg_color = (255, 200, 200)  # Rojo claro para error
-            border_color = (220, 53, 69)
-            
-        pygame.draw.rect(self.screen, bg_color, message_rect, border_radius=10)
-        pygame.draw.rect(self.screen, border_color, message_rect, 3, border_radius=10)
-        
-        # Texto del mensaje
-        font = pygame.font.Font(None, 20)
+    def _message_lines(self, font, max_width):
+        """Líneas del mensaje de resultado; en el fallo lista los componentes que faltan"""
         if self.all_components_present:
             lines = [
                 "¡Excelente trabajo!",
@@ -2576,20 +3003,58 @@ class DesktopBootScreen:
                 "¡Ups! El desktop no",
                 "puede encender.",
                 "",
-                "Faltan componentes",
-                "internos por ensamblar.",
+                "Faltan:",
+            ]
+            # Los requeridos ausentes, en el orden del catálogo
+            lines += _wrap_names(font, self.outcome.missing.names(), max_width)
+            lines += [
                 "",
                 "Haz clic en Finalizar",
                 "e intenta nuevamente."
             ]
+        return lines
+
+    def _draw_message(self):
+        """Dibuja mensaje de resultado al lado izquierdo"""
+        message_width = 280
+        font = get_font(20)
+        lines = self._message_lines(font, message_width - 20)
+        # Fondo del mensaje (AL LADO IZQUIERDO); crece 16 px por línea si la lista de faltantes ocupa más de una
+        message_height = 140 + max(0, len(lines) - 8) * 16
+        message_rect = pygame.Rect(
+            50,  # Al lado izquierdo
+            self.monitor_rect.centery - message_height // 2,  # Centrado verticalmente con el monitor
+            message_width, message_height
+        )
+        
+        if self.all_components_present:
+            bg_color = (200, 255, 200)  # Verde claro para éxito
+            border_color = (34, 197, 94)
+        else:
+            bg_color = (255, 200, 200)  # Rojo claro para error
+            border_color = (220, 53, 69)
+            
+        pygame.draw.rect(self.screen, bg_color, message_rect, border_radius=10)
+        pygame.draw.rect(self.screen, border_color, message_rect, 3, border_radius=10)
         
         y_start = message_rect.y + 15
         for i, line in enumerate(lines):
             if line:  # Solo dibujar líneas no vacías
-                text_surface = font.render(line, True, (50, 50, 50))
+                text_surface = render_text(font, line, True, (50, 50, 50))
                 text_rect = text_surface.get_rect(center=(message_rect.centerx, y_start + i * 16))
                 self.screen.blit(text_surface, text_rect)
 
+    def _show_result_message(self):
+        """Vence el temporizador: mostrar el mensaje después de la animación"""
+        self._message_timer_handle = None
+        self.show_message = True
+        self.message_timer = 0
+
+    def _cancel_message_timer(self):
+        if self._message_timer_handle is not None:
+            self._message_timer_handle.cancel()
+            self._message_timer_handle = None
+
     def update(self, dt):
         """Actualiza animaciones"""
         if self.desktop_powered_on:
@@ -2605,14 +3070,20 @@ class DesktopBootScreen:
         running = True
         action_result = {"action": "quit"}
 
+        PROFILER.set_screen(type(self).__name__)
+
         while running:
-            dt = clock.tick(60) / 1000.0  # Delta time en segundos
-            mouse_pos = pygame.mouse.get_pos()
+            dt = input_source.tick(clock, 60) / 1000.0  # Delta time en segundos
+            PROFILER.end_frame()
+            PROFILER.mark()
+            mouse_pos = input_source.get_mouse_pos()
             
             # Actualizar animaciones
             self.update(dt)
+            PROFILER.lap("update")
             
-            for event in pygame.event.get():
+            for event in input_source.get_events():
+                PROFILER.handle_event(event)
                 if event.type == pygame.QUIT:
                     action_result = {"action": "quit"}
                     running = False
@@ -2624,19 +3095,19 @@ class DesktopBootScreen:
                         self.animation_timer = 0
                         self.animation_phase = 0
                         # Mostrar mensaje después de 3 segundos
-                        pygame.time.set_timer(pygame.USEREVENT + 1, 3000)
+                        self._cancel_message_timer()
+                        self._message_timer_handle = call_later(MESSAGE_DELAY_MS, self._show_result_message)
                         
                     elif self.finish_button_rect.collidepoint(mouse_pos):
                         action_result = {"action": "back_to_selection"}
                         running = False
 
-                if event.type == pygame.USEREVENT + 1:
-                    # Mostrar mensaje después de la animación
-                    self.show_message = True
-                    self.message_timer = 0
-                    pygame.time.set_timer(pygame.USEREVENT + 1, 0)  # Cancelar timer
+            PROFILER.lap("events")
 
             self.draw()
+            PROFILER.draw_hud(self.screen)
             pygame.display.flip()
+            PROFILER.lap("flip")
 
+        self._cancel_message_timer()  # No dejar el mensaje pendiente al salir de la pantalla
         return action_result
\ No newline at end of file
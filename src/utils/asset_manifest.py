@@ -0,0 +1,112 @@
+"""
+Manifiesto de imágenes del simulador.
+Las rutas se resuelven una sola vez al iniciar y relativas al paquete, no al
+directorio de trabajo. Cada imagen se busca por nombre lógico (el id del
+componente en el catálogo, o un nombre de interfaz como "logo") y ya trae
+su ruta absoluta, tamaño y mtime. Los archivos faltantes se detectan en esa
+misma pasada, así ninguna pantalla vuelve a intentar abrirlos.
+"""
+
+import os
+
+from model.catalog import get_catalog
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imágenes de interfaz fuera del catálogo (rutas relativas a src/)
+UI_IMAGES = {
+    "logo": "assets/images/logo.png",
+    "laptop_icon": "assets/images/LaptopIcon.png",
+    "desktop_icon": "assets/images/DesktopIcon.png",
+}
+
+
+class AssetEntry:
+    """Imagen del manifiesto; `bytes` y `mtime_ns` son None si el archivo falta"""
+
+    __slots__ = ("name", "rel_path", "path", "bytes", "mtime_ns")
+
+    def __init__(self, name, rel_path, path, bytes=None, mtime_ns=None):
+        self.name = name
+        self.rel_path = rel_path
+        self.path = path
+        self.bytes = bytes
+        self.mtime_ns = mtime_ns
+
+    @property
+    def exists(self):
+        return self.bytes is not None
+
+    def __repr__(self):
+        return f"AssetEntry({self.name!r}, {self.rel_path!r})"
+
+
+class AssetManifest:
+    """Imágenes indexadas por nombre lógico, en orden de declaración"""
+
+    def __init__(self, entries):
+        self._entries = {}
+        for entry in entries:
+            self._entries[entry.name] = entry
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def entry(self, name):
+        """Entrada por nombre lógico (KeyError si no está declarada)"""
+        return self._entries[name]
+
+    def path(self, name):
+        """Ruta absoluta ya resuelta de la imagen"""
+        return self._entries[name].path
+
+    def missing(self):
+        """Entradas cuyo archivo no existe"""
+        return [entry for entry in self._entries.values() if not entry.exists]
+
+    def missing_report(self):
+        """Texto con todas las imágenes faltantes, o None si no falta ninguna"""
+        missing = self.missing()
+        if not missing:
+            return None
+        lines = [f"Faltan {len(missing)} imagen(es); se mostrarán placeholders:"]
+        lines.extend(f"  {entry.name}: {entry.rel_path}" for entry in missing)
+        return "\n".join(lines)
+
+
+def manifest_images():
+    """[(nombre lógico, ruta relativa a src/)]: interfaz primero, luego el catálogo"""
+    images = list(UI_IMAGES.items())
+    images.extend((component.id, component.image) for component in get_catalog())
+    return images
+
+
+def build_manifest(images=None, base_dir=SRC_DIR):
+    """Resuelve y revisa todas las imágenes con un solo stat() por archivo"""
+    entries = []
+    for name, rel_path in (images if images is not None else manifest_images()):
+        path = os.path.realpath(os.path.join(base_dir, rel_path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            entries.append(AssetEntry(name, rel_path, path))
+        else:
+            entries.append(AssetEntry(name, rel_path, path, stat.st_size, stat.st_mtime_ns))
+    return AssetManifest(entries)
+
+
+_manifest = None
+
+
+def get_manifest():
+    """Manifiesto compartido, construido la primera vez que se pide"""
+    global _manifest
+    if _manifest is None:
+        _manifest = build_manifest()
+    return _manifest
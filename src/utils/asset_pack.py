@@ -0,0 +1,210 @@
+"""
+Paquete binario de imágenes preescaladas.
+El comando de construcción decodifica cada PNG una vez y guarda, para cada
+tamaño que piden las pantallas, los píxeles RGBA ya escalados más un índice
+JSON. En ejecución el archivo se mapea en memoria y las superficies se
+arman con pygame.image.frombuffer: sin decodificar PNG ni reescalar.
+
+Formato: MAGIC | largo del índice (uint32 LE) | índice JSON | bloques de píxeles.
+Cada bloque lleva su CRC32 y cada imagen de origen (por nombre lógico del
+manifiesto) su ruta, tamaño y mtime; si el PNG cambió después de construir
+el paquete, esa imagen vuelve a cargarse desde el PNG.
+
+Construir (desde src/):
+    python -m utils.asset_pack
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+import pygame
+
+from utils.asset_manifest import SRC_DIR, get_manifest
+from utils.log import get_logger
+
+DEFAULT_PACK_PATH = os.path.join(SRC_DIR, "data", "assets.pack")
+
+logger = get_logger(__name__)
+
+MAGIC = b"TDSPACK1"
+PACK_VERSION = 2
+PIXEL_FORMAT = "RGBA"
+_HEADER = struct.Struct("<8sI")
+
+# Tamaños que piden las pantallas: tarjeta del estante y mini-tarjetas (laptop; desktop y externos)
+CATALOG_SIZES = ((100, 100), (80, 60), (60, 50))
+
+# Imágenes de interfaz (nombres lógicos del manifiesto) y sus tamaños en pantalla
+UI_IMAGE_SIZES = {
+    "logo": ((200, 150),),
+    "laptop_icon": ((140, 120),),
+    "desktop_icon": ((140, 120),),
+}
+
+
+def pack_contents():
+    """{nombre lógico: tamaños} de todo lo que entra en el paquete"""
+    from model.catalog import get_catalog
+
+    contents = {component.id: list(CATALOG_SIZES) for component in get_catalog()}
+    for name, sizes in UI_IMAGE_SIZES.items():
+        contents[name] = list(sizes)
+    return contents
+
+
+def build_pack(output_path=DEFAULT_PACK_PATH, contents=None):
+    """Construye el paquete; devuelve (imágenes, bloques, bytes de píxeles)"""
+    from utils.assets import ImageCache
+
+    contents = contents if contents is not None else pack_contents()
+    if pygame.display.get_surface() is None:
+        # convert_alpha necesita un modo de video; alcanza con uno invisible de 1x1
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    manifest = get_manifest()
+    sources = {}
+    entries = []
+    blobs = []
+    offset = 0
+    for name, sizes in sorted(contents.items()):
+        asset = manifest.entry(name)
+        if not asset.exists:
+            raise FileNotFoundError(asset.path)
+        # Mismo camino que en ejecución (mipmaps + smoothscale): píxeles idénticos
+        cache = ImageCache()
+        sources[name] = {"path": asset.rel_path, "bytes": asset.bytes, "mtime_ns": asset.mtime_ns}
+        for size in sizes:
+            pixels = pygame.image.tobytes(cache.load(asset.path, size), PIXEL_FORMAT)
+            entries.append({"source": name, "size": list(size), "offset": offset,
+                            "length": len(pixels), "crc32": zlib.crc32(pixels)})
+            blobs.append(pixels)
+            offset += len(pixels)
+
+    index = json.dumps({"version": PACK_VERSION, "pixel_format": PIXEL_FORMAT,
+                        "sources": sources, "entries": entries}).encode("utf-8")
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as pack_file:
+        pack_file.write(_HEADER.pack(MAGIC, len(index)))
+        pack_file.write(index)
+        for pixels in blobs:
+            pack_file.write(pixels)
+    os.replace(temp_path, output_path)  # Nunca queda un paquete a medio escribir
+    return len(sources), len(entries), offset
+
+
+class AssetPack:
+    """Paquete abierto con mmap; entrega superficies por (ruta resuelta, tamaño)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.stale_sources = []  # Imágenes modificadas (o quitadas) después de construir el paquete
+        self.corrupt_entries = 0
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._entries = self._read_index()
+            self._sources = {key[0] for key in self._entries}
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self):
+        if len(self._map) < _HEADER.size:
+            raise ValueError("paquete truncado")
+        magic, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError("no es un paquete de imágenes")
+        data_start = _HEADER.size + index_length
+        index = json.loads(self._map[_HEADER.size:data_start].decode("utf-8"))
+        if index.get("version") != PACK_VERSION or index.get("pixel_format") != PIXEL_FORMAT:
+            raise ValueError("versión de paquete incompatible")
+
+        # El manifiesto ya tiene tamaño y mtime de cada imagen: no hace falta otro stat()
+        manifest = get_manifest()
+        valid_sources = {}
+        for name, stamp in index["sources"].items():
+            asset = manifest.entry(name) if name in manifest else None
+            if (asset is None or asset.rel_path != stamp["path"]
+                    or asset.bytes != stamp["bytes"] or asset.mtime_ns != stamp["mtime_ns"]):
+                self.stale_sources.append(name)
+                continue
+            valid_sources[name] = asset.path
+
+        entries = {}
+        for entry in index["entries"]:
+            real_path = valid_sources.get(entry["source"])
+            if real_path is None:
+                continue
+            start = data_start + entry["offset"]
+            if start + entry["length"] > len(self._map):
+                raise ValueError("paquete truncado")
+            entries[(real_path, tuple(entry["size"]))] = (start, entry["length"], entry["crc32"])
+        return entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def has_source(self, real_path):
+        """True si el paquete trae al menos un tamaño de esa imagen"""
+        return real_path in self._sources
+
+    def surface(self, real_path, size):
+        """Superficie RGBA sin convertir, o None si no está o su CRC no coincide.
+
+        La superficie comparte memoria con el mapeo: hay que convertirla
+        (convert_alpha copia) antes de guardarla.
+        """
+        entry = self._entries.get((real_path, size))
+        if entry is None:
+            return None
+        start, length, crc = entry
+        pixels = memoryview(self._map)[start:start + length]
+        if zlib.crc32(pixels) != crc:
+            # Bloque dañado: se descarta y la imagen sale del PNG
+            del self._entries[(real_path, size)]
+            self.corrupt_entries += 1
+            return None
+        return pygame.image.frombuffer(pixels, size, PIXEL_FORMAT)
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # Aún hay superficies sin convertir apuntando al mapeo
+        self._file.close()
+
+
+def open_asset_pack(path=DEFAULT_PACK_PATH):
+    """Abre el paquete si existe y es válido; si no, devuelve None (se usan los PNG)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        pack = AssetPack(path)
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        logger.warning("Paquete de imágenes ignorado (%s); se cargarán los PNG", error)
+        return None
+    if pack.stale_sources:
+        logger.warning("Paquete de imágenes desactualizado para %d imagen(es); se cargarán desde PNG "
+                       "(reconstruir con: python -m utils.asset_pack)", len(pack.stale_sources))
+    return pack
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Construye el paquete de imágenes preescaladas")
+    parser.add_argument("--output", default=DEFAULT_PACK_PATH, help="archivo de salida")
+    args = parser.parse_args(argv)
+    sources, entries, pixel_bytes = build_pack(args.output)
+    print(f"{args.output}: {sources} imágenes, {entries} tamaños, {pixel_bytes / 1024:.0f} KiB de píxeles")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
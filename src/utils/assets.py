@@ -0,0 +1,238 @@
+"""
+Registro central de imágenes del simulador.
+Cada PNG se decodifica una sola vez por proceso y todas las pantallas
+comparten la misma superficie (no deben modificarla, solo copiarla).
+preload() decodifica por adelantado en un pool de hilos (la decodificación
+libera el GIL); la conversión al formato de pantalla siempre se hace en el
+hilo principal. Con un paquete preescalado (utils.asset_pack) los tamaños
+que piden las pantallas salen de ahí sin tocar el PNG.
+
+Las miniaturas salen de una cadena de mipmaps por imagen (mitades sucesivas
+con smoothscale): cada tamaño se suaviza desde el nivel más chico que
+todavía lo cubre, no desde el original de varios megapíxeles. La cadena
+solo conserva los niveles desde el que cubre el mayor tamaño pedido de esa
+imagen; el original y los niveles más grandes se sueltan apenas se arma el
+pedido (si después se pide un tamaño mayor, se vuelve a decodificar).
+
+Las pantallas piden las imágenes por nombre lógico con load_asset(); las
+rutas salen del manifiesto (utils.asset_manifest).
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from utils.asset_manifest import get_manifest
+
+# Evento que publica cada hilo al terminar una decodificación (despierta al bucle)
+IMAGE_DECODED_EVENT = pygame.event.custom_type()
+
+
+class ImageCache:
+    """Caché de superficies indexada por (ruta resuelta, tamaño, modo alfa)"""
+
+    def __init__(self):
+        self._surfaces = {}
+        self._real_paths = {}  # ruta pedida -> ruta resuelta (evita un realpath por carga)
+        self._mips = {}  # (ruta resuelta, modo alfa) -> [nivel que cubre el mayor tamaño pedido, 1/2, ...]
+        self._mip_needs = {}  # (ruta resuelta, modo alfa) -> (ancho, alto) más grandes pedidos
+        self._pending = {}  # ruta resuelta -> Future con la superficie decodificada sin convertir
+        self._preload_sizes = {}  # ruta resuelta -> tamaños que se arman al adoptar la precarga
+        self._executor = None
+        self._pack = None
+        self.hits = 0
+        self.misses = 0
+        self.preloaded = 0  # Imágenes que llegaron ya decodificadas por el pool
+        self.pack_hits = 0  # Tamaños servidos desde el paquete preescalado
+        self.waited_ms = 0.0  # Tiempo bloqueado esperando una decodificación en curso
+
+    def _resolve(self, path):
+        real_path = self._real_paths.get(path)
+        if real_path is None:
+            real_path = self._real_paths[path] = os.path.realpath(path)
+        return real_path
+
+    def _make_key(self, path, size, alpha):
+        size_key = (int(size[0]), int(size[1])) if size else None
+        return (self._resolve(path), size_key, alpha)
+
+    def load(self, path, size=None, alpha=True):
+        """Devuelve la superficie de la imagen, decodificándola solo la primera vez.
+
+        Lanza la misma excepción que pygame.image.load si el archivo no existe,
+        para que cada pantalla decida qué placeholder mostrar.
+        """
+        key = self._make_key(path, size, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        packed = self._pack.surface(key[0], key[1]) if size is not None and self._pack is not None else None
+        if packed is not None:
+            self.pack_hits += 1
+            surface = packed.convert_alpha() if alpha else packed.convert()
+        elif size is not None:
+            surface = pygame.transform.smoothscale(self._mip_level(key[0], key[1], alpha), key[1])
+        else:
+            surface = self._decode(key[0], alpha)
+
+        self._surfaces[key] = surface
+        return surface
+
+    def _decode(self, real_path, alpha):
+        """Original convertido; usa la decodificación de la precarga si hay una en curso"""
+        future = self._pending.pop(real_path, None)
+        if future is not None:
+            # Solo se espera a esta imagen, no al resto de la precarga
+            started = time.perf_counter()
+            surface = future.result()
+            self.waited_ms += (time.perf_counter() - started) * 1000.0
+            self.preloaded += 1
+        else:
+            surface = pygame.image.load(real_path)
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def _mip_level(self, real_path, size, alpha):
+        """Nivel más chico de la cadena que cubre `size`; agrega mitades solo si faltan"""
+        mip_key = (real_path, alpha)
+        width, height = size
+        chain = self._mips.get(mip_key)
+        if chain is None or chain[0].get_width() < width or chain[0].get_height() < height:
+            # El original no queda en la caché: si ya estaba cargado a tamaño completo se reutiliza
+            original = self._surfaces.get((real_path, None, alpha))
+            chain = self._mips[mip_key] = [original if original is not None else self._decode(real_path, alpha)]
+        level = chain[-1]
+        while level.get_width() // 2 >= width and level.get_height() // 2 >= height:
+            level = pygame.transform.smoothscale(level, (level.get_width() // 2, level.get_height() // 2))
+            chain.append(level)
+        for found in reversed(chain):
+            if found.get_width() >= width and found.get_height() >= height:
+                break
+        else:
+            found = chain[0]  # Pedido más grande que el original: se amplía desde él
+
+        # Soltar el original y los niveles más grandes que el mayor tamaño pedido de esta imagen
+        need_width, need_height = self._mip_needs.get(mip_key, (0, 0))
+        need_width, need_height = self._mip_needs[mip_key] = (max(need_width, width), max(need_height, height))
+        while len(chain) > 1 and chain[1].get_width() >= need_width and chain[1].get_height() >= need_height:
+            del chain[0]
+        return found
+
+    def attach_pack(self, pack):
+        """Usa `pack` (AssetPack o None) para los tamaños preescalados"""
+        self._pack = pack
+
+    def preload(self, paths, max_workers=None, sizes=None):
+        """Empieza a decodificar `paths` en segundo plano y vuelve de inmediato.
+
+        Las imágenes se convierten (convert_alpha) recién cuando alguien las
+        pide con load() o al llamar adopt_preloaded() desde el hilo principal.
+        `sizes` ({ruta: tamaños}) indica qué tamaños arma adopt_preloaded; las
+        rutas sin tamaños se adoptan a resolución completa.
+        """
+        if self._executor is None:
+            workers = max_workers or min(4, os.cpu_count() or 1)
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-preload")
+        for path in paths:
+            real_path = self._resolve(path)
+            if real_path in self._pending or (real_path, None, True) in self._surfaces:
+                continue
+            if self._pack is not None and self._pack.has_source(real_path):
+                continue  # Sus tamaños ya vienen escalados en el paquete
+            self._pending[real_path] = self._executor.submit(_decode_image, real_path)
+            if sizes and sizes.get(path):
+                # El más grande primero: los demás salen de su cadena sin volver a decodificar
+                self._preload_sizes[real_path] = sorted(sizes[path], key=lambda size: size[0] * size[1], reverse=True)
+
+    def adopt_preloaded(self, budget_ms=8.0):
+        """Convierte en el hilo principal las imágenes ya decodificadas, sin bloquear.
+
+        Arma solo los tamaños que se pidieron en preload() y suelta el
+        original. Se detiene al agotar `budget_ms` para no trabar el frame
+        actual; devuelve cuántas imágenes siguen pendientes.
+        """
+        started = time.perf_counter()
+        for real_path, future in list(self._pending.items()):
+            if (time.perf_counter() - started) * 1000.0 >= budget_ms:
+                break
+            if not future.done():
+                continue
+            try:
+                for size in self._preload_sizes.pop(real_path, None) or (None,):
+                    self.load(real_path, size)
+            except (pygame.error, OSError):
+                pass  # La pantalla que la pida volverá a intentarlo y mostrará su placeholder
+            self._pending.pop(real_path, None)  # Si todos sus tamaños ya estaban, nadie consumió la decodificación
+        return len(self._pending)
+
+    def pending(self):
+        """Cantidad de imágenes encoladas o decodificadas que aún no se convirtieron"""
+        return len(self._pending)
+
+    def shutdown(self):
+        """Cancela la precarga, espera a los hilos y cierra el paquete (antes de pygame.quit)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+        self._preload_sizes.clear()
+        if self._pack is not None:
+            self._pack.close()
+            self._pack = None
+
+    def stats(self):
+        """Resumen de uso de la caché"""
+        return {"entries": len(self._surfaces), "mip_levels": sum(len(chain) for chain in self._mips.values()),
+                "hits": self.hits, "misses": self.misses,
+                "preloaded": self.preloaded, "pending": len(self._pending), "pack_hits": self.pack_hits,
+                "waited_ms": round(self.waited_ms, 3)}
+
+    def clear(self):
+        """Libera todas las superficies (por ejemplo, si cambia el modo de video)"""
+        self._surfaces.clear()
+        self._mips.clear()
+        self._mip_needs.clear()
+        self._pending.clear()  # Las decodificaciones en curso terminan, pero nadie las convierte
+        self._preload_sizes.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _decode_image(real_path):
+    """Tarea del pool: decodifica el PNG y avisa al hilo principal"""
+    surface = pygame.image.load(real_path)
+    try:
+        pygame.event.post(pygame.event.Event(IMAGE_DECODED_EVENT, path=real_path))
+    except pygame.error:
+        pass  # El sistema de eventos ya no está disponible (cierre en curso)
+    return surface
+
+
+# Instancia compartida por todo el proceso
+IMAGE_CACHE = ImageCache()
+
+
+def load_image(path, size=None, alpha=True):
+    """Atajo para cargar una imagen desde la caché compartida"""
+    return IMAGE_CACHE.load(path, size, alpha)
+
+
+def load_asset(name, size=None, alpha=True):
+    """Carga una imagen por su nombre lógico en el manifiesto.
+
+    Si el archivo faltaba al construir el manifiesto lanza FileNotFoundError
+    sin volver a buscarlo en disco.
+    """
+    entry = get_manifest().entry(name)
+    if not entry.exists:
+        raise FileNotFoundError(entry.path)
+    return IMAGE_CACHE.load(entry.path, size, alpha)
+
+
+def preload_images(paths, max_workers=None, sizes=None):
+    """Atajo para precargar imágenes en la caché compartida"""
+    IMAGE_CACHE.preload(paths, max_workers, sizes)
@@ -0,0 +1,280 @@
+"""
+Validación por lotes de listas de componentes (calificación de entregas).
+Aplica a cada armado las mismas reglas que el simulador: los mínimos del
+estante (model.validation.validate_selection, sin la regla del estante
+visible) y el encendido (evaluate_boot con los componentes internos). Como
+en EstanteScreen, los obligatorios del tipo (la tarjeta madre en desktop)
+se agregan aunque la lista no los traiga.
+
+Formatos de entrada (un armado por línea):
+    JSON lines: {"id": "ana", "computer_type": "laptop", "components": ["RAM DDR4 8GB", ...]}
+    CSV con encabezado id,computer_type,components y los componentes separados por ";"
+
+Las líneas se reparten en bloques entre un pool de procesos; cada veredicto
+sale como una línea JSON en el orden de entrada y al final se imprime el
+resumen en stderr.
+
+Desde src/:
+    python -m utils.build_validator entregas.jsonl --output veredictos.jsonl
+    python -m utils.build_validator entregas.csv --summary resumen.json --quiet
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+
+from model.catalog import get_catalog
+from model.validation import MIN_INTERNAL_SELECTION, evaluate_boot, validate_selection
+
+CHUNK_SIZE = 2000            # Líneas por tarea del pool
+CSV_COMPONENT_SEPARATOR = ";"
+
+# Veredictos
+OK = "ok"
+INVALID = "invalid"          # No pasa los mínimos del estante o trae componentes que no existen
+NO_BOOT = "no_boot"          # Selección válida, pero faltan componentes para encender
+ERROR = "error"              # Línea ilegible o tipo de computadora desconocido
+
+UNKNOWN_COMPONENT = "unknown_component"
+UNAVAILABLE_COMPONENT = "unavailable_component"
+
+VERDICT_CACHE_SIZE = 4096    # Armados distintos recordados por proceso
+
+_verdict_cache = {}          # (tipo, frozenset de nombres) -> campos del veredicto, por proceso
+
+
+def evaluate_build(computer_type, names, catalog=None):
+    """Veredicto de un armado (sin id); los armados repetidos se resuelven desde la caché"""
+    names = tuple(dict.fromkeys(names))  # Sin duplicados, conservando el orden
+    key = (computer_type, frozenset(names))
+    verdict = _verdict_cache.get(key)
+    if verdict is None:
+        verdict = _evaluate(computer_type, names, catalog if catalog is not None else get_catalog())
+        if len(_verdict_cache) >= VERDICT_CACHE_SIZE:
+            del _verdict_cache[next(iter(_verdict_cache))]  # Descarta el más antiguo (orden de inserción)
+        _verdict_cache[key] = verdict
+    return verdict
+
+
+def _evaluate(computer_type, names, catalog):
+    if computer_type not in MIN_INTERNAL_SELECTION:
+        return {"verdict": ERROR, "code": "unknown_computer_type",
+                "message": f"Tipo de computadora desconocido: {computer_type!r}"}
+
+    names = list(names) + [c.name for c in catalog.mandatory_for(computer_type) if c.name not in names]
+    unknown, unavailable, internals = [], [], []
+    for name in names:
+        component = catalog.by_name(name)
+        if component is None:
+            unknown.append(name)
+        elif computer_type not in component.computer_types:
+            # En el estante, los internos de otro tipo aparecen deshabilitados y no se pueden elegir
+            unavailable.append(name)
+        elif not component.is_external:
+            internals.append(name)
+    boot = evaluate_boot(internals, computer_type, catalog)
+    verdict = {"verdict": OK, "code": None, "powers_on": boot.powers_on, "missing": boot.missing.names()}
+
+    if unknown or unavailable:
+        verdict["verdict"] = INVALID
+        verdict["code"] = UNKNOWN_COMPONENT if unknown else UNAVAILABLE_COMPONENT
+        # Orden fijo (catálogo / alfabético): la caché comparte el veredicto entre listas en otro orden
+        verdict["unknown"] = sorted(unknown)
+        verdict["unavailable"] = [c.name for c in catalog if c.name in unavailable]
+        return verdict
+    check = validate_selection(names, computer_type, catalog=catalog)
+    if not check.ok:
+        verdict["verdict"] = INVALID
+        verdict["code"] = check.code
+        verdict["message"] = check.message.replace("\n", " ")
+    elif not boot.powers_on:
+        verdict["verdict"] = NO_BOOT
+    return verdict
+
+
+def _parse_jsonl(lines, first_line):
+    """(número de línea, id, tipo, componentes); una línea ilegible trae la excepción como componentes"""
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            yield line_number, entry.get("id"), entry.get("computer_type"), entry.get("components") or ()
+        except (ValueError, AttributeError) as error:
+            yield line_number, None, None, error
+
+
+def _parse_csv(records, fieldnames):
+    """Registros ya separados por csv.reader: (línea donde empieza, campos)"""
+    for line_number, fields in records:
+        if not any(field.strip() for field in fields):
+            continue
+        row = dict(zip(fieldnames, fields))
+        components = row.get("components") or ""
+        # Un id vacío cuenta como ausente (el veredicto lleva el número de línea, como en JSONL)
+        yield (line_number, row.get("id") or None, (row.get("computer_type") or "").strip(),
+               [name.strip() for name in components.split(CSV_COMPONENT_SEPARATOR) if name.strip()])
+
+
+def validate_chunk(first_line, lines, input_format, fieldnames=None):
+    """Tarea del pool: evalúa un bloque y devuelve (veredictos JSON, estadísticas).
+
+    En JSONL `lines` son líneas crudas desde first_line; en CSV son
+    registros (número de línea, campos) armados por _read_chunks.
+    """
+    catalog = get_catalog()
+    if input_format == "csv":
+        rows = _parse_csv(lines, fieldnames)
+    else:
+        rows = _parse_jsonl(lines, first_line)
+    output = []
+    stats = {"verdicts": collections.Counter(), "codes": collections.Counter(),
+             "computer_types": collections.Counter(), "missing": collections.Counter()}
+    for line_number, build_id, computer_type, components in rows:
+        if isinstance(components, Exception):
+            verdict = {"verdict": ERROR, "code": "unreadable_line", "message": str(components)}
+        elif not isinstance(components, (list, tuple)) or not all(isinstance(name, str) for name in components):
+            verdict = {"verdict": ERROR, "code": "unreadable_line",
+                       "message": "'components' debe ser una lista de nombres"}
+        elif not isinstance(computer_type, str):
+            verdict = {"verdict": ERROR, "code": "unreadable_line",
+                       "message": "'computer_type' debe ser un texto"}
+        else:
+            verdict = evaluate_build(computer_type, components, catalog)
+        stats["verdicts"][verdict["verdict"]] += 1
+        if verdict["code"]:
+            stats["codes"][verdict["code"]] += 1
+        if verdict["verdict"] != ERROR:
+            stats["computer_types"][computer_type] += 1
+            stats["missing"].update(verdict["missing"])
+        record = {"id": build_id if build_id is not None else line_number, "computer_type": computer_type}
+        record.update(verdict)
+        output.append(json.dumps(record, ensure_ascii=False))
+    return output, stats
+
+
+def _read_chunks(input_file, input_format):
+    """(número de la primera línea, bloque, encabezado) de a CHUNK_SIZE líneas o registros"""
+    if input_format == "csv":
+        yield from _read_csv_chunks(input_file)
+        return
+    first_line = 1
+    while True:
+        lines = list(itertools.islice(input_file, CHUNK_SIZE))
+        if not lines:
+            return
+        yield first_line, lines, None
+        first_line += len(lines)
+
+
+def _read_csv_chunks(input_file):
+    """En CSV un campo entre comillas puede ocupar varias líneas: los registros se separan
+    aquí con csv.reader (no en los procesos) y viajan con la línea donde empiezan"""
+    reader = csv.reader(input_file)
+    fieldnames = [name.strip() for name in next(reader, None) or ()]
+    next_line = reader.line_num + 1
+    while True:
+        records = []
+        for fields in itertools.islice(reader, CHUNK_SIZE):
+            records.append((next_line, fields))
+            next_line = reader.line_num + 1
+        if not records:
+            return
+        yield records[0][0], records, fieldnames
+
+
+def _run_chunks(chunks, input_format, workers):
+    """Resultados de validate_chunk en el orden de entrada, con a lo sumo 2 bloques por proceso en vuelo"""
+    if workers <= 1:
+        for first_line, lines, fieldnames in chunks:
+            yield validate_chunk(first_line, lines, input_format, fieldnames)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for first_line, lines, fieldnames in chunks:
+            pending.append(executor.submit(validate_chunk, first_line, lines, input_format, fieldnames))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def validate_file(input_path, output_file=None, input_format=None, workers=None):
+    """Valida todos los armados de input_path; escribe los veredictos en output_file y devuelve el resumen"""
+    if input_format is None:
+        input_format = "csv" if input_path.lower().endswith(".csv") else "jsonl"
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    totals = {"verdicts": collections.Counter(), "codes": collections.Counter(),
+              "computer_types": collections.Counter(), "missing": collections.Counter()}
+    started = time.perf_counter()
+    with open(input_path, encoding="utf-8", newline="") as input_file:
+        for output, stats in _run_chunks(_read_chunks(input_file, input_format), input_format, workers):
+            if output_file is not None and output:
+                output_file.write("\n".join(output))
+                output_file.write("\n")
+            for name, counter in stats.items():
+                totals[name].update(counter)
+    elapsed = time.perf_counter() - started
+
+    builds = sum(totals["verdicts"].values())
+    return {
+        "builds": builds,
+        "passed": totals["verdicts"][OK],
+        "verdicts": dict(totals["verdicts"]),
+        "codes": dict(totals["codes"]),
+        "computer_types": dict(totals["computer_types"]),
+        "most_missing": totals["missing"].most_common(5),
+        "workers": workers,
+        "elapsed_s": round(elapsed, 3),
+        "builds_per_s": round(builds / elapsed) if elapsed > 0 else None,
+    }
+
+
+def format_summary(summary):
+    lines = [f"armados: {summary['builds']}  aprobados: {summary['passed']}  "
+             f"({summary['elapsed_s']:.2f} s, {summary['builds_per_s'] or 0} armados/s, "
+             f"{summary['workers']} procesos)"]
+    for verdict, count in sorted(summary["verdicts"].items()):
+        lines.append(f"  {verdict:<16}{count:>10}")
+    for code, count in sorted(summary["codes"].items()):
+        lines.append(f"    {code:<22}{count:>8}")
+    if summary["most_missing"]:
+        lines.append("componentes que más faltan: " +
+                     ", ".join(f"{name} ({count})" for name, count in summary["most_missing"]))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Valida por lotes listas de componentes con las reglas del simulador")
+    parser.add_argument("input", help="archivo de armados (.jsonl o .csv)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="formato de entrada (por defecto según la extensión)")
+    parser.add_argument("--output", metavar="ARCHIVO", help="veredictos en JSON lines (por defecto stdout)")
+    parser.add_argument("--summary", metavar="ARCHIVO", help="guarda el resumen en JSON")
+    parser.add_argument("--workers", type=int, help="procesos del pool (por defecto uno por CPU; 1 = sin pool)")
+    parser.add_argument("--quiet", action="store_true", help="no escribe veredictos, solo el resumen")
+    args = parser.parse_args(argv)
+
+    if args.quiet:
+        summary = validate_file(args.input, None, args.format, args.workers)
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            summary = validate_file(args.input, output_file, args.format, args.workers)
+    else:
+        summary = validate_file(args.input, sys.stdout, args.format, args.workers)
+
+    print(format_summary(summary), file=sys.stderr)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as summary_file:
+            json.dump(summary, summary_file, indent=2, ensure_ascii=False)
+    return 0 if summary["verdicts"].get(ERROR, 0) == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
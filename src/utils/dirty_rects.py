@@ -0,0 +1,97 @@
+"""
+Renderizado por rectángulos sucios para las pantallas de arrastrar y soltar.
+En lugar de enviar la ventana completa con display.flip() en cada frame,
+solo se redibujan y actualizan las regiones que cambiaron (tarjetas que se
+movieron, slots con hover, botones). Cualquier cambio global (alerta,
+transición, ventana expuesta) vuelve al modo de frame completo.
+"""
+
+import pygame
+
+from utils.frame_scheduler import REDRAW_EVENT_TYPES
+
+
+class DirtyRectTracker:
+    """Acumula las regiones modificadas entre un frame y el siguiente"""
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self._full_redraw = True  # El primer frame siempre es completo
+        self._dirty = []
+        self._previous = {}  # clave -> (rect, estado) del último frame presentado
+        # Estadísticas de tráfico de píxeles hacia la pantalla
+        self.frames_full = 0
+        self.frames_partial = 0
+        self.frames_skipped = 0
+        self.pixels_presented = 0
+
+    def invalidate_all(self):
+        """Fuerza un frame completo (transiciones, alertas, ventana expuesta)"""
+        self._full_redraw = True
+
+    def mark(self, rect):
+        """Marca una región como sucia"""
+        self._dirty.append(pygame.Rect(rect))
+
+    def track(self, key, rect, state=None):
+        """Registra la posición y el estado visual de un elemento.
+
+        Si cambió respecto al frame anterior se marcan la región vieja y la nueva.
+        """
+        rect = pygame.Rect(rect)
+        previous = self._previous.get(key)
+        if previous is None:
+            self.mark(rect)
+        else:
+            old_rect, old_state = previous
+            if old_rect != rect or old_state != state:
+                self.mark(old_rect)
+                self.mark(rect)
+        self._previous[key] = (rect, state)
+
+    def process_event(self, event):
+        """Detecta eventos de ventana que requieren repintar todo"""
+        if event.type in REDRAW_EVENT_TYPES:
+            self.invalidate_all()
+
+    def present(self, draw):
+        """Dibuja (con recorte) y envía a la pantalla solo lo necesario.
+
+        `draw` es la función de dibujo completa de la pantalla; el recorte
+        evita que rellene píxeles fuera de las regiones sucias.
+        """
+        if self._full_redraw:
+            draw()
+            pygame.display.flip()
+            self.frames_full += 1
+            self.pixels_presented += self.screen_rect.width * self.screen_rect.height
+            self._full_redraw = False
+            self._dirty = []
+            return
+
+        rects = [rect.clip(self.screen_rect) for rect in self._dirty]
+        rects = [rect for rect in rects if rect.width > 0 and rect.height > 0]
+        self._dirty = []
+        if not rects:
+            self.frames_skipped += 1
+            return
+
+        bounds = rects[0].unionall(rects[1:])
+        self.screen.set_clip(bounds)
+        try:
+            draw()
+        finally:
+            self.screen.set_clip(None)
+        pygame.display.update(rects)
+        self.frames_partial += 1
+        self.pixels_presented += sum(rect.width * rect.height for rect in rects)
+
+    def stats(self):
+        """Resumen del tráfico de píxeles presentado"""
+        return {
+            "frames_full": self.frames_full,
+            "frames_partial": self.frames_partial,
+            "frames_skipped": self.frames_skipped,
+            "pixels_presented": self.pixels_presented,
+        }
@@ -0,0 +1,49 @@
+"""
+Registro de fuentes compartido por todas las pantallas.
+Cada combinación (fuente, tamaño, estilo) se construye una sola vez;
+el contador `constructions` permite comprobar que en estado estable
+no se crean fuentes nuevas en cada frame.
+"""
+
+import pygame
+
+
+class FontRegistry:
+    """Caché de objetos pygame.font.Font indexada por (fuente, tamaño, estilo)"""
+
+    def __init__(self):
+        self._fonts = {}
+        self.constructions = 0  # Fuentes creadas realmente
+        self.lookups = 0        # Peticiones totales
+
+    def get(self, size, face=None, bold=False, italic=False):
+        """Devuelve la fuente pedida; face=None usa la fuente por defecto de pygame"""
+        self.lookups += 1
+        key = (face, int(size), bool(bold), bool(italic))
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(face, key[1])
+            font.set_bold(key[2])
+            font.set_italic(key[3])
+            self.constructions += 1
+            self._fonts[key] = font
+        return font
+
+    def stats(self):
+        """Resumen de uso del registro"""
+        return {"fonts": len(self._fonts), "constructions": self.constructions, "lookups": self.lookups}
+
+    def clear(self):
+        """Libera las fuentes (necesario si se llama a pygame.font.quit)"""
+        self._fonts.clear()
+
+
+# Instancia compartida por todo el proceso
+FONTS = FontRegistry()
+
+
+def get_font(size, face=None, bold=False, italic=False):
+    """Atajo para obtener una fuente del registro compartido"""
+    return FONTS.get(size, face, bold, italic)
@@ -0,0 +1,63 @@
+"""
+Planificador de frames compartido por las pantallas.
+Limita los FPS y, cuando nada cambió, no redibuja: bloquea en
+pygame.event.wait con timeout para que la CPU quede en reposo.
+"""
+
+import pygame
+
+from utils import input_source
+
+# Eventos de ventana que obligan a repintar aunque el estado no cambie
+REDRAW_EVENT_TYPES = {
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+}
+
+
+class FrameScheduler:
+    """Controla el ritmo del bucle principal de una pantalla"""
+
+    def __init__(self, fps=60, idle_timeout_ms=500):
+        self.fps = fps
+        self.idle_timeout_ms = idle_timeout_ms  # Máximo tiempo bloqueado sin eventos
+        self.clock = pygame.time.Clock()
+        self._needs_redraw = True  # El primer frame siempre se dibuja
+
+    def request_redraw(self):
+        """Marca que el siguiente frame debe dibujarse"""
+        self._needs_redraw = True
+
+    def needs_redraw(self):
+        return self._needs_redraw
+
+    def frame_drawn(self):
+        """Se llama después de dibujar y hacer flip"""
+        self._needs_redraw = False
+
+    def get_events(self):
+        """Devuelve los eventos del frame.
+
+        Si hay un redibujado pendiente no bloquea; si no, espera el siguiente
+        evento (o el timeout) en lugar de girar en vacío.
+        """
+        if self._needs_redraw or input_source.is_uncapped():
+            events = input_source.get_events()
+        else:
+            first_event = input_source.wait_event(self.idle_timeout_ms)
+            if first_event.type == pygame.NOEVENT:
+                return []
+            events = [first_event] + input_source.get_events()
+
+        for event in events:
+            if event.type in REDRAW_EVENT_TYPES:
+                self._needs_redraw = True
+                break
+        return events
+
+    def tick(self):
+        """Limita los FPS; devuelve los milisegundos desde el último frame"""
+        return input_source.tick(self.clock, self.fps)
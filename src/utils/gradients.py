@@ -0,0 +1,59 @@
+"""
+Generador de fondos con gradiente.
+Cada combinación (tamaño, colores) se construye una sola vez y se
+reutiliza, así cada frame solo necesita un blit.
+"""
+
+import pygame
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional; sin él se usa el escalado de una columna
+    numpy = None
+
+_gradient_cache = {}
+
+
+def _build_with_numpy(width, height, color1, color2):
+    ratios = numpy.arange(height, dtype=numpy.float64) / height
+    start = numpy.array(color1[:3], dtype=numpy.float64)
+    end = numpy.array(color2[:3], dtype=numpy.float64)
+    column = (start * (1 - ratios[:, None]) + end * ratios[:, None]).astype(numpy.uint8)
+    # surfarray usa ejes (x, y, canal)
+    pixels = numpy.broadcast_to(column[None, :, :], (width, height, 3))
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, numpy.ascontiguousarray(pixels))
+    return surface
+
+
+def _build_with_column(width, height, color1, color2):
+    # Una columna de 1px con el color de cada fila, estirada horizontalmente
+    column = pygame.Surface((1, height))
+    for y in range(height):
+        ratio = y / height
+        r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
+        g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
+        b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+        column.set_at((0, y), (r, g, b))
+    return pygame.transform.scale(column, (width, height))
+
+
+def get_vertical_gradient(size, color1, color2):
+    """Devuelve una superficie (compartida) con gradiente vertical de color1 a color2"""
+    width, height = int(size[0]), int(size[1])
+    key = (width, height, tuple(color1), tuple(color2))
+    surface = _gradient_cache.get(key)
+    if surface is None:
+        if numpy is not None:
+            surface = _build_with_numpy(width, height, color1, color2)
+        else:
+            surface = _build_with_column(width, height, color1, color2)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()  # Formato de pantalla para blits rápidos
+        _gradient_cache[key] = surface
+    return surface
+
+
+def clear_gradient_cache():
+    """Libera los gradientes generados"""
+    _gradient_cache.clear()
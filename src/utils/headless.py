@@ -0,0 +1,208 @@
+"""
+Modo headless para pruebas automatizadas y benchmarks.
+Ejecuta el flujo real de pantallas sin ventana (driver de video "dummy"),
+alimentado por un guion de eventos en JSON, y mide FPS y tiempos por pantalla.
+
+Formato del guion: {"steps": [...]} donde cada paso es uno de
+    {"click": [x, y]}                      mover, presionar y soltar
+    {"drag": [[x1, y1], [x2, y2]], "steps": 8}
+    {"move": [x, y]}
+    {"key": "escape"}
+    {"wait": 10}                           frames sin entrada
+    {"wait_ms": 3200}                      tiempo real (temporizadores, utils.timer_wheel)
+    {"quit": true}
+Un paso puede llevar "screen": "<nombre>" para esperar a que esa pantalla
+esté activa antes de ejecutarse. Al terminar el guion se envía QUIT.
+"""
+
+import json
+import os
+import time
+
+import pygame
+
+from utils import input_source
+
+# Frames máximos esperando una pantalla antes de abandonar el guion
+SCREEN_WAIT_LIMIT = 600
+
+
+def enable_dummy_video():
+    """Debe llamarse antes de pygame.display.set_mode"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+class ScriptError(ValueError):
+    pass
+
+
+def load_script(path):
+    """Lee un guion y lo expande a una lista de frames de eventos"""
+    with open(path, encoding="utf-8") as script_file:
+        data = json.load(script_file)
+    steps = data["steps"] if isinstance(data, dict) else data
+    return [_expand_step(step) for step in steps]
+
+
+def _mouse_event(event_type, pos, **attrs):
+    if event_type == pygame.MOUSEMOTION:
+        attrs.setdefault("rel", (0, 0))
+        attrs.setdefault("buttons", (0, 0, 0))
+    else:
+        attrs.setdefault("button", 1)
+    return pygame.event.Event(event_type, pos=tuple(pos), **attrs)
+
+
+def _expand_step(step):
+    """Convierte un paso en (pantalla esperada, frames); cada frame es (pos, eventos) o una espera"""
+    screen = step.get("screen")
+    if "click" in step:
+        pos = tuple(step["click"])
+        # La posición se fija un frame antes del clic porque varias pantallas
+        # leen el mouse al inicio del frame y no del evento
+        frames = [(pos, [_mouse_event(pygame.MOUSEMOTION, pos)]),
+                  (pos, [_mouse_event(pygame.MOUSEBUTTONDOWN, pos)]),
+                  (pos, [_mouse_event(pygame.MOUSEBUTTONUP, pos)])]
+    elif "drag" in step:
+        (x1, y1), (x2, y2) = step["drag"]
+        count = max(1, int(step.get("steps", 8)))
+        frames = [((x1, y1), [_mouse_event(pygame.MOUSEMOTION, (x1, y1))]),
+                  ((x1, y1), [_mouse_event(pygame.MOUSEBUTTONDOWN, (x1, y1))])]
+        for i in range(1, count + 1):
+            pos = (x1 + (x2 - x1) * i // count, y1 + (y2 - y1) * i // count)
+            frames.append((pos, [_mouse_event(pygame.MOUSEMOTION, pos, buttons=(1, 0, 0))]))
+        frames.append(((x2, y2), [_mouse_event(pygame.MOUSEBUTTONUP, (x2, y2))]))
+    elif "move" in step:
+        pos = tuple(step["move"])
+        frames = [(pos, [_mouse_event(pygame.MOUSEMOTION, pos)])]
+    elif "key" in step:
+        key = pygame.key.key_code(step["key"])
+        frames = [(None, [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)]),
+                  (None, [pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0)])]
+    elif "wait" in step:
+        frames = [(None, [])] * int(step["wait"])
+    elif "wait_ms" in step:
+        frames = [("wait_ms", float(step["wait_ms"]))]
+    elif step.get("quit"):
+        frames = [(None, [pygame.event.Event(pygame.QUIT)])]
+    else:
+        raise ScriptError(f"Paso de guion no reconocido: {step!r}")
+    return screen, frames
+
+
+class ScriptedInput:
+    """Entrega los eventos del guion, un frame por llamada a get_events()"""
+
+    uncapped = True
+
+    def __init__(self, steps, initial_mouse_pos=(0, 0)):
+        self._frames = []
+        for screen, frames in steps:
+            if screen is not None:
+                self._frames.append(("screen", screen))
+            self._frames.extend(frames)
+        self._index = 0
+        self._mouse_pos = tuple(initial_mouse_pos)
+        self._wait_until = None
+        self._screen_wait = 0
+        self.current_screen = None
+        self.finished = False
+        self.aborted_on = None  # Pantalla esperada que nunca apareció
+
+    def get_events(self):
+        # Los eventos reales (timers, ventana) siguen llegando por la cola de pygame
+        events = pygame.event.get()
+        events.extend(self._next_frame())
+        return events
+
+    def get_mouse_pos(self):
+        return self._mouse_pos
+
+    def _next_frame(self):
+        while self._index < len(self._frames):
+            pos, payload = self._frames[self._index]
+            if pos == "screen":
+                if self.current_screen == payload:
+                    self._index += 1
+                    self._screen_wait = 0
+                    continue
+                self._screen_wait += 1
+                if self._screen_wait > SCREEN_WAIT_LIMIT:
+                    self.aborted_on = payload
+                    self._index = len(self._frames)
+                    break
+                return []
+            if pos == "wait_ms":
+                now = time.perf_counter()
+                if self._wait_until is None:
+                    self._wait_until = now + payload / 1000.0
+                if now < self._wait_until:
+                    return []
+                self._wait_until = None
+                self._index += 1
+                continue
+            self._index += 1
+            if pos is not None:
+                self._mouse_pos = pos
+            return list(payload)
+
+        # Guion terminado: cerrar la aplicación
+        self.finished = True
+        return [pygame.event.Event(pygame.QUIT)]
+
+
+class RunReport:
+    """Acumula tiempo y frames por pantalla durante una corrida"""
+
+    def __init__(self):
+        self.screens = {}
+        self._current = None
+        self._started = None
+        self._start_frames = 0
+        self.total_time = 0.0
+        self.total_frames = 0
+
+    def begin(self, screen_name):
+        self._current = screen_name
+        self._started = time.perf_counter()
+        self._start_frames = input_source.frames
+        source = input_source.get_input_source()
+        if hasattr(source, "current_screen"):
+            source.current_screen = screen_name
+
+    def end(self):
+        if self._current is None:
+            return
+        elapsed = time.perf_counter() - self._started
+        frames = input_source.frames - self._start_frames
+        entry = self.screens.setdefault(self._current, {"visits": 0, "frames": 0, "seconds": 0.0})
+        entry["visits"] += 1
+        entry["frames"] += frames
+        entry["seconds"] += elapsed
+        self.total_time += elapsed
+        self.total_frames += frames
+        self._current = None
+
+    def as_dict(self):
+        screens = {}
+        for name, entry in self.screens.items():
+            seconds = entry["seconds"]
+            screens[name] = dict(entry, fps=round(entry["frames"] / seconds, 1) if seconds else None,
+                                 ms_per_frame=round(seconds * 1000.0 / entry["frames"], 3) if entry["frames"] else None)
+        return {
+            "total_seconds": round(self.total_time, 4),
+            "total_frames": self.total_frames,
+            "fps": round(self.total_frames / self.total_time, 1) if self.total_time else None,
+            "screens": screens,
+        }
+
+    def format(self):
+        """Tabla legible para la consola"""
+        data = self.as_dict()
+        lines = [f"{'pantalla':<22}{'visitas':>8}{'frames':>8}{'seg':>9}{'FPS':>9}{'ms/frame':>10}"]
+        for name, entry in data["screens"].items():
+            lines.append(f"{name:<22}{entry['visits']:>8}{entry['frames']:>8}{entry['seconds']:>9.3f}"
+                         f"{entry['fps'] or 0:>9.1f}{entry['ms_per_frame'] or 0:>10.3f}")
+        lines.append(f"{'total':<22}{'':>8}{data['total_frames']:>8}{data['total_seconds']:>9.3f}{data['fps'] or 0:>9.1f}")
+        return "\n".join(lines)
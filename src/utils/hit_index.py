@@ -0,0 +1,117 @@
+"""
+Índice espacial para detección de clics y solapamientos.
+Los elementos se guardan por clave (búsqueda O(1), p. ej. slot por id) y
+además en una grilla uniforme: para saber qué rectángulos contienen un
+punto solo se revisan los de la celda correspondiente, no todos.
+Pensado para tableros con muchos slots (placas de servidor con 40+).
+"""
+
+import pygame
+
+
+class HitIndex:
+    """Rectángulos indexados por clave y por celdas de una grilla uniforme"""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._items = {}  # clave -> (orden de inserción, elemento, rect)
+        self._cells = {}  # (columna, fila) -> set de claves
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def _cells_for(self, rect):
+        size = self.cell_size
+        left = rect.left // size
+        top = rect.top // size
+        right = max(rect.left, rect.right - 1) // size
+        bottom = max(rect.top, rect.bottom - 1) // size
+        for column in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                yield (column, row)
+
+    def add(self, key, item, rect):
+        """Agrega (o reemplaza) un elemento con su rectángulo actual"""
+        if key in self._items:
+            self.remove(key)
+        rect = pygame.Rect(rect)
+        self._items[key] = (self._next_order, item, rect)
+        self._next_order += 1
+        for cell in self._cells_for(rect):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def update(self, key, rect):
+        """Mueve un elemento; solo toca las celdas que cambiaron"""
+        order, item, old_rect = self._items[key]
+        rect = pygame.Rect(rect)
+        if rect == old_rect:
+            return
+        old_cells = set(self._cells_for(old_rect))
+        new_cells = set(self._cells_for(rect))
+        for cell in old_cells - new_cells:
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+        for cell in new_cells - old_cells:
+            self._cells.setdefault(cell, set()).add(key)
+        self._items[key] = (order, item, rect)
+
+    def remove(self, key):
+        entry = self._items.pop(key, None)
+        if entry is None:
+            return
+        for cell in self._cells_for(entry[2]):
+            keys = self._cells.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._cells[cell]
+
+    def clear(self):
+        self._items.clear()
+        self._cells.clear()
+
+    def get(self, key, default=None):
+        """Elemento por clave en O(1)"""
+        entry = self._items.get(key)
+        return entry[1] if entry is not None else default
+
+    def items_at(self, point):
+        """Elementos cuyo rectángulo contiene `point`, en orden de inserción"""
+        x, y = point
+        keys = self._cells.get((x // self.cell_size, y // self.cell_size))
+        if not keys:
+            return []
+        hits = []
+        for key in keys:
+            order, item, rect = self._items[key]
+            if rect.collidepoint(x, y):
+                hits.append((order, item))
+        hits.sort(key=lambda hit: hit[0])
+        return [item for _, item in hits]
+
+    def item_at(self, point):
+        """Primer elemento (en orden de inserción) que contiene `point`, o None"""
+        hits = self.items_at(point)
+        return hits[0] if hits else None
+
+    def items_overlapping(self, rect):
+        """Elementos cuyo rectángulo se solapa con `rect`, en orden de inserción"""
+        rect = pygame.Rect(rect)
+        seen = set()
+        hits = []
+        for cell in self._cells_for(rect):
+            for key in self._cells.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                order, item, item_rect = self._items[key]
+                if item_rect.colliderect(rect):
+                    hits.append((order, item))
+        hits.sort(key=lambda hit: hit[0])
+        return [item for _, item in hits]
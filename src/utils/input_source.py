@@ -0,0 +1,77 @@
+"""
+Fuente de entrada de las pantallas.
+Por defecto los eventos y la posición del mouse vienen de pygame; en modo
+headless se reemplaza por una entrada guionizada (utils.headless) y el
+reloj deja de limitar los FPS para poder medir el rendimiento real.
+"""
+
+import time
+
+import pygame
+
+from utils.timer_wheel import TIMERS
+
+
+class LiveInput:
+    """Entrada interactiva normal: ventana, mouse y teclado reales"""
+
+    uncapped = False
+
+    def get_events(self):
+        return pygame.event.get()
+
+    def wait_event(self, timeout_ms):
+        """Bloquea hasta el siguiente evento (NOEVENT si vence el timeout)"""
+        return pygame.event.wait(timeout_ms)
+
+    def get_mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+
+_source = LiveInput()
+frames = 0  # Frames terminados (llamadas a tick) desde el inicio
+first_frame_at = None  # perf_counter() al terminar el primer frame (tiempo de arranque)
+
+
+def set_input_source(source):
+    """Reemplaza la fuente de entrada para todo el proceso"""
+    global _source
+    _source = source
+
+
+def get_input_source():
+    return _source
+
+
+def get_events():
+    """Equivalente a pygame.event.get() respetando la fuente activa"""
+    return _source.get_events()
+
+
+def wait_event(timeout_ms):
+    return _source.wait_event(timeout_ms)
+
+
+def is_uncapped():
+    """True si el bucle no debe bloquear ni limitar FPS (modo headless)"""
+    return _source.uncapped
+
+
+def get_mouse_pos():
+    """Equivalente a pygame.mouse.get_pos() respetando la fuente activa"""
+    return _source.get_mouse_pos()
+
+
+def tick(clock, fps):
+    """Cierra un frame: limita a `fps` salvo que la fuente pida reloj libre.
+
+    También avanza los temporizadores compartidos (utils.timer_wheel) con el
+    tiempo del frame; los vencidos se ejecutan aquí.
+    """
+    global frames, first_frame_at
+    frames += 1
+    if first_frame_at is None:
+        first_frame_at = time.perf_counter()
+    elapsed_ms = clock.tick(0 if _source.uncapped else fps)
+    TIMERS.advance(elapsed_ms)
+    return elapsed_ms
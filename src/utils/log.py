@@ -0,0 +1,66 @@
+"""
+Registro de mensajes del simulador.
+Cada módulo pide su logger con get_logger(__name__). Los registros se
+encolan (QueueHandler) y un hilo en segundo plano (QueueListener) es el
+único que escribe en la consola o el archivo: una consola lenta o una
+tubería hacia el colector nunca frenan un frame.
+El nivel por defecto (WARNING) no emite nada desde los bucles de frames;
+--log-level DEBUG muestra el detalle de selecciones y colocaciones.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+ROOT_LOGGER_NAME = "simulador"
+DEFAULT_LEVEL = "WARNING"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+_listener = None
+_atexit_registered = False
+
+
+def get_logger(name):
+    """Logger de un módulo dentro de la jerarquía del simulador"""
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def configure_logging(level=DEFAULT_LEVEL, log_file=None, stream=None):
+    """Instala la cola y arranca el hilo escritor (reemplaza una configuración previa)"""
+    global _listener, _atexit_registered
+    stop_logging()
+    if not _atexit_registered:
+        atexit.register(stop_logging)  # No perder lo encolado si se sale por una excepción
+        _atexit_registered = True
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler(stream if stream is not None else sys.stderr)]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    root.propagate = False  # Los registros del simulador no pasan por el logger raíz
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """Vacía la cola y detiene el hilo escritor (al salir)"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
@@ -0,0 +1,193 @@
+"""
+Perfilador de frames por fase de dibujo.
+Cada pantalla marca el final de sus fases (fondo, slots, tarjetas, botones,
+alerta, eventos, flip...) con lap(); al cerrar el frame los tiempos se
+guardan en una ventana móvil por pantalla. F3 muestra un HUD con los
+percentiles y dump() guarda el mismo resumen en JSON.
+Con el perfilador apagado cada marca cuesta solo una comparación.
+"""
+
+import json
+import time
+from collections import deque
+
+import pygame
+
+from utils.fonts import get_font
+
+HUD_TOGGLE_KEY = pygame.K_F3
+HUD_REFRESH_SECONDS = 0.25  # El texto del HUD se regenera a lo sumo 4 veces por segundo
+HUD_BG_COLOR = (15, 23, 42, 215)
+HUD_TEXT_COLOR = (226, 232, 240)
+HUD_WARN_COLOR = (248, 113, 113)  # Fases cuyo p95 excede el presupuesto de 60 FPS
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Tiempos por fase y por pantalla con ventana móvil de frames"""
+
+    def __init__(self, window=300):
+        self.window = window
+        self.enabled = False
+        self.hud_visible = False
+        self.hud_rect = pygame.Rect(0, 0, 0, 0)
+        self._screen_name = None
+        self._samples = {}  # pantalla -> {fase: deque de ms}
+        self._totals = {}   # pantalla -> {fase: [frames, ms acumulados]}
+        self._frame = {}
+        self._lap_start = None
+        self._frame_start = None
+        self._hud_surface = None
+        self._hud_built_at = 0.0
+
+    # Control
+    def enable(self):
+        self.enabled = True
+
+    def set_screen(self, name):
+        """Indica qué pantalla produce los frames siguientes"""
+        self._screen_name = name
+        self._frame = {}
+        self._lap_start = None
+        self._frame_start = None
+        self._hud_surface = None
+
+    def handle_event(self, event):
+        """Alterna el HUD con F3; devuelve True si cambió (la pantalla debe repintarse completa)"""
+        if event.type == pygame.KEYDOWN and event.key == HUD_TOGGLE_KEY:
+            self.hud_visible = not self.hud_visible
+            if self.hud_visible:
+                self.enabled = True
+            self._hud_surface = None
+            return True
+        return False
+
+    # Medición
+    def mark(self):
+        """Reinicia el cronómetro de fases (inicio del frame)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._lap_start = now
+        if self._frame_start is None:
+            self._frame_start = now
+
+    def lap(self, phase):
+        """Suma a `phase` el tiempo transcurrido desde la marca o fase anterior"""
+        if not self.enabled or self._lap_start is None:
+            return
+        now = time.perf_counter()
+        self._frame[phase] = self._frame.get(phase, 0.0) + (now - self._lap_start) * 1000.0
+        self._lap_start = now
+
+    def end_frame(self):
+        """Cierra el frame: el resto hasta aquí cuenta como espera del reloj"""
+        if not self.enabled or self._frame_start is None:
+            return
+        self.lap("wait")
+        now = time.perf_counter()
+        self._frame["frame"] = (now - self._frame_start) * 1000.0
+        screen_samples = self._samples.setdefault(self._screen_name, {})
+        screen_totals = self._totals.setdefault(self._screen_name, {})
+        for phase, ms in self._frame.items():
+            samples = screen_samples.get(phase)
+            if samples is None:
+                samples = screen_samples[phase] = deque(maxlen=self.window)
+            samples.append(ms)
+            total = screen_totals.setdefault(phase, [0, 0.0])
+            total[0] += 1
+            total[1] += ms
+        self._frame = {}
+        self._frame_start = now
+        self._lap_start = now
+
+    # Resultados
+    def summary(self, screen_name=None):
+        """{pantalla: {fase: estadísticas en ms}}; percentiles sobre la ventana móvil"""
+        names = [screen_name] if screen_name is not None else list(self._samples)
+        result = {}
+        for name in names:
+            phases = {}
+            for phase, samples in self._samples.get(name, {}).items():
+                ordered = sorted(samples)
+                frames, total_ms = self._totals[name][phase]
+                phases[phase] = {
+                    "frames": frames,
+                    "mean": round(total_ms / frames, 3),
+                    "p50": round(_percentile(ordered, 0.50), 3),
+                    "p95": round(_percentile(ordered, 0.95), 3),
+                    "p99": round(_percentile(ordered, 0.99), 3),
+                    "max": round(ordered[-1], 3),
+                }
+            result[name] = phases
+        return result
+
+    def dump(self, path):
+        """Guarda el resumen de todas las pantallas en JSON"""
+        data = {"window_frames": self.window, "frame_budget_ms": round(FRAME_BUDGET_MS, 3),
+                "screens": self.summary()}
+        with open(path, "w", encoding="utf-8") as dump_file:
+            json.dump(data, dump_file, indent=2)
+
+    # HUD
+    def refresh_hud(self, surface):
+        """Regenera el HUD si toca y lo ubica en la esquina inferior izquierda de `surface`.
+
+        Devuelve el instante de la última regeneración (sirve como estado para
+        el modo de rectángulos sucios).
+        """
+        now = time.perf_counter()
+        if self._hud_surface is None or now - self._hud_built_at >= HUD_REFRESH_SECONDS:
+            self._hud_surface = self._build_hud()
+            self._hud_built_at = now
+            self.hud_rect.size = self._hud_surface.get_size()
+            self.hud_rect.bottomleft = (10, surface.get_height() - 10)
+        return self._hud_built_at
+
+    def draw_hud(self, surface):
+        """Dibuja el HUD si está visible"""
+        if not self.hud_visible:
+            return
+        self.refresh_hud(surface)
+        surface.blit(self._hud_surface, self.hud_rect)
+
+    def _build_hud(self):
+        font = get_font(18)
+        phases = self.summary(self._screen_name).get(self._screen_name, {})
+        rows = [(("fase", "p50", "p95", "p99"), HUD_TEXT_COLOR)]
+        ordered = sorted(phases.items(), key=lambda item: (item[0] == "frame", -item[1]["p95"]))
+        for phase, stats in ordered:
+            color = HUD_WARN_COLOR if stats["p95"] > FRAME_BUDGET_MS else HUD_TEXT_COLOR
+            rows.append(((phase, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}"), color))
+
+        # Texto dinámico: se renderiza directo para no llenar la caché de textos
+        title = font.render(f"{self._screen_name or '-'} (ms, F3 oculta)", True, HUD_TEXT_COLOR)
+        cells = [[font.render(text, True, color) for text in row] for row, color in rows]
+        col_widths = [max(row[i].get_width() for row in cells) for i in range(4)]
+        line_height = font.get_linesize()
+        width = max(title.get_width(), sum(col_widths) + 12 * 3) + 16
+        height = line_height * (len(cells) + 1) + 12
+        hud = pygame.Surface((width, height), pygame.SRCALPHA)
+        hud.fill(HUD_BG_COLOR)
+        hud.blit(title, (8, 6))
+        y = 6 + line_height
+        for row in cells:
+            x = 8
+            for i, cell in enumerate(row):
+                # Nombre alineado a la izquierda, números a la derecha
+                cell_x = x if i == 0 else x + col_widths[i] - cell.get_width()
+                hud.blit(cell, (cell_x, y))
+                x += col_widths[i] + 12
+            y += line_height
+        return hud
+
+
+# Instancia compartida por todo el proceso
+PROFILER = FrameProfiler()
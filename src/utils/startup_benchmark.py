@@ -0,0 +1,79 @@
+"""
+Benchmark de arranque en frío.
+Lanza el simulador varias veces, cada una en un proceso nuevo (paga otra vez
+el arranque del intérprete y las importaciones), dibuja el primer frame de
+la pantalla de inicio y sale. Reporta mínimo, mediana y máximo de cada marca
+de main.py --startup-report, más el tiempo total desde el lanzamiento.
+
+Desde src/:
+    python -m utils.startup_benchmark --runs 10
+    python -m utils.startup_benchmark --window     (ventana real en vez de video "dummy")
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(SRC_DIR, "main.py")
+STARTUP_SCRIPT = os.path.join(SRC_DIR, "data", "scripts", "startup.json")
+
+METRICS = ("launch_to_first_frame_ms", "imports_ms", "pygame_init_ms", "window_ms", "first_frame_ms")
+
+
+def run_once(window=False):
+    """Un arranque completo; devuelve las marcas de tiempo en ms"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_path = os.path.join(temp_dir, "startup.json")
+        command = [sys.executable, MAIN_PATH, "--startup-report", report_path]
+        if not window:
+            command[2:2] = ["--headless", STARTUP_SCRIPT]
+        launched_at = time.time()
+        subprocess.run(command, cwd=SRC_DIR, stdout=subprocess.DEVNULL, check=True)
+        with open(report_path, encoding="utf-8") as report_file:
+            data = json.load(report_file)
+    data["launch_to_first_frame_ms"] = round((data["first_frame_wall_time"] - launched_at) * 1000.0, 3)
+    return data
+
+
+def summarize(runs):
+    summary = {}
+    for metric in METRICS:
+        values = sorted(run[metric] for run in runs if run.get(metric) is not None)
+        if values:
+            summary[metric] = {"min": values[0], "median": round(statistics.median(values), 3),
+                               "max": values[-1]}
+    return summary
+
+
+def format_summary(summary, runs):
+    lines = [f"arranques: {runs}",
+             f"{'marca':<26}{'min':>10}{'mediana':>10}{'max':>10}"]
+    for metric, stats in summary.items():
+        lines.append(f"{metric:<26}{stats['min']:>10.1f}{stats['median']:>10.1f}{stats['max']:>10.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide el arranque en frío hasta el primer frame")
+    parser.add_argument("--runs", type=int, default=5, help="cantidad de arranques")
+    parser.add_argument("--window", action="store_true", help="usa una ventana real (por defecto video dummy)")
+    parser.add_argument("--output", metavar="ARCHIVO", help="guarda cada arranque y el resumen en JSON")
+    args = parser.parse_args(argv)
+
+    runs = [run_once(args.window) for _ in range(max(1, args.runs))]
+    summary = summarize(runs)
+    print(format_summary(summary, len(runs)))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump({"runs": runs, "summary": summary}, output_file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Pool de superficies translúcidas precocinadas.
+Overlays de alerta, rellenos de slots y sombras se crean una sola vez por
+(tamaño, color, forma) y se reutilizan en cada frame, en lugar de reservar
+superficies SRCALPHA nuevas (una de 970x810 ocupa ~3 MB) en cada dibujo.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class SurfacePool:
+    """Caché LRU de superficies SRCALPHA indexada por forma, tamaño y color"""
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, key, build):
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = build()
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # Mismo formato que la pantalla: blit más rápido
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def filled(self, size, color):
+        """Superficie rellena de un color RGBA (overlays, slots).
+
+        La superficie devuelta es compartida: no se debe modificar.
+        """
+        size = (int(size[0]), int(size[1]))
+        color = tuple(color)
+
+        def build():
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            return surface
+
+        return self._get(("filled", size, color), build)
+
+    def rounded_rect(self, size, color, border_radius=0):
+        """Rectángulo redondeado translúcido sobre fondo transparente (sombras)"""
+        size = (int(size[0]), int(size[1]))
+        color = tuple(color)
+
+        def build():
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, color, (0, 0, size[0], size[1]), border_radius=border_radius)
+            return surface
+
+        return self._get(("rounded_rect", size, color, border_radius), build)
+
+    def stats(self):
+        """Resumen de uso del pool"""
+        return {"entries": len(self._surfaces), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+def surface_bytes(*surfaces):
+    """Bytes de píxeles que ocupan las superficies (las None no cuentan)"""
+    return sum(surface.get_pitch() * surface.get_height() for surface in surfaces if surface is not None)
+
+
+# Instancia compartida por todo el proceso
+SURFACE_POOL = SurfacePool()
+
+
+def get_filled_surface(size, color):
+    """Atajo para obtener una superficie rellena del pool compartido"""
+    return SURFACE_POOL.filled(size, color)
+
+
+def get_rounded_rect_surface(size, color, border_radius=0):
+    """Atajo para obtener un rectángulo redondeado del pool compartido"""
+    return SURFACE_POOL.rounded_rect(size, color, border_radius)
@@ -0,0 +1,60 @@
+"""
+Caché de superficies de texto renderizado.
+Las etiquetas estáticas ("Atrás", "Continuar", nombres de slots...) se
+rasterizan una sola vez; las entradas menos usadas se descartan (LRU)
+para que el texto dinámico no haga crecer la memoria sin límite.
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """Caché LRU indexada por (fuente, texto, color, antialias, fondo)"""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Equivalente a font.render(...) pero reutilizando la superficie.
+
+        La superficie devuelta es compartida: no se debe modificar.
+        """
+        key = (font, text, tuple(color), bool(antialias),
+               tuple(background) if background is not None else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        """Resumen de uso de la caché"""
+        return {"entries": len(self._surfaces), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+# Instancia compartida por todo el proceso
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Atajo para renderizar texto a través de la caché compartida"""
+    return TEXT_CACHE.render(font, text, antialias, color, background)
@@ -0,0 +1,173 @@
+"""
+Temporizadores de las pantallas sobre una rueda jerárquica (timer wheel).
+Reemplaza a pygame.time.set_timer con ids de USEREVENT: cada pantalla pide
+call_later / call_every y recibe un TimerHandle para cancelarlo.
+input_source.tick() avanza la rueda con el tiempo del frame, así que los
+callbacks corren en el hilo principal, al cierre del frame, y usan el mismo
+reloj que el resto de la interfaz.
+
+La rueda tiene LEVELS niveles de SLOTS casillas; el nivel 0 avanza de a
+TICK_MS y cada nivel siguiente cubre SLOTS veces más tiempo. Insertar y
+cancelar son O(1) (cancelar solo marca el handle) y un temporizador baja de
+nivel a lo sumo LEVELS - 1 veces antes de vencer. Sin temporizadores
+pendientes, advance() solo suma el tiempo transcurrido.
+"""
+
+TICK_MS = 10
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS            # 64 casillas por nivel
+SLOT_MASK = SLOTS - 1
+LEVELS = 4                        # 10 ms * 64^4 ≈ 46 horas antes de tener que recircular
+
+
+class TimerHandle:
+    """Token de un temporizador; cancel() lo anula aunque ya esté en la rueda"""
+
+    __slots__ = ("callback", "args", "expires", "interval", "active", "_wheel")
+
+    def __init__(self, wheel, callback, args, expires, interval):
+        self._wheel = wheel
+        self.callback = callback
+        self.args = args
+        self.expires = expires      # Tick absoluto de vencimiento
+        self.interval = interval    # Ticks entre repeticiones (None = una sola vez)
+        self.active = True
+
+    def cancel(self):
+        if self.active:
+            self.active = False
+            self._wheel._pending -= 1
+
+    def __repr__(self):
+        state = "activo" if self.active else "cancelado"
+        return f"TimerHandle({getattr(self.callback, '__name__', self.callback)!r}, {state})"
+
+
+class TimerWheel:
+    """Rueda jerárquica avanzada por el reloj de frames"""
+
+    def __init__(self, tick_ms=TICK_MS):
+        self.tick_ms = tick_ms
+        self._levels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self._tick = 0              # Último tick procesado
+        self._elapsed_ms = 0.0      # Tiempo acumulado que todavía no completa un tick
+        self._pending = 0           # Temporizadores activos
+        self._has_entries = False   # La rueda puede tener handles (activos o cancelados) guardados
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def call_later(self, delay_ms, callback, *args):
+        """Ejecuta callback(*args) una vez, pasados delay_ms"""
+        return self._schedule(delay_ms, None, callback, args)
+
+    def call_every(self, interval_ms, callback, *args):
+        """Ejecuta callback(*args) cada interval_ms hasta que se cancele"""
+        return self._schedule(interval_ms, self._ticks(interval_ms), callback, args)
+
+    def cancel_all(self):
+        for level in self._levels:
+            for slot in level:
+                for handle in slot:
+                    handle.active = False
+        self._pending = 0
+        self._clear()
+
+    def _clear(self):
+        for level in self._levels:
+            for slot in level:
+                slot.clear()
+        self._has_entries = False
+
+    def advance(self, elapsed_ms):
+        """Avanza el reloj y ejecuta los temporizadores vencidos (lo llama input_source.tick)"""
+        self._elapsed_ms += elapsed_ms
+        ticks = int(self._elapsed_ms // self.tick_ms)
+        if ticks <= 0:
+            return
+        self._elapsed_ms -= ticks * self.tick_ms
+        if not self._pending:
+            if self._has_entries:
+                self._clear()  # Descarta los cancelados que quedaron en la rueda
+            self._tick += ticks
+            return
+        for step in range(1, ticks + 1):
+            self._step()
+            if not self._pending:
+                # Nada más pendiente: saltar el resto de los ticks sin recorrer la rueda
+                self._tick += ticks - step
+                break
+
+    def _ticks(self, ms):
+        return max(1, -(-int(ms) // self.tick_ms))  # Redondeo hacia arriba, al menos un tick
+
+    def _schedule(self, delay_ms, interval, callback, args):
+        handle = TimerHandle(self, callback, args, self._tick + self._ticks(delay_ms), interval)
+        self._pending += 1
+        self._insert(handle)
+        return handle
+
+    def _insert(self, handle):
+        # Al bajar de nivel puede vencer en el tick actual: _step procesa la casilla después de cascada
+        target = max(handle.expires, self._tick)
+        delta = target - self._tick
+        self._has_entries = True
+        for level in range(LEVELS):
+            if delta < 1 << (SLOT_BITS * (level + 1)):
+                break
+        else:
+            # Más lejos que toda la rueda: se estaciona en la última casilla y se recoloca al bajar
+            level = LEVELS - 1
+            target = self._tick + (1 << (SLOT_BITS * LEVELS)) - 1
+        self._levels[level][(target >> (SLOT_BITS * level)) & SLOT_MASK].append(handle)
+
+    def _cascade(self, level, index):
+        """Baja los temporizadores de una casilla de nivel superior a los niveles inferiores"""
+        slot = self._levels[level][index]
+        if slot:
+            self._levels[level][index] = []
+            for handle in slot:
+                if handle.active:
+                    self._insert(handle)
+        return index
+
+    def _step(self):
+        self._tick += 1
+        tick = self._tick
+        index = tick & SLOT_MASK
+        if index == 0:
+            for level in range(1, LEVELS):
+                if self._cascade(level, (tick >> (SLOT_BITS * level)) & SLOT_MASK) != 0:
+                    break
+
+        slot = self._levels[0][index]
+        if not slot:
+            return
+        self._levels[0][index] = []
+        for handle in slot:
+            if not handle.active:
+                continue
+            if handle.expires > tick:  # Vuelta de rueda todavía no cumplida
+                self._insert(handle)
+                continue
+            if handle.interval is None:
+                handle.active = False
+                self._pending -= 1
+            else:
+                handle.expires = tick + handle.interval
+                self._insert(handle)
+            handle.callback(*handle.args)
+
+
+TIMERS = TimerWheel()
+
+
+def call_later(delay_ms, callback, *args):
+    """Atajo sobre la rueda compartida"""
+    return TIMERS.call_later(delay_ms, callback, *args)
+
+
+def call_every(interval_ms, callback, *args):
+    """Atajo sobre la rueda compartida"""
+    return TIMERS.call_every(interval_ms, callback, *args)
@@ -0,0 +1,12 @@
+"""
+Los módulos del simulador se importan desde src/ (from model.x / utils.x),
+igual que al correr `python main.py` desde ahí.
+"""
+
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
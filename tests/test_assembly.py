@@ -0,0 +1,87 @@
+from model.assembly import PLACED, REMOVED, RESET, SlotBoard
+
+
+def make_board():
+    return SlotBoard({"slot_ram": "RAM_1", "slot_cpu": "CPU_1", "slot_gpu": "GPU_1"}, ["RAM_1", "CPU_1"])
+
+
+def test_initial_counters():
+    board = make_board()
+    assert (board.total, board.placed, board.remaining) == (2, 0, 2)
+    assert board.progress_fraction == 0.0
+    assert not board.is_complete
+    assert board.remaining_components() == ["RAM_1", "CPU_1"]
+
+
+def test_place_and_remove_update_counters():
+    board = make_board()
+    assert board.place("RAM_1", "slot_ram")
+    assert (board.placed, board.remaining) == (1, 1)
+    assert board.progress_fraction == 0.5
+    assert board.remaining_components() == ["CPU_1"]
+
+    assert board.place("CPU_1", "slot_cpu")
+    assert board.is_complete
+
+    assert board.remove("RAM_1") == "slot_ram"
+    assert (board.placed, board.remaining) == (1, 1)
+    assert not board.is_occupied("slot_ram")
+    assert board.remaining_components() == ["RAM_1"]
+
+
+def test_rejected_placements_do_not_count():
+    board = make_board()
+    version = board.version
+    assert not board.place("RAM_1", "slot_cpu")      # El slot acepta otro componente
+    assert not board.place("RAM_1", "slot_missing")  # Slot inexistente
+    board.place("RAM_1", "slot_ram")
+    assert not board.place("RAM_1", "slot_ram")      # Ya colocado
+    assert board.placed == 1
+    assert board.version == version + 1
+    assert board.remove("CPU_1") is None             # No estaba colocado
+    assert board.placed == 1
+
+
+def test_component_outside_the_list_does_not_count():
+    board = make_board()
+    assert board.place("GPU_1", "slot_gpu")
+    assert board.placed == 0
+    board.remove("GPU_1")
+    assert board.placed == 0
+
+
+def test_empty_board_is_complete():
+    board = SlotBoard()
+    assert board.is_complete
+    assert board.progress_fraction == 1.0
+
+
+def test_clear_and_set_components_reset_counters():
+    board = make_board()
+    board.place("RAM_1", "slot_ram")
+    board.clear()
+    assert board.placed == 0 and not board.is_occupied("slot_ram")
+
+    board.place("RAM_1", "slot_ram")
+    board.set_components(["GPU_1"])
+    assert (board.total, board.placed) == (1, 0)
+    assert board.remaining_components() == ["GPU_1"]
+
+
+def test_subscribers_receive_changes():
+    board = make_board()
+    changes = []
+    board.subscribe(changes.append)
+    board.place("RAM_1", "slot_ram")
+    board.place("RAM_1", "slot_cpu")  # Rechazado: sin aviso
+    board.remove("RAM_1")
+    board.clear()
+    assert [(c.kind, c.component_id, c.slot_id, c.placed, c.total) for c in changes] == [
+        (PLACED, "RAM_1", "slot_ram", 1, 2),
+        (REMOVED, "RAM_1", "slot_ram", 0, 2),
+        (RESET, None, None, 0, 2),
+    ]
+
+    board.unsubscribe(changes.append)
+    board.place("CPU_1", "slot_cpu")
+    assert len(changes) == 3
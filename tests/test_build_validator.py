@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from utils import build_validator
+from utils.build_validator import ERROR, INVALID, NO_BOOT, OK, validate_chunk, validate_file
+
+LAPTOP_OK = ["RAM DDR4 8GB", "Ryzen 7 5700X", "Kingston SSD 1TB", "M.2 NVMe SSD", "Modulo Wi-Fi/BT", "Mouse Razen"]
+
+
+def run_lines(lines, first_line=1):
+    output, stats = validate_chunk(first_line, [line + "\n" for line in lines], "jsonl")
+    return [json.loads(record) for record in output], stats
+
+
+def test_ok_and_no_boot():
+    records, stats = run_lines([
+        json.dumps({"id": "ana", "computer_type": "laptop", "components": LAPTOP_OK}),
+        json.dumps({"id": "beto", "computer_type": "laptop", "components": ["RAM DDR4 8GB", "UPS"]}),
+    ])
+    assert [(r["id"], r["verdict"]) for r in records] == [("ana", OK), ("beto", NO_BOOT)]
+    assert records[1]["missing"] == ["Ryzen 7 5700X", "Kingston SSD 1TB", "M.2 NVMe SSD", "Modulo Wi-Fi/BT"]
+    assert stats["computer_types"]["laptop"] == 2
+
+
+def test_unknown_component_is_invalid():
+    records, _ = run_lines([json.dumps({"computer_type": "laptop", "components": LAPTOP_OK + ["Zeta", "Alfa"]})])
+    assert records[0]["verdict"] == INVALID
+    assert records[0]["code"] == "unknown_component"
+    assert records[0]["unknown"] == ["Alfa", "Zeta"]
+
+
+@pytest.mark.parametrize("line, code", [
+    ("{no es json", "unreadable_line"),
+    ("[1, 2, 3]", "unreadable_line"),
+    ('"solo un texto"', "unreadable_line"),
+    (json.dumps({"computer_type": "laptop", "components": "RAM DDR4 8GB"}), "unreadable_line"),
+    (json.dumps({"computer_type": "laptop", "components": ["RAM DDR4 8GB", 7]}), "unreadable_line"),
+    (json.dumps({"computer_type": ["laptop"], "components": LAPTOP_OK}), "unreadable_line"),
+    (json.dumps({"computer_type": {"tipo": "laptop"}, "components": LAPTOP_OK}), "unreadable_line"),
+    (json.dumps({"computer_type": 5, "components": LAPTOP_OK}), "unreadable_line"),
+    (json.dumps({"components": LAPTOP_OK}), "unreadable_line"),
+    (json.dumps({"computer_type": "tablet", "components": LAPTOP_OK}), "unknown_computer_type"),
+])
+def test_malformed_line_is_an_error_not_a_crash(line, code):
+    records, stats = run_lines([line])
+    assert records[0]["verdict"] == ERROR
+    assert records[0]["code"] == code
+    assert stats["verdicts"][ERROR] == 1
+    assert not stats["computer_types"]  # Los errores no cuentan por tipo
+
+
+def test_malformed_line_does_not_stop_the_chunk():
+    records, stats = run_lines([
+        json.dumps({"computer_type": ["laptop"], "components": LAPTOP_OK}),
+        "",
+        json.dumps({"computer_type": "laptop", "components": LAPTOP_OK}),
+    ], first_line=10)
+    # Sin id se usa el número de línea; las líneas vacías se saltan
+    assert [(r["id"], r["verdict"]) for r in records] == [(10, ERROR), (12, OK)]
+    assert stats["verdicts"] == {ERROR: 1, OK: 1}
+
+
+def test_csv_rows(tmp_path):
+    path = tmp_path / "entregas.csv"
+    path.write_text("id,computer_type,components\n"
+                    "ana,laptop," + ";".join(LAPTOP_OK) + "\n"
+                    "\n"
+                    "beto,tablet,UPS\n", encoding="utf-8")
+    output = tmp_path / "veredictos.jsonl"
+    with open(output, "w", encoding="utf-8") as output_file:
+        validate_file(str(path), output_file, workers=1)
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [(r["id"], r["verdict"]) for r in records] == [("ana", OK), ("beto", ERROR)]
+
+
+def test_csv_quoted_newline_across_chunk_boundary(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_validator, "CHUNK_SIZE", 2)
+    multi_line = "\n".join(name + ";" for name in LAPTOP_OK)  # 6 líneas físicas
+    path = tmp_path / "entregas.csv"
+    path.write_text("id,computer_type,components\n"
+                    "ana,laptop,RAM DDR4 8GB;UPS\n"
+                    f'beto,laptop,"{multi_line}"\n'
+                    ",laptop," + ";".join(LAPTOP_OK) + "\n"
+                    ",desktop,UPS\n", encoding="utf-8")
+    output = tmp_path / "veredictos.jsonl"
+    with open(output, "w", encoding="utf-8") as output_file:
+        summary = validate_file(str(path), output_file, workers=1)
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    # beto empieza en la línea 3 y ocupa hasta la 8: los registros sin id siguen en la 9 y la 10
+    assert [(r["id"], r["verdict"]) for r in records] == [("ana", NO_BOOT), ("beto", OK), (9, OK), (10, INVALID)]
+    assert summary["verdicts"].get(ERROR, 0) == 0
+
+
+def test_verdict_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(build_validator, "VERDICT_CACHE_SIZE", 3)
+    monkeypatch.setattr(build_validator, "_verdict_cache", {})
+    for name in ["RAM DDR4 8GB", "Ryzen 7 5700X", "Kingston SSD 1TB", "M.2 NVMe SSD", "Modulo Wi-Fi/BT"]:
+        build_validator.evaluate_build("laptop", [name, "UPS"])
+    assert len(build_validator._verdict_cache) == 3
+
+
+def test_validate_file_summary(tmp_path):
+    path = tmp_path / "entregas.jsonl"
+    path.write_text("\n".join([
+        json.dumps({"id": "ana", "computer_type": "laptop", "components": LAPTOP_OK}),
+        json.dumps({"id": "beto", "computer_type": ["laptop"], "components": LAPTOP_OK}),
+        "{roto",
+    ]) + "\n", encoding="utf-8")
+    output = tmp_path / "veredictos.jsonl"
+    with open(output, "w", encoding="utf-8") as output_file:
+        summary = validate_file(str(path), output_file, workers=1)
+    assert summary["builds"] == 3
+    assert summary["passed"] == 1
+    assert summary["verdicts"] == {OK: 1, ERROR: 2}
+    assert len(output.read_text(encoding="utf-8").splitlines()) == 3
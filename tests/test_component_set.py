@@ -0,0 +1,86 @@
+import pytest
+
+from model.catalog import get_catalog
+from model.component_set import ComponentSet
+
+
+def test_iterates_in_catalog_order():
+    selection = ComponentSet(["UPS", "RAM DDR4 8GB", "PSU 600W"])
+    assert selection.names() == ["RAM DDR4 8GB", "PSU 600W", "UPS"]
+    assert len(selection) == 3
+
+
+def test_duplicates_collapse():
+    assert len(ComponentSet(["UPS", "UPS"])) == 1
+
+
+def test_membership():
+    selection = ComponentSet(["RAM DDR4 8GB"])
+    assert "RAM DDR4 8GB" in selection
+    assert "UPS" not in selection
+
+
+def test_unknown_name_raises():
+    with pytest.raises(ValueError):
+        ComponentSet(["No existe"])
+
+
+def test_empty_set_is_falsy():
+    assert not ComponentSet()
+    assert ComponentSet(["UPS"])
+
+
+def test_round_trip_through_int():
+    selection = ComponentSet(["RAM DDR4 8GB", "HUB USB"])
+    assert ComponentSet.from_bits(int(selection)) == selection
+    assert hash(ComponentSet.from_bits(int(selection))) == hash(selection)
+
+
+def test_copy_from_another_set():
+    selection = ComponentSet(["UPS"])
+    assert ComponentSet(selection) == selection
+
+
+def test_set_operations_accept_sets_and_names():
+    left = ComponentSet(["RAM DDR4 8GB", "UPS"])
+    right = ComponentSet(["UPS", "PSU 600W"])
+    assert (left | right).names() == ["RAM DDR4 8GB", "PSU 600W", "UPS"]
+    assert (left & right).names() == ["UPS"]
+    assert (left - right).names() == ["RAM DDR4 8GB"]
+    assert (left - ["UPS"]).names() == ["RAM DDR4 8GB"]
+
+
+def test_operations_do_not_modify_operands():
+    left = ComponentSet(["RAM DDR4 8GB"])
+    left | ["UPS"]
+    assert left.names() == ["RAM DDR4 8GB"]
+
+
+def test_subset():
+    small = ComponentSet(["UPS"])
+    big = ComponentSet(["UPS", "RAM DDR4 8GB"])
+    assert small.issubset(big)
+    assert small <= ["UPS"]
+    assert not big <= small
+
+
+def test_internal_and_external_split():
+    selection = ComponentSet(["RAM DDR4 8GB", "Mouse Razen", "PSU 600W"])
+    assert selection.internal().names() == ["RAM DDR4 8GB", "PSU 600W"]
+    assert selection.external().names() == ["Mouse Razen"]
+    assert selection.internal() | selection.external() == selection
+
+
+def test_required_for_matches_catalog():
+    catalog = get_catalog()
+    required = ComponentSet.required_for("laptop", catalog)
+    assert required.names() == ["RAM DDR4 8GB", "Ryzen 7 5700X", "Kingston SSD 1TB", "M.2 NVMe SSD", "Modulo Wi-Fi/BT"]
+    assert not required.external()
+    # La tarjeta madre siempre viene en desktop: no figura entre los requeridos para encender
+    desktop = ComponentSet.required_for("desktop", catalog)
+    assert "PSU 600W" in desktop
+    assert "ASUS Prime B550M" not in desktop
+
+
+def test_not_equal_to_plain_list():
+    assert ComponentSet(["UPS"]) != ["UPS"]
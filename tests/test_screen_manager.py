@@ -0,0 +1,101 @@
+from screens.screen_manager import ScreenManager
+
+
+class FakeScreen:
+    """Pantalla mínima: cachea `size` bytes y cuenta los reset()"""
+
+    def __init__(self, screen, size=0):
+        self.size = size
+        self.resets = 0
+
+    def reset(self, size=0):
+        self.resets += 1
+
+    def cached_bytes(self):
+        return self.size
+
+
+class Small(FakeScreen):
+    pass
+
+
+class Medium(FakeScreen):
+    pass
+
+
+class Large(FakeScreen):
+    pass
+
+
+class NoCache:
+    def __init__(self, screen):
+        pass
+
+    def reset(self):
+        pass
+
+
+def test_reuses_warm_instances():
+    manager = ScreenManager(None)
+    first = manager.get(Small, 10)
+    assert manager.get(Small, 10) is first
+    assert first.resets == 1
+    assert manager.stats()["reused"] == 1
+
+
+def test_computer_type_keeps_separate_instances():
+    manager = ScreenManager(None)
+    assert manager.get(Small, computer_type="laptop") is not manager.get(Small, computer_type="desktop")
+
+
+def test_count_limit_evicts_least_recently_used():
+    manager = ScreenManager(None, max_instances=2)
+    small = manager.get(Small)
+    manager.get(Medium)
+    manager.get(Small)
+    manager.get(Large)  # Medium es la menos usada
+    assert manager.get(Small) is small
+    assert manager.stats()["evicted"] == 1
+    assert manager.stats()["warm"] == 2
+
+
+def test_budget_evicts_until_it_fits():
+    manager = ScreenManager(None, max_cached_bytes=100)
+    small = manager.get(Small, 30)
+    manager.get(Medium, 50)
+    large = manager.get(Large, 60)
+    assert manager.cached_bytes() == 140
+
+    # Sale Small (la menos usada), 110 todavía no entra, y luego Medium
+    assert manager.enforce_budget() == 80
+    assert manager.cached_bytes() == 60
+    assert manager.stats()["evicted"] == 2
+    assert manager.get(Large) is large
+    assert manager.get(Small, 30) is not small
+
+
+def test_budget_never_evicts_the_most_recent_screen():
+    manager = ScreenManager(None, max_cached_bytes=100)
+    manager.get(Small, 10)
+    big = manager.get(Large, 500)
+    manager.enforce_budget()
+    assert manager.stats()["warm"] == 1
+    assert manager.get(Large) is big
+
+
+def test_budget_keeps_screens_without_cache():
+    manager = ScreenManager(None, max_cached_bytes=100)
+    plain = manager.get(NoCache)
+    manager.get(Small, 80)
+    manager.get(Large, 80)
+    manager.enforce_budget()
+    assert manager.get(NoCache) is plain
+    assert manager.cached_bytes() == 80
+
+
+def test_no_budget_no_eviction():
+    manager = ScreenManager(None)
+    manager.get(Small, 10 ** 9)
+    manager.get(Large, 10 ** 9)
+    assert manager.enforce_budget() == 0
+    assert manager.stats()["warm"] == 2
@@ -0,0 +1,124 @@
+from utils.timer_wheel import SLOTS, TICK_MS, TimerWheel
+
+
+def advance_by(wheel, total_ms, step_ms=16):
+    """Avanza como el bucle de frames, de a step_ms"""
+    while total_ms > 0:
+        wheel.advance(min(step_ms, total_ms))
+        total_ms -= step_ms
+
+
+def test_one_shot_fires_once_not_early():
+    wheel = TimerWheel()
+    fired = []
+    handle = wheel.call_later(100, fired.append, "listo")
+    assert wheel.pending == 1
+    advance_by(wheel, 90)
+    assert fired == []
+    advance_by(wheel, 20)
+    assert fired == ["listo"]
+    assert not handle.active and wheel.pending == 0
+    advance_by(wheel, 500)
+    assert fired == ["listo"]
+
+
+def test_repeat_until_cancelled():
+    wheel = TimerWheel()
+    fired = []
+    handle = wheel.call_every(50, lambda: fired.append(1))
+    for _ in range(10):
+        wheel.advance(TICK_MS * 5)
+    assert len(fired) == 10
+    handle.cancel()
+    assert wheel.pending == 0
+    advance_by(wheel, 1000)
+    assert len(fired) == 10
+
+
+def test_cancel_before_expiry():
+    wheel = TimerWheel()
+    fired = []
+    handle = wheel.call_later(30, fired.append, 1)
+    handle.cancel()
+    handle.cancel()  # Cancelar dos veces no descuenta dos veces
+    assert wheel.pending == 0 and not handle.active
+    advance_by(wheel, 100)
+    assert fired == []
+
+
+def test_cancel_from_another_callback_in_the_same_tick():
+    wheel = TimerWheel()
+    fired = []
+    later = wheel.call_later(20, fired.append, "segundo")
+    wheel.call_later(20, lambda: later.cancel())
+    # El orden de inserción decide: el primero ya corrió antes de cancelarse
+    advance_by(wheel, 40)
+    assert fired == ["segundo"]
+
+    first = []
+    victim = None
+    wheel.call_later(20, lambda: victim.cancel())
+    victim = wheel.call_later(20, first.append, 1)
+    advance_by(wheel, 40)
+    assert first == [] and wheel.pending == 0
+
+
+def test_cancel_all():
+    wheel = TimerWheel()
+    fired = []
+    handles = [wheel.call_later(delay, fired.append, delay) for delay in (10, 1000, 100000)]
+    wheel.cancel_all()
+    assert wheel.pending == 0
+    assert not any(handle.active for handle in handles)
+    advance_by(wheel, 2000, step_ms=100)
+    assert fired == []
+
+
+def test_far_future_timer_cascades_down_the_levels():
+    wheel = TimerWheel()
+    fired = []
+    # Más allá del alcance del nivel 2: baja por todos los niveles antes de vencer
+    delay_ms = (SLOTS ** 3 + 1234) * TICK_MS
+    wheel.call_later(delay_ms, fired.append, "lejos")
+    wheel.advance(delay_ms - TICK_MS)
+    assert fired == []
+    wheel.advance(TICK_MS)
+    assert fired == ["lejos"]
+
+
+def test_timers_never_fire_early():
+    wheel = TimerWheel()
+    now = [0]
+    fired = []
+    delays = [5, 10, 15, 640, 641, 6400, 40960, 41000]
+    for delay in delays:
+        wheel.call_later(delay, lambda delay=delay: fired.append((delay, now[0])))
+    while wheel.pending:
+        now[0] += 16
+        wheel.advance(16)
+    assert sorted(delay for delay, _ in fired) == delays
+    for delay, at in fired:
+        assert delay <= at <= delay + TICK_MS + 16
+
+
+def test_idle_wheel_skips_time():
+    wheel = TimerWheel()
+    wheel.advance(10 ** 9)
+    fired = []
+    wheel.call_later(20, fired.append, 1)
+    advance_by(wheel, 30)
+    assert fired == [1]
+
+
+def test_skipped_ticks_keep_the_clock():
+    wheel = TimerWheel()
+    fired = []
+    wheel.call_later(20, fired.append, 1)
+    wheel.advance(1000)  # Vence al 2.º tick; los 98 restantes se saltan sin recorrer la rueda
+    assert fired == [1]
+    # El reloj quedó en 1000 ms: uno nuevo de 30 ms no vence a los 20 ms
+    wheel.call_later(30, fired.append, 2)
+    wheel.advance(20)
+    assert fired == [1]
+    wheel.advance(10)
+    assert fired == [1, 2]
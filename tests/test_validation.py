@@ -0,0 +1,59 @@
+from model.catalog import get_catalog
+from model.component_set import ComponentSet
+from model.validation import (EMPTY_SHELF, NO_EXTERNAL, NOT_ENOUGH_INTERNAL,
+                              evaluate_boot, validate_selection)
+
+LAPTOP_REQUIRED = ["RAM DDR4 8GB", "Ryzen 7 5700X", "Kingston SSD 1TB", "M.2 NVMe SSD", "Modulo Wi-Fi/BT"]
+
+
+def test_valid_laptop_selection():
+    check = validate_selection(["RAM DDR4 8GB", "Mouse Razen"], "laptop")
+    assert check.ok
+    assert check.code is None and check.message is None
+
+
+def test_laptop_needs_an_internal_component():
+    check = validate_selection(["Mouse Razen"], "laptop")
+    assert check.code == NOT_ENOUGH_INTERNAL
+    assert not check.ok
+
+
+def test_selection_needs_an_external_component():
+    assert validate_selection(["RAM DDR4 8GB"], "laptop").code == NO_EXTERNAL
+
+
+def test_desktop_mandatory_motherboard_does_not_count():
+    # La tarjeta madre es obligatoria: no cuenta para los 2 internos del desktop
+    check = validate_selection(["ASUS Prime B550M", "RAM DDR4 8GB", "UPS"], "desktop")
+    assert check.code == NOT_ENOUGH_INTERNAL
+    assert "2" in check.message
+    assert validate_selection(["ASUS Prime B550M", "RAM DDR4 8GB", "PSU 600W", "UPS"], "desktop").ok
+
+
+def test_visible_shelf_rule_only_with_current_shelf():
+    names = ["RAM DDR4 8GB"]
+    assert validate_selection(names, "laptop", current_shelf="externos").code == EMPTY_SHELF
+    assert validate_selection(names, "laptop").code == NO_EXTERNAL
+
+
+def test_unknown_names_are_ignored():
+    assert validate_selection(["No existe", "RAM DDR4 8GB", "UPS"], "laptop").ok
+
+
+def test_boot_with_every_required_component():
+    outcome = evaluate_boot(LAPTOP_REQUIRED, "laptop")
+    assert outcome.powers_on
+    assert isinstance(outcome.missing, ComponentSet)
+    assert not outcome.missing
+
+
+def test_boot_reports_missing_in_catalog_order():
+    outcome = evaluate_boot(["Modulo Wi-Fi/BT", "RAM DDR4 8GB"], "laptop")
+    assert not outcome.powers_on
+    assert outcome.missing.names() == ["Ryzen 7 5700X", "Kingston SSD 1TB", "M.2 NVMe SSD"]
+
+
+def test_boot_missing_matches_required_set():
+    catalog = get_catalog()
+    outcome = evaluate_boot([], "desktop", catalog)
+    assert outcome.missing == ComponentSet.required_for("desktop", catalog)